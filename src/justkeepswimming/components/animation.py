@@ -9,28 +9,28 @@ from justkeepswimming.utilities.animation import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationComponent(Component):
     animation: Animation
 
 
-@dataclass
+@dataclass(slots=True)
 class SpritesheetComponent(Component):
     animations: dict[AnimationType, Animation]
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimatorComponent(Component):
     animator: Animator = field(default_factory=Animator)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationStateComponent(Component):
     current_state: AnimationType = AnimationType.IDLE
     current_track: AnimationTrack | None = None
     current_speed: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class VelocityAffectsAnimationSpeedComponent(Component):
     speed_multiplier: float = 100.0
@@ -6,7 +6,7 @@ from pygame import Color
 from justkeepswimming.ecs import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class TintComponent(Component):
     intensity: float = 0.5
     color: Color = field(default_factory=lambda: Color(255, 255, 255))
@@ -17,7 +17,7 @@ class TextAlignment(Enum):
     BOTTOM_RIGHT = Vector2(1, 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextComponent(Component):
     font: Font = field(default_factory=lambda: SysFont(None, 24))
     color: Color = field(default_factory=lambda: Color(0, 0, 0))
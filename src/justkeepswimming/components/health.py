@@ -4,7 +4,7 @@ from justkeepswimming.ecs import Component
 from justkeepswimming.utilities.signal import Signal
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthComponent(Component):
     current_health: float = 100.0
     max_health: float = 100.0
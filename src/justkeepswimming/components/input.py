@@ -5,11 +5,11 @@ from pygame import Vector2
 from justkeepswimming.ecs import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerLinearMovementInputComponent(Component):
     thrust: Vector2 = field(default_factory=lambda: Vector2(0, 0))
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerAngularMovementInputComponent(Component):
     torque: float = 0.0
@@ -5,7 +5,7 @@ from pygame import Vector2
 from justkeepswimming.ecs import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearPhysicsComponent(Component):
     velocity: Vector2 = field(default_factory=lambda: Vector2(0, 0))
     acceleration: Vector2 = field(default_factory=lambda: Vector2(0, 0))
@@ -15,8 +15,16 @@ class LinearPhysicsComponent(Component):
     )
     drag: Vector2 = field(default_factory=lambda: Vector2(0.6, 0.6))
 
+    columnar_fields = (
+        "velocity",
+        "acceleration",
+        "thrust",
+        "max_velocity",
+        "drag",
+    )
+
 
-@dataclass
+@dataclass(slots=True)
 class AngularPhysicsComponent(Component):
     angular_velocity: float = 0.0
     angular_acceleration: float = 0.0
@@ -24,14 +32,24 @@ class AngularPhysicsComponent(Component):
     max_angular_velocity: float = 100.0
     angular_drag: float = 0.6
 
+    columnar_fields = (
+        "angular_velocity",
+        "angular_acceleration",
+        "torque",
+        "max_angular_velocity",
+        "angular_drag",
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class TransformComponent(Component):
     position: Vector2 = field(default_factory=lambda: Vector2(0, 0))
     rotation: float = 0.0
     size: Vector2 = field(default_factory=lambda: Vector2(1, 1))
     anchor: Vector2 = field(default_factory=lambda: Vector2(0.5, 0.5))
 
+    columnar_fields = ("position", "rotation")
+
     @property
     def up(self) -> Vector2:
         return Vector2(0, -1).rotate(self.rotation)
@@ -39,3 +57,25 @@ class TransformComponent(Component):
     @property
     def right(self) -> Vector2:
         return Vector2(1, 0).rotate(self.rotation)
+
+
+@dataclass(slots=True)
+class InterpolatedTransformComponent(Component):
+    """
+    The transform of an entity as of the last two simulation steps, so it
+    can be shown in between them when the simulation runs at a fixed rate,
+    see `TransformInterpolationProcessor`.
+    """
+
+    previous_position: Vector2 = field(default_factory=lambda: Vector2(0, 0))
+    previous_rotation: float = 0.0
+    simulated_position: Vector2 = field(
+        default_factory=lambda: Vector2(0, 0)
+    )
+    simulated_rotation: float = 0.0
+    # What was written to the transform in place of the simulated state.
+    shown_position: Vector2 = field(default_factory=lambda: Vector2(0, 0))
+    shown_rotation: float = 0.0
+    # Whether the states above have been taken from the transform yet, as
+    # the first tick of a scene may come before its first simulation step.
+    seeded: bool = field(default=False, init=False)
@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from justkeepswimming.ecs import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerComponent(Component):
     pass
@@ -2,4 +2,4 @@ from justkeepswimming.ecs import Component
 
 
 class SceneCenterConstraintComponent(Component):
-    pass
+    __slots__ = ()
@@ -2,16 +2,16 @@ from justkeepswimming.ecs import Component
 
 
 class PseudoComponent(Component):
-    pass
+    __slots__ = ()
 
 
 class ScenePseudoComponent(Component):
-    pass
+    __slots__ = ()
 
 
 class WindowPseudoComponent(Component):
-    pass
+    __slots__ = ()
 
 
 class InputPseudoComponent(Component):
-    pass
+    __slots__ = ()
@@ -7,17 +7,17 @@ from justkeepswimming.ecs import Component
 from justkeepswimming.utilities.image import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class MainCameraComponent(Component):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraComponent(Component):
     surface: Surface = field(default_factory=lambda: Surface((0, 0)))
 
 
-@dataclass
+@dataclass(slots=True)
 class RendererComponent(Component):
     surface: Surface = field(
         default_factory=lambda: Surface(Vector2(0, 0), flags=pygame.SRCALPHA)
@@ -27,4 +27,6 @@ class RendererComponent(Component):
 
 
 class SpriteComponent(Component):
+    __slots__ = ("texture",)
+
     texture: Image
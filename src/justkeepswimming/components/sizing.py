@@ -3,21 +3,21 @@ from dataclasses import dataclass
 from justkeepswimming.ecs import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class SurfaceTransformConstraintComponent(Component):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneSizeConstraintComponent(Component):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AspectRatioConstraintComponent(Component):
     aspect_ratio: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenSizeConstraintComponent(Component):
     pass
@@ -4,6 +4,6 @@ from justkeepswimming.ecs import Component
 from justkeepswimming.utilities.image import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class SpriteComponent(Component):
     content: Image | None = None
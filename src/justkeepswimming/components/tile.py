@@ -7,7 +7,7 @@ from justkeepswimming.ecs import Component
 from justkeepswimming.utilities.image import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class TileTextureComponent(Component):
     image: Image
     tile_size: Vector2 = field(default_factory=lambda: Vector2(0, 0))
@@ -18,17 +18,17 @@ class TileTextureComponent(Component):
     cache_scaled_surface: pygame.Surface | None = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoTileScrollComponent(Component):
     speed: Vector2
 
 
-@dataclass
+@dataclass(slots=True)
 class MouseRelativeTileScrollComponent(Component):
     strength: Vector2
     lerp_factor: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class FitTileSizeToTransformComponent(Component):
     pass
@@ -8,7 +8,7 @@ from justkeepswimming.utilities.signal import Signal
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonComponent(Component):
     label_color: Color = field(default_factory=lambda: Color(255, 255, 255))
     background_color: Color = field(default_factory=lambda: Color(0, 0, 0))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Dict, Generic, List, Set, TypeVar
+from typing import Callable, Dict, Generic, List, Set, TypeVar
 
 T = TypeVar("T")
 
@@ -23,11 +23,13 @@ class CyclicalDependencyError(DirectedAcyclicGraphError):
 
 
 class DirectedAcyclicGraphNode(Generic[T]):
-    __slots__ = ("value", "depends_on")
+    __slots__ = ("value", "depends_on", "dependents")
 
     def __init__(self, value: T) -> None:
         self.value: T = value
         self.depends_on: Set[DirectedAcyclicGraphNode[T]] = set()
+        # The reverse of depends_on, maintained by the graph.
+        self.dependents: Set[DirectedAcyclicGraphNode[T]] = set()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.value!r})"
@@ -36,6 +38,15 @@ class DirectedAcyclicGraphNode(Generic[T]):
 class DirectedAcyclicGraph(Generic[T]):
     def __init__(self) -> None:
         self.nodes: Set[DirectedAcyclicGraphNode[T]] = set()
+        # The transitive closure of the dependencies in both directions,
+        # kept up to date as they are added, so checking a new dependency
+        # for a cycle is a set lookup rather than a search of the graph.
+        self._requires: Dict[
+            DirectedAcyclicGraphNode[T], Set[DirectedAcyclicGraphNode[T]]
+        ] = {}
+        self._required_by: Dict[
+            DirectedAcyclicGraphNode[T], Set[DirectedAcyclicGraphNode[T]]
+        ] = {}
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(nodes={len(self.nodes)})"
@@ -48,6 +59,8 @@ class DirectedAcyclicGraph(Generic[T]):
                 f"{node} already exists in the graph."
             )
         self.nodes.add(node)
+        self._requires[node] = set()
+        self._required_by[node] = set()
         return node
 
     def _require_node(self, node: DirectedAcyclicGraphNode[T]) -> None:
@@ -114,8 +127,9 @@ class DirectedAcyclicGraph(Generic[T]):
                 f"Cannot add dependency: {node} cannot depend on itself."
             )
 
-        path = self._find_path(dependency, node)
-        if path is not None:
+        if node in self._requires[dependency]:
+            path = self._find_path(dependency, node)
+            assert path is not None
             path_str = self._format_cycle(path + [dependency])
             raise CyclicalDependencyError(
                 "Cannot add dependency because it would create a cycle.\n",
@@ -123,70 +137,123 @@ class DirectedAcyclicGraph(Generic[T]):
             )
 
         node.depends_on.add(dependency)
+        dependency.dependents.add(node)
+        self._link(node, dependency)
 
-    def topological_sort(self) -> List[T]:
-        in_degree: Dict[DirectedAcyclicGraphNode[T], int] = {
-            node: 0 for node in self.nodes
-        }
+    def requires(
+        self,
+        node: DirectedAcyclicGraphNode[T],
+        dependency: DirectedAcyclicGraphNode[T],
+    ) -> bool:
+        """Whether ``node`` depends on ``dependency``, directly or not."""
+        return dependency in self._requires[node]
+
+    def _link(
+        self,
+        node: DirectedAcyclicGraphNode[T],
+        dependency: DirectedAcyclicGraphNode[T],
+    ) -> None:
+        if dependency in self._requires[node]:
+            return
+        upstream = self._requires[dependency] | {dependency}
+        downstream = self._required_by[node] | {node}
+        for dependent in downstream:
+            self._requires[dependent] |= upstream
+        for required in upstream:
+            self._required_by[required] |= downstream
+
+    def _in_degrees(self) -> Dict[DirectedAcyclicGraphNode[T], int]:
+        return {node: len(node.depends_on) for node in self.nodes}
+
+    def _raise_cycle(
+        self, in_degree: Dict[DirectedAcyclicGraphNode[T], int]
+    ) -> None:
+        # Every node a sort could not reach still waits on another such
+        # node, so following those dependencies must run into a cycle.
+        remaining = {node for node, degree in in_degree.items() if degree}
+        current = next(iter(remaining))
+        path: List[DirectedAcyclicGraphNode[T]] = []
+        seen: Dict[DirectedAcyclicGraphNode[T], int] = {}
+        while current not in seen:
+            seen[current] = len(path)
+            path.append(current)
+            current = next(
+                dependency
+                for dependency in current.depends_on
+                if dependency in remaining
+            )
+        cycle = path[seen[current] :] + [current]
+        raise CyclicalDependencyError(
+            "Graph contains a cycle.\n" + self._format_cycle(cycle)
+        )
 
-        for node in self.nodes:
-            for _ in node.depends_on:
-                in_degree[node] += 1
+    def _sorted_nodes(self) -> List[DirectedAcyclicGraphNode[T]]:
+        in_degree = self._in_degrees()
 
         queue: deque[DirectedAcyclicGraphNode[T]] = deque(
             node for node, degree in in_degree.items() if degree == 0
         )
 
-        result: List[T] = []
+        result: List[DirectedAcyclicGraphNode[T]] = []
 
         while queue:
             current = queue.popleft()
-            result.append(current.value)
+            result.append(current)
 
-            for dependent in self.nodes:
-                if current in dependent.depends_on:
-                    in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        queue.append(dependent)
+            for dependent in current.dependents:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
 
         if len(result) != len(self.nodes):
-            raise CyclicalDependencyError("Graph contains a cycle.")
+            self._raise_cycle(in_degree)
 
         return result
 
-    def parallel_sort(self) -> List[Set[T]]:
-        in_degree: Dict[DirectedAcyclicGraphNode[T], int] = {
-            node: 0 for node in self.nodes
-        }
+    def topological_sort(self) -> List[T]:
+        return [node.value for node in self._sorted_nodes()]
+
+    def bottom_levels(self, cost: Callable[[T], float]) -> Dict[T, float]:
+        """
+        The cost of the most expensive path from each node to one that
+        nothing depends on, its own cost included. Starting the nodes with
+        the highest level first keeps the critical path moving.
+        """
+        levels: Dict[DirectedAcyclicGraphNode[T], float] = {}
+        for node in reversed(self._sorted_nodes()):
+            levels[node] = cost(node.value) + max(
+                (levels[dependent] for dependent in node.dependents),
+                default=0.0,
+            )
+        return {node.value: level for node, level in levels.items()}
 
-        for node in self.nodes:
-            for _ in node.depends_on:
-                in_degree[node] += 1
+    def parallel_sort(self) -> List[Set[T]]:
+        in_degree = self._in_degrees()
 
-        zero_in_degree: Set[DirectedAcyclicGraphNode[T]] = {
+        zero_in_degree: List[DirectedAcyclicGraphNode[T]] = [
             node for node, degree in in_degree.items() if degree == 0
-        }
+        ]
 
         layers: List[Set[T]] = []
+        total = 0
 
         while zero_in_degree:
             current_layer: Set[T] = set()
-            next_zero_in_degree: Set[DirectedAcyclicGraphNode[T]] = set()
+            next_zero_in_degree: List[DirectedAcyclicGraphNode[T]] = []
 
             for node in zero_in_degree:
                 current_layer.add(node.value)
 
-                for dependent in self.nodes:
-                    if node in dependent.depends_on:
-                        in_degree[dependent] -= 1
-                        if in_degree[dependent] == 0:
-                            next_zero_in_degree.add(dependent)
+                for dependent in node.dependents:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_zero_in_degree.append(dependent)
 
             layers.append(current_layer)
+            total += len(zero_in_degree)
             zero_in_degree = next_zero_in_degree
 
-        total = sum(len(layer) for layer in layers)
         if total != len(self.nodes):
-            raise CyclicalDependencyError("Graph contains a cycle.")
+            self._raise_cycle(in_degree)
 
         return layers
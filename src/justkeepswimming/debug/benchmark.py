@@ -0,0 +1,269 @@
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from justkeepswimming.debug.profiler import Profiler
+from justkeepswimming.ecs import Component, Processor, SceneContext
+from justkeepswimming.ecs.scheduler import ProcessorScheduler
+from justkeepswimming.systems.clock import Clock, TickContext
+from justkeepswimming.systems.dispatcher import Dispatcher
+from justkeepswimming.systems.input import Input
+from justkeepswimming.systems.window import Window
+from justkeepswimming.utilities.context import EngineContext
+from justkeepswimming.utilities.launch import Options
+from justkeepswimming.utilities.signal import Signal, deferred_events
+
+
+def engine_context() -> EngineContext:
+    """An engine context for benchmarks, without opening a window."""
+    dispatcher = Dispatcher()
+    profiler = Profiler(False, 1)
+    return EngineContext(
+        clock=Clock(profiler),
+        window=Window(dispatcher),
+        dispatcher=dispatcher,
+        input=Input(dispatcher),
+        profiler=profiler,
+        options=Options(),
+        custom_events={},
+    )
+
+
+def timed(function: Callable[[], object], repeat: int) -> float:
+    """The best of ``repeat`` runs of ``function``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def _update_nothing(
+    self: Processor,
+    tick_context: TickContext,
+    scene_context: SceneContext,
+    engine_context: EngineContext,
+) -> None:
+    pass
+
+
+def synthetic_processors(count: int, seed: int = 0) -> list[type[Processor]]:
+    """
+    Processor types shaped like the game's: each one writes a component
+    of its own, reads a few that earlier ones write, and some are ordered
+    explicitly. They are shuffled, so they arrive in no particular order.
+    Their updates do nothing, so running them measures the scheduler.
+    """
+    rng = random.Random(seed)
+    components = [
+        type(f"BenchmarkComponent{index}", (Component,), {"__slots__": ()})
+        for index in range(count)
+    ]
+    processors: list[type[Processor]] = []
+    for index in range(count):
+        reads = rng.sample(components[:index], min(index, 2))
+        after = rng.sample(processors, min(index, 1)) if index % 4 else []
+        processors.append(
+            type(
+                f"BenchmarkProcessor{index}",
+                (Processor,),
+                {
+                    "writes": frozenset({components[index]}),
+                    "reads": frozenset(reads),
+                    "after": frozenset(after),
+                    "update": _update_nothing,
+                },
+            )
+        )
+    rng.shuffle(processors)
+    return processors
+
+
+@dataclass
+class BenchmarkReport:
+    repeat: int
+    # Seconds per benchmark, for each processor count.
+    results: dict[int, dict[str, float]] = field(default_factory=dict)
+    unit: str = "milliseconds"
+    scale: float = 1000
+
+    def format(self) -> str:
+        names = list(next(iter(self.results.values()), {}))
+        width = max((len(name) for name in names), default=0)
+        lines = [
+            f"Best of {self.repeat} runs, in {self.unit}",
+            " " * width
+            + "".join(f"{count:>12}" for count in self.results),
+        ]
+        for name in names:
+            lines.append(
+                name.ljust(width)
+                + "".join(
+                    f"{results[name] * self.scale:>12.3f}"
+                    for results in self.results.values()
+                )
+            )
+        return "\n".join(lines)
+
+
+def benchmark_scheduler(
+    context: EngineContext, count: int, repeat: int
+) -> dict[str, float]:
+    processor_types = synthetic_processors(count)
+
+    def scheduler() -> ProcessorScheduler:
+        return ProcessorScheduler(SceneContext(), context)
+
+    def add_one_by_one() -> None:
+        built = scheduler()
+        for processor_type in processor_types:
+            built.add_processor(processor_type())
+        built.execution_order()
+
+    def add_batch() -> None:
+        built = scheduler()
+        built.add_processors(
+            processor_type() for processor_type in processor_types
+        )
+        built.execution_order()
+
+    built = scheduler()
+    built.add_processors(
+        processor_type() for processor_type in processor_types
+    )
+    graph = built._graph
+    return {
+        "add_processor": timed(add_one_by_one, repeat),
+        "add_processors": timed(add_batch, repeat),
+        "parallel_sort": timed(graph.parallel_sort, repeat),
+        "topological_sort": timed(graph.topological_sort, repeat),
+    }
+
+
+def benchmark_tick(
+    context: EngineContext, count: int, repeat: int, ticks: int = 100
+) -> dict[str, float]:
+    # Per tick, with and without the profiler recording every processor.
+    scheduler = ProcessorScheduler(SceneContext(), context)
+    scheduler.add_processors(
+        processor_type() for processor_type in synthetic_processors(count)
+    )
+    tick_context = TickContext(1 / 60)
+    loop = asyncio.new_event_loop()
+
+    async def run_ticks() -> None:
+        for _ in range(ticks):
+            await scheduler.process_tick(
+                tick_context, scheduler.scene_context, context
+            )
+
+    def run() -> None:
+        loop.run_until_complete(run_ticks())
+
+    results: dict[str, float] = {}
+    enabled = context.profiler.options.enabled
+    try:
+        for profiled in (False, True):
+            context.profiler.options.enabled = profiled
+            name = "process_tick (profiled)" if profiled else "process_tick"
+            results[name] = timed(run, repeat) / ticks
+    finally:
+        context.profiler.options.enabled = enabled
+        loop.close()
+    return results
+
+
+async def _handle_async(value: int) -> None:
+    pass
+
+
+def _handle_sync(value: int) -> None:
+    pass
+
+
+def benchmark_signals(
+    connections: int, repeat: int, emits: int = 10000
+) -> dict[str, float]:
+    # Per emit, with handlers that do nothing.
+    loop = asyncio.new_event_loop()
+
+    def emit_all(signal: Signal[int]) -> Callable[[], object]:
+        async def run() -> None:
+            for _ in range(emits):
+                await signal.emit(0)
+
+        return lambda: loop.run_until_complete(run())
+
+    def defer_all(signal: Signal[int]) -> Callable[[], object]:
+        async def run() -> None:
+            for _ in range(emits):
+                signal.defer(0)
+            await deferred_events.flush()
+
+        return lambda: loop.run_until_complete(run())
+
+    results: dict[str, float] = {}
+    try:
+        for kind, handler in (
+            ("async", _handle_async),
+            ("sync", _handle_sync),
+        ):
+            signal = Signal[int]()
+            for _ in range(connections):
+                signal.connect(handler)
+            results[f"emit ({kind} handlers)"] = (
+                timed(emit_all(signal), repeat) / emits
+            )
+            results[f"defer + flush ({kind} handlers)"] = (
+                timed(defer_all(signal), repeat) / emits
+            )
+    finally:
+        loop.close()
+    return results
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description="Engine Benchmarks")
+    parser.add_argument(
+        "--processors",
+        "-p",
+        type=int,
+        nargs="+",
+        default=[100, 200, 400],
+        help="Processor counts to build schedulers for",
+    )
+    parser.add_argument(
+        "--repeat",
+        "-r",
+        type=int,
+        default=5,
+        help="Number of runs to take the best time of",
+    )
+    parser.add_argument(
+        "--connections",
+        "-c",
+        type=int,
+        nargs="+",
+        default=[0, 1, 4],
+        help="Connection counts to emit signals with",
+    )
+    args = parser.parse_args()
+
+    context = engine_context()
+    report = BenchmarkReport(args.repeat)
+    for count in args.processors:
+        report.results[count] = {
+            **benchmark_scheduler(context, count, args.repeat),
+            **benchmark_tick(context, count, args.repeat),
+        }
+    print(report.format())
+
+    signals = BenchmarkReport(args.repeat, unit="microseconds", scale=1e6)
+    for count in args.connections:
+        signals.results[count] = benchmark_signals(count, args.repeat)
+    print()
+    print(signals.format())
@@ -0,0 +1,129 @@
+import argparse
+import sys
+from dataclasses import dataclass, field
+
+from justkeepswimming.ecs import Component, SceneContext
+
+
+def shallow_size(obj: object) -> int:
+    """The size of an object and its ``__dict__``, if it has one."""
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, "__dict__", None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes)
+    return size
+
+
+@dataclass
+class ComponentMemory:
+    count: int = 0
+    bytes: int = 0
+
+    @property
+    def bytes_per_component(self) -> float:
+        return self.bytes / self.count if self.count else 0.0
+
+
+@dataclass
+class MemoryReport:
+    """
+    Shallow sizes of the entities and components of a scene. Values that
+    components refer to, such as surfaces, are shared or owned elsewhere
+    and are left out.
+    """
+
+    entity_count: int = 0
+    entity_bytes: int = 0
+    column_bytes: int = 0
+    components: dict[str, ComponentMemory] = field(default_factory=dict)
+
+    @property
+    def component_bytes(self) -> int:
+        return sum(memory.bytes for memory in self.components.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return self.entity_bytes + self.component_bytes + self.column_bytes
+
+    @property
+    def bytes_per_entity(self) -> float:
+        if not self.entity_count:
+            return 0.0
+        return self.total_bytes / self.entity_count
+
+    def format(self) -> str:
+        lines = [
+            f"{self.entity_count} entities, "
+            f"{self.total_bytes / (1024 * 1024):.2f} MiB in total, "
+            f"{self.bytes_per_entity:.1f} bytes per entity",
+            f"  Entity handles: {self.entity_bytes} bytes "
+            f"({self.entity_bytes / max(self.entity_count, 1):.1f} each)",
+        ]
+        for name, memory in sorted(
+            self.components.items(),
+            key=lambda item: item[1].bytes,
+            reverse=True,
+        ):
+            lines.append(
+                f"  {name}: {memory.count} x "
+                f"{memory.bytes_per_component:.1f} bytes = {memory.bytes}"
+            )
+        if self.column_bytes:
+            lines.append(f"  Column stores: {self.column_bytes} bytes")
+        return "\n".join(lines)
+
+
+def measure(scene_context: SceneContext) -> MemoryReport:
+    report = MemoryReport()
+    for archetype in scene_context.archetypes.values():
+        for entity in archetype.entities:
+            report.entity_count += 1
+            report.entity_bytes += shallow_size(entity)
+        for component_type, column in archetype.columns.items():
+            memory = report.components.setdefault(
+                component_type.__name__, ComponentMemory()
+            )
+            memory.count += len(column)
+            memory.bytes += sum(
+                shallow_size(component) for component in column
+            )
+    for store in scene_context.column_stores.values():
+        report.column_bytes += store.occupied.nbytes + store.changed.nbytes
+        report.column_bytes += sum(
+            array.nbytes for array in store.arrays.values()
+        )
+    return report
+
+
+def cli() -> None:
+    from justkeepswimming.components.physics import (
+        AngularPhysicsComponent,
+        LinearPhysicsComponent,
+        TransformComponent,
+    )
+
+    parser = argparse.ArgumentParser(description="Entity Memory Report")
+    parser.add_argument(
+        "--entities",
+        "-n",
+        type=int,
+        default=100_000,
+        help="Number of physics entities to spawn",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Keep the physics components in column stores",
+    )
+    args = parser.parse_args()
+
+    def components(_: int) -> tuple[Component, ...]:
+        return (
+            TransformComponent(),
+            LinearPhysicsComponent(),
+            AngularPhysicsComponent(),
+        )
+
+    scene_context = SceneContext(columnar=args.columnar)
+    scene_context.spawn_batch(args.entities, components, "body")
+    print(measure(scene_context).format())
@@ -9,7 +9,7 @@ from justkeepswimming.debug.processors.rendering import (
     MouseDebuggerProcessor,
     RendererDebuggerProcessor,
 )
-from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs import Processor, ProcessorPriority, SceneContext
 from justkeepswimming.processors.position import SceneCenterConstraintProcessor
 from justkeepswimming.processors.render import RendererProcessor
 from justkeepswimming.processors.sizing import SceneSizeConstraintProcessor
@@ -58,6 +58,8 @@ class ButtonDebuggerProcessor(Processor):
     before = frozenset({})
     alongside = frozenset({})
     debug_only = True
+    primary_query = (ButtonComponent, TransformComponent, RendererComponent)
+    priority = ProcessorPriority.LOWEST
 
     async def update(
         self,
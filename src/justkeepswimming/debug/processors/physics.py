@@ -7,7 +7,25 @@ from justkeepswimming.components.physics import (
     LinearPhysicsComponent,
     TransformComponent,
 )
-from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.components.pseudo import ScenePseudoComponent
+from justkeepswimming.debug.processors.button import ButtonDebuggerProcessor
+from justkeepswimming.debug.processors.rendering import (
+    MouseDebuggerProcessor,
+    RendererDebuggerProcessor,
+)
+from justkeepswimming.ecs import (
+    Maybe,
+    Processor,
+    ProcessorPriority,
+    SceneContext,
+)
+from justkeepswimming.processors.position import SceneCenterConstraintProcessor
+from justkeepswimming.processors.render import RendererProcessor
+from justkeepswimming.processors.sizing import SceneSizeConstraintProcessor
+from justkeepswimming.processors.tile import (
+    AutoTileScrollProcessor,
+    MouseRelativeTileScrollProcessor,
+)
 from justkeepswimming.systems.clock import TickContext
 from justkeepswimming.utilities.context import EngineContext
 from justkeepswimming.utilities.rendering import (
@@ -21,8 +39,32 @@ class LinearPhysicsDebuggerProcessor(Processor):
     reads = frozenset(
         {LinearPhysicsComponent, PlayerLinearMovementInputComponent}
     )
-    writes = frozenset({})
+    # Draws on the scene, so it is ordered against everything else that
+    # does instead of possibly running alongside it.
+    writes = frozenset({ScenePseudoComponent})
+    after = frozenset(
+        {
+            SceneSizeConstraintProcessor,
+            RendererProcessor,
+            AutoTileScrollProcessor,
+            SceneCenterConstraintProcessor,
+            MouseRelativeTileScrollProcessor,
+        }
+    )
+    before = frozenset(
+        {
+            RendererDebuggerProcessor,
+            MouseDebuggerProcessor,
+            ButtonDebuggerProcessor,
+        }
+    )
     debug_only = True
+    primary_query = (
+        LinearPhysicsComponent,
+        TransformComponent,
+        Maybe(PlayerLinearMovementInputComponent),
+    )
+    priority = ProcessorPriority.LOWEST
 
     async def update(
         self,
@@ -32,16 +74,19 @@ class LinearPhysicsDebuggerProcessor(Processor):
     ) -> None:
         surface = scene_context.surface
 
-        for entity, (linear_physics, transform) in scene_context.query(
+        for _, (
+            linear_physics,
+            transform,
+            input_component,
+        ) in scene_context.query(
             LinearPhysicsComponent,
             TransformComponent,
+            Maybe(PlayerLinearMovementInputComponent),
         ):
             origin = Vector2(transform.position)
 
-            if entity.has_component(PlayerLinearMovementInputComponent):
-                input = entity.get_component(
-                    PlayerLinearMovementInputComponent
-                ).thrust
+            if input_component is not None:
+                input = input_component.thrust
                 if input.length() > 0:
                     magnitude = input.normalize() * 25
                     render_arrow(
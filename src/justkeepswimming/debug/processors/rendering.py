@@ -4,7 +4,7 @@ from pygame import Color, Vector2
 from justkeepswimming.components.physics import TransformComponent
 from justkeepswimming.components.pseudo import ScenePseudoComponent
 from justkeepswimming.components.render import RendererComponent
-from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs import Processor, ProcessorPriority, SceneContext
 from justkeepswimming.processors.position import SceneCenterConstraintProcessor
 from justkeepswimming.processors.render import RendererProcessor
 from justkeepswimming.processors.sizing import SceneSizeConstraintProcessor
@@ -35,6 +35,8 @@ class RendererDebuggerProcessor(Processor):
         }
     )
     debug_only = True
+    primary_query = (TransformComponent, RendererComponent)
+    priority = ProcessorPriority.LOWEST
 
     async def update(
         self,
@@ -75,6 +77,7 @@ class MouseDebuggerProcessor(Processor):
         }
     )
     debug_only = True
+    priority = ProcessorPriority.LOWEST
 
     async def update(
         self,
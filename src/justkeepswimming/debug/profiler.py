@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 class Profiler:
-    version = SemanticVersion(2, 0, 0)
+    version = SemanticVersion(2, 1, 0)
 
     def __init__(self, enabled: bool, history_length: int):
         self.options = ProfileOptions(
@@ -36,19 +36,28 @@ class Profiler:
         self.memory_bytes: deque[float] = deque(
             maxlen=self.options.history_length
         )
+        # How many times each name was skipped rather than run.
+        self.skips: dict[ProfilerScope, dict[str, int]] = {}
 
     def record(
         self, scope: ProfilerScope, name: str, start_ms: float, end_ms: float
     ):
         if not self.options.enabled:
             return
-        if scope not in self.records:
-            self.records[scope] = {}
-        if name not in self.records[scope]:
-            self.records[scope][name] = deque(
-                maxlen=self.options.history_length
+        # setdefault, since processors on worker threads record at once.
+        records = self.records.setdefault(scope, {})
+        history = records.get(name)
+        if history is None:
+            history = records.setdefault(
+                name, deque(maxlen=self.options.history_length)
             )
-        self.records[scope][name].append((start_ms, end_ms))
+        history.append((start_ms, end_ms))
+
+    def skip(self, scope: ProfilerScope, name: str) -> None:
+        if not self.options.enabled:
+            return
+        skips = self.skips.setdefault(scope, {})
+        skips[name] = skips.get(name, 0) + 1
 
     @contextmanager
     def scope(self, scope: ProfilerScope, name: str):
@@ -119,6 +119,20 @@ def show_summary(profiler: Profiler) -> None:
     plt.show()
 
 
+def show_skips(profiler: Profiler) -> None:
+    """Print how many ticks each processor was skipped for."""
+    # Dumps from before version 2.1 have no skip counts.
+    skips = getattr(profiler, "skips", {}).get(ProfilerScope.PROCESSOR, {})
+    if not skips:
+        print("No processors were skipped")
+        return
+    width = max(len(name) for name in skips)
+    for name, count in sorted(
+        skips.items(), key=lambda item: item[1], reverse=True
+    ):
+        print(f"{name.ljust(width)}  {count} ticks")
+
+
 def show_gantt_frame(profiler: Profiler, frame_index: int) -> None:
     """Draw a true start/end Gantt for exactly one frame, labels only inside
     blocks or outside (left/right) when they don't fit. Outside labels are
@@ -328,6 +342,11 @@ def cli() -> None:
         "--frame", "-f", type=int, required=True, help="Frame index to show"
     )
 
+    parser_skips = subparsers.add_parser(
+        "skips", help="Show how often processors were skipped"
+    )
+    parser_skips.add_argument("dump_path", help="Path to .prof dump")
+
     args = parser.parse_args()
 
     if args.command == "summary":
@@ -336,5 +355,8 @@ def cli() -> None:
     elif args.command == "frame":
         profiler = Profiler.load(args.dump_path)
         show_gantt_frame(profiler, args.frame)
+    elif args.command == "skips":
+        profiler = Profiler.load(args.dump_path)
+        show_skips(profiler)
     else:
         parser.print_help()
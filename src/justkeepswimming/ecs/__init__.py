@@ -1,48 +1,152 @@
 import logging
-from collections.abc import Iterable
-from typing import TypeVar, cast, overload
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any, Self, TypeVar, cast, overload
 
+import numpy as np
 from pygame import Surface, Vector2
 
+from justkeepswimming.ecs.allocator import EntityAllocator
+from justkeepswimming.ecs.archetype import Archetype
+from justkeepswimming.ecs.changes import current_change_tick, last_run_tick
+from justkeepswimming.ecs.columns import INITIAL_CAPACITY, ColumnStore
+from justkeepswimming.ecs.commands import (
+    Command,
+    CommandBuffer,
+    CommandType,
+    PendingEntity,
+)
+from justkeepswimming.ecs.costs import ProcessorPriority
+from justkeepswimming.ecs.offload import OffloadJob
+from justkeepswimming.ecs.query import (
+    Maybe,
+    Query,
+    QueryRow,
+    QuerySignature,
+    QueryTerm,
+)
+from justkeepswimming.ecs.routing import ComponentSignalRouter
+from justkeepswimming.ecs.snapshot import SceneSnapshot
 from justkeepswimming.systems.clock import TickContext
 from justkeepswimming.utilities.context import EngineContext
 from justkeepswimming.utilities.maid import Maid
-from justkeepswimming.utilities.signal import Signal
+from justkeepswimming.utilities.signal import Signal, defer_batch
 
 logger = logging.getLogger(__name__)
 
+# Guards query registration, which processors on worker threads may race
+# on. Module level because scene contexts are deep copied.
+_query_lock = threading.Lock()
+
 C = TypeVar("C")
 
+type ChangedTerms = type["Component"] | Iterable[type["Component"]]
+
+
+class EntityException(Exception):
+    pass
+
+
+class StaleEntityException(EntityException):
+    pass
+
+
+class PendingEntityException(EntityException):
+    pass
+
 
 class Entity:
+    __slots__ = ("id", "generation", "name", "context", "_maid")
+
     def __init__(
-        self, entity_id: int, name: str, context: "SceneContext"
+        self,
+        entity_id: int,
+        generation: int,
+        name: str,
+        context: "SceneContext",
     ) -> None:
         self.id = entity_id
-        self.maid = Maid()
+        self.generation = generation
         self.name = name
         self.context = context
+        self._maid: Maid | None = None
+
+    @property
+    def maid(self) -> Maid:
+        # Few entities ever own cleanup tasks, so the maid is only created
+        # the first time it is asked for.
+        if self._maid is None:
+            self._maid = Maid()
+        return self._maid
+
+    @property
+    def alive(self) -> bool:
+        return self.context.is_alive(self)
 
     def has_component(self, component_type: type["Component"]) -> bool:
-        return component_type in self.context.components[self.id]
+        return self.context.has_component(self, component_type)
 
     def get_component(self, component_type: type[C]) -> C:
-        return cast(C, self.context.components[self.id][component_type])
+        return cast(C, self.context.get_component(self, component_type))
 
     def add_component(self, component: "Component") -> None:
         self.context.add_component(self, component)
 
     def remove_component(self, component: "Component") -> None:
-        if self.has_component(type(component)):
-            del self.context.components[self.id][type(component)]
+        self.context.remove_component(self, type(component))
 
     def __repr__(self) -> str:
-        return f"<Entity {self.name} ({self.id})>"
+        return f"<Entity {self.name} ({self.id}v{self.generation})>"
 
 
 class Component:
+    """
+    The base of every component. Components are declared as slotted
+    dataclasses, ``@dataclass(slots=True)``, so that they carry no
+    per-instance ``__dict__``.
+    """
+
+    # The column store and row of a component in a columnar scene, and the
+    # change tick of its last write, which the column store keeps instead
+    # while the component is stored in one.
+    __slots__ = ("column_store", "column_index", "changed_tick")
+
     incompatible_with: frozenset[type["Component"]] = frozenset()
-    pass
+    # Fields that a columnar scene keeps in NumPy arrays instead of on the
+    # component itself, see `justkeepswimming.ecs.columns`.
+    columnar_fields: tuple[str, ...] = ()
+
+    column_store: ColumnStore | None
+    column_index: int
+    changed_tick: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        # Dataclass constructors do not call up to this class, so the
+        # bookkeeping slots are filled in before __init__ runs instead.
+        component = object.__new__(cls)
+        component.column_store = None
+        component.column_index = -1
+        component.changed_tick = 0
+        return component
+
+    def mark_changed(self, tick: int | None = None) -> None:
+        # Writes are not tracked on their own, so code that writes a
+        # component which queries filter on with ``changed=`` calls this
+        # afterwards. A loop over many components can look the tick up
+        # once, with `current_change_tick`, and pass it in.
+        if tick is None:
+            tick = current_change_tick()
+        store = self.column_store
+        if store is None:
+            self.changed_tick = tick
+        else:
+            store.changed[self.column_index] = tick
+
+    def last_changed(self) -> int:
+        store = self.column_store
+        if store is None:
+            return self.changed_tick
+        return int(store.changed[self.column_index])
 
 
 C1 = TypeVar("C1")
@@ -54,193 +158,696 @@ INTERNAL_RENDER_WINDOW_SIZE = Vector2(1920 / 3, 1080 / 3)
 
 
 class SceneContext:
-    def __init__(self) -> None:
+    def __init__(
+        self, columnar: bool = False, shared_columns: bool = False
+    ) -> None:
         self.time_scale: float = 1
+        self.columnar = columnar or shared_columns
+        # Column stores in shared memory, for offloaded processors.
+        self.shared_columns = shared_columns
+        self.column_stores: dict[type[Component], ColumnStore] = {}
         self.maid: Maid = Maid()
         self.surface: Surface = Surface(INTERNAL_RENDER_WINDOW_SIZE)
         self.entities: dict[int, Entity] = {}
-        self.components: dict[int, dict[type, Component]] = {}
+        self.allocator = EntityAllocator()
+        self.archetypes: dict[frozenset[type[Component]], Archetype] = {}
+        self._locations: list[Archetype | None] = []
         self.on_entity_created = Signal[Entity]()
         self.on_entity_deleted = Signal[Entity]()
         self.on_component_added = Signal[tuple[Entity, Component]]()
         self.on_component_removed = Signal[tuple[Entity, Component]]()
-        self._query_cache: dict[
-            tuple[type[Component], ...],
-            list[tuple[Entity, tuple[Component, ...]]],
-        ] = {}
-        self._query_one_cache: dict[
-            tuple[type[Component], ...],
-            tuple[Entity, tuple[Component, ...]] | None,
-        ] = {}
+        self._added_router = ComponentSignalRouter(self.on_component_added)
+        self._removed_router = ComponentSignalRouter(
+            self.on_component_removed
+        )
+        self._queries: dict[QuerySignature, Query] = {}
+        self._queries_by_type: dict[type[Component], list[Query]] = {}
+        # Queries without required component types can match any entity,
+        # including one that has no components at all.
+        self._unconstrained_queries: list[Query] = []
+        self._empty_archetype = self._get_archetype(frozenset())
+        self.commands = CommandBuffer(self)
+
+    def _get_archetype(
+        self, component_types: frozenset[type[Component]]
+    ) -> Archetype:
+        archetype = self.archetypes.get(component_types)
+        if archetype is None:
+            archetype = Archetype(component_types)
+            self.archetypes[component_types] = archetype
+            # New archetypes are rare, so the archetype lists of the
+            # queries seen so far are extended rather than rebuilt.
+            for query in self._queries.values():
+                if query.matches(archetype):
+                    query.archetypes.append(archetype)
+            logger.debug(f"Created archetype {archetype}")
+        return archetype
+
+    def _get_query(
+        self,
+        terms: tuple[QueryTerm, ...],
+        without: Iterable[type[Component]] = (),
+    ) -> Query:
+        signature = (terms, frozenset(without))
+        query = self._queries.get(signature)
+        if query is not None:
+            return query
+        with _query_lock:
+            query = self._queries.get(signature)
+            if query is not None:
+                return query
+            query = Query(*signature)
+            query.build(self.archetypes.values())
+            self._queries[signature] = query
+            for component_type in query.referenced_types:
+                self._queries_by_type.setdefault(component_type, []).append(
+                    query
+                )
+            if not query.component_types:
+                self._unconstrained_queries.append(query)
+            logger.debug(f"Registered {query}")
+        return query
+
+    def _update_queries(
+        self,
+        entity: Entity,
+        component_types: Iterable[type[Component]],
+        archetype: Archetype,
+    ) -> None:
+        affected: dict[Query, None] = {}
+        for component_type in component_types:
+            for query in self._queries_by_type.get(component_type, ()):
+                affected[query] = None
+        for query in affected:
+            query.update(entity, archetype)
+
+    def _discard_from_queries(
+        self, entity: Entity, archetype: Archetype
+    ) -> None:
+        for component_type in archetype.component_types:
+            for query in self._queries_by_type.get(component_type, ()):
+                query.discard(entity)
+        for query in self._unconstrained_queries:
+            query.discard(entity)
+
+    def _move(
+        self,
+        entity: Entity,
+        source: Archetype,
+        destination: Archetype,
+        component: Component | None = None,
+    ) -> None:
+        components = source.pop(entity)
+        if component is not None:
+            components[type(component)] = component
+        destination.append(entity, components)
+        self._locations[entity.id] = destination
+
+    def _attach(self, entity: Entity, component: Component) -> None:
+        if not self.columnar or not component.columnar_fields:
+            return
+        component_type = type(component)
+        store = self.column_stores.get(component_type)
+        if store is None:
+            store = ColumnStore(
+                component_type,
+                max(INITIAL_CAPACITY, self.allocator.capacity),
+                self.shared_columns,
+            )
+            self.column_stores[component_type] = store
+            logger.debug(f"Created {store}")
+        store.attach(component, entity.id)
+
+    def _detach(self, component: Component) -> None:
+        if component.column_store is not None:
+            component.column_store.detach(component)
+
+    def release_column_stores(self) -> None:
+        """Free the shared memory of the column stores, if they use any."""
+        for store in self.column_stores.values():
+            store.release()
+
+    def column_store(self, component_type: type[Component]) -> ColumnStore:
+        store = self.column_stores.get(component_type)
+        if store is None:
+            raise KeyError(
+                f"No column store for {component_type.__name__} in this "
+                f"scene context."
+            )
+        return store
+
+    def _locate(self, entity: Entity) -> Archetype:
+        if not self.allocator.is_alive(entity.id, entity.generation):
+            raise StaleEntityException(
+                f"Entity {entity} does not exist in the scene context."
+            )
+        archetype = self._locations[entity.id]
+        if archetype is None:
+            raise PendingEntityException(
+                f"Entity {entity} is waiting for its spawn command to be "
+                f"applied."
+            )
+        return archetype
+
+    def is_alive(self, entity: Entity) -> bool:
+        return self.allocator.is_alive(entity.id, entity.generation)
+
+    def has_component(
+        self, entity: Entity, component_type: type[Component]
+    ) -> bool:
+        archetype = self._locate(entity)
+        return component_type in archetype.component_types
+
+    def get_component(
+        self, entity: Entity, component_type: type[Component]
+    ) -> Component:
+        archetype = self._locate(entity)
+        return archetype.get(entity, component_type)
+
+    def get_components(
+        self, entity: Entity
+    ) -> dict[type[Component], Component]:
+        archetype = self._locate(entity)
+        return archetype.components(entity)
+
+    def find_entity(self, name: str) -> Entity | None:
+        for entity in self.entities.values():
+            if entity.name == name:
+                return entity
+        return None
 
-    def _invalidate_caches(self) -> None:
-        self._query_cache.clear()
-        self._query_one_cache.clear()
+    def reserve_entity(self, name: str) -> Entity:
+        index, generation = self.allocator.allocate()
+        entity = Entity(index, generation, name, self)
+        if index == len(self._locations):
+            self._locations.append(None)
+        else:
+            self._locations[index] = None
+        return entity
 
     def create_entity(self, name: str) -> Entity:
-        # This technically won't affect the cache correctness
-        # since no components exist yet for this entity
-        # so it is safe to not clear the cache here.
-        entity = Entity(len(self.entities) + 1, name, self)
+        # Only a query without required component types can match an
+        # entity that has no components yet, so every other query is
+        # untouched.
+        entity = self.reserve_entity(name)
         self.entities[entity.id] = entity
-        self.components[entity.id] = {}
-        self.on_entity_created.emit_sync(entity)
+        self._locations[entity.id] = self._empty_archetype
+        self._empty_archetype.append(entity, {})
+        for query in self._unconstrained_queries:
+            query.update(entity, self._empty_archetype)
+        self.on_entity_created.defer(entity)
         return entity
 
+    def spawn(self, name: str, components: Iterable[Component]) -> Entity:
+        return self.spawn_many(((name, components),))[0]
+
+    def spawn_batch(
+        self,
+        count: int,
+        components_factory: Callable[[int], Iterable[Component]],
+        name: str = "entity",
+    ) -> list[Entity]:
+        """
+        Create ``count`` entities with the components that
+        ``components_factory`` returns for each position in the batch.
+        """
+        return self.spawn_many(
+            (f"{name}_{position}", components_factory(position))
+            for position in range(count)
+        )
+
+    def spawn_many(
+        self, specs: Iterable[tuple[str, Iterable[Component]]]
+    ) -> list[Entity]:
+        # Entities are grouped by archetype so that each group is looked up,
+        # and each interested query is updated, once for the whole batch.
+        # Every notification is deferred together, in order.
+        entities: list[Entity] = []
+        groups: dict[
+            frozenset[type[Component]],
+            list[tuple[Entity, dict[type[Component], Component]]],
+        ] = {}
+        emissions: list[tuple[Signal[Any], tuple[Any, ...]]] = []
+        for name, spec in specs:
+            entity = self.reserve_entity(name)
+            components: dict[type[Component], Component] = {}
+            for component in spec:
+                self._check_compatible(entity, components, component)
+                components[type(component)] = component
+            entities.append(entity)
+            groups.setdefault(frozenset(components), []).append(
+                (entity, components)
+            )
+            emissions.append((self.on_entity_created, (entity,)))
+            for component in components.values():
+                emissions.extend(
+                    self._added_router.emissions(entity, component)
+                )
+
+        for component_types, members in groups.items():
+            archetype = self._get_archetype(component_types)
+            for entity, components in members:
+                self.entities[entity.id] = entity
+                self._locations[entity.id] = archetype
+                archetype.append(entity, components)
+                for component in components.values():
+                    self._attach(entity, component)
+                    component.mark_changed()
+            affected: dict[Query, None] = dict.fromkeys(
+                self._unconstrained_queries
+            )
+            for component_type in component_types:
+                for query in self._queries_by_type.get(component_type, ()):
+                    affected[query] = None
+            group = [entity for entity, _ in members]
+            for query in affected:
+                if query.matches(archetype):
+                    query.extend(group, archetype)
+
+        defer_batch(emissions)
+        return entities
+
     def delete_entity(self, entity: Entity) -> None:
-        if entity.id in self.entities:
-            self.on_entity_deleted.emit_sync(entity)
+        if self.is_alive(entity):
+            self.on_entity_deleted.defer(entity)
             del self.entities[entity.id]
-            del self.components[entity.id]
-        self._invalidate_caches()
+            archetype = self._locate(entity)
+            for component in archetype.pop(entity).values():
+                self._detach(component)
+            self._locations[entity.id] = None
+            self.allocator.release(entity.id)
+            self._discard_from_queries(entity, archetype)
 
     def add_component(self, entity: Entity, component: Component) -> None:
-        if entity.id not in self.components:
-            raise RuntimeError(
-                f"Entity {entity.id} does not exist in the scene context."
-            )
+        archetype = self._locate(entity)
         for incompatible_component in component.incompatible_with:
-            if incompatible_component in self.components[entity.id]:
+            if incompatible_component in archetype.component_types:
                 raise ValueError(
                     f"Component {type(component).__name__} is incompatible "
                     f"with existing component "
                     f"{incompatible_component.__name__} on entity {entity.id}"
                 )
-        self.components[entity.id][type(component)] = component
-        self.on_component_added.emit_sync((entity, component))
-        self._invalidate_caches()
+        component_type = type(component)
+        if component_type in archetype.component_types:
+            self._detach(archetype.get(entity, component_type))
+            archetype.set(entity, component)
+            destination = archetype
+        else:
+            destination = archetype.add_edges.get(component_type)
+            if destination is None:
+                destination = self._get_archetype(
+                    archetype.component_types | {component_type}
+                )
+                archetype.add_edges[component_type] = destination
+                destination.remove_edges[component_type] = archetype
+            self._move(entity, archetype, destination, component)
+        self._attach(entity, component)
+        component.mark_changed()
+        self._update_queries(entity, (component_type,), destination)
+        defer_batch(self._added_router.emissions(entity, component))
 
     def remove_component(
         self, entity: Entity, component_type: type[Component]
     ) -> None:
-        if entity.id not in self.components:
-            raise RuntimeError(
-                f"Entity {entity.id} does not exist in the scene context."
+        archetype = self._locate(entity)
+        if component_type in archetype.component_types:
+            component = archetype.get(entity, component_type)
+            destination = archetype.remove_edges.get(component_type)
+            if destination is None:
+                destination = self._get_archetype(
+                    archetype.component_types - {component_type}
+                )
+                archetype.remove_edges[component_type] = destination
+                destination.add_edges[component_type] = archetype
+            self._move(entity, archetype, destination)
+            self._detach(component)
+            self._update_queries(entity, (component_type,), destination)
+            defer_batch(self._removed_router.emissions(entity, component))
+
+    def _check_compatible(
+        self,
+        entity: Entity,
+        components: dict[type[Component], Component],
+        component: Component,
+    ) -> None:
+        for incompatible_component in component.incompatible_with:
+            if incompatible_component in components:
+                raise ValueError(
+                    f"Component {type(component).__name__} is "
+                    f"incompatible with existing component "
+                    f"{incompatible_component.__name__} on entity "
+                    f"{entity.id}"
+                )
+
+    def _pending(
+        self, pending: dict[int, PendingEntity], entity: Entity
+    ) -> PendingEntity | None:
+        state = pending.get(entity.id)
+        if state is not None and state.entity is entity:
+            return state
+        if not self.is_alive(entity):
+            logger.warning(f"Dropping command for stale entity {entity}")
+            return None
+        archetype = self._locate(entity)
+        state = PendingEntity(entity, archetype, archetype.components(entity))
+        pending[entity.id] = state
+        return state
+
+    def apply_commands(self, commands: list[Command]) -> None:
+        # Replay every command against a per-entity copy of its components
+        # first, so that each entity moves between archetypes at most once
+        # however many commands touched it.
+        pending: dict[int, PendingEntity] = {}
+        emissions: list[tuple[Signal[Any], tuple[Any, ...]]] = []
+        for command_type, entity, payload in commands:
+            if command_type is CommandType.SPAWN:
+                state = PendingEntity(entity, None, {})
+                pending[entity.id] = state
+                emissions.append((self.on_entity_created, (entity,)))
+                components = cast(tuple[Component, ...], payload)
+            else:
+                state = self._pending(pending, entity)
+                if state is None or state.despawned:
+                    continue
+                if command_type is CommandType.DESPAWN:
+                    state.despawned = True
+                    emissions.append((self.on_entity_deleted, (entity,)))
+                    continue
+                if command_type is CommandType.REMOVE:
+                    component_type = cast(type[Component], payload)
+                    component = state.components.pop(component_type, None)
+                    if component is not None:
+                        state.changed.add(component_type)
+                        emissions.extend(
+                            self._removed_router.emissions(entity, component)
+                        )
+                    continue
+                components = (cast(Component, payload),)
+            for component in components:
+                self._check_compatible(entity, state.components, component)
+                state.components[type(component)] = component
+                state.changed.add(type(component))
+                emissions.extend(
+                    self._added_router.emissions(entity, component)
+                )
+
+        for state in pending.values():
+            self._commit(state)
+        defer_batch(emissions)
+
+    def _commit(self, state: PendingEntity) -> None:
+        entity = state.entity
+        source = state.source
+        if state.despawned:
+            if source is not None:
+                for component in source.pop(entity).values():
+                    self._detach(component)
+                del self.entities[entity.id]
+                self._discard_from_queries(entity, source)
+            self._locations[entity.id] = None
+            self.allocator.release(entity.id)
+            return
+
+        for component_type in state.changed:
+            previous = (
+                source.get(entity, component_type)
+                if source is not None
+                and component_type in source.component_types
+                else None
             )
-        if component_type in self.components[entity.id]:
-            component = self.components[entity.id][component_type]
-            del self.components[entity.id][component_type]
-            self.on_component_removed.emit_sync((entity, component))
-            self._invalidate_caches()
+            component = state.components.get(component_type)
+            if previous is not component:
+                if previous is not None:
+                    self._detach(previous)
+                if component is not None:
+                    self._attach(entity, component)
+                    component.mark_changed()
+
+        destination = self._get_archetype(frozenset(state.components))
+        if source is None:
+            self.entities[entity.id] = entity
+            destination.append(entity, state.components)
+            for query in self._unconstrained_queries:
+                query.update(entity, destination)
+        elif source is destination:
+            for component_type in state.changed:
+                if component_type in state.components:
+                    destination.set(entity, state.components[component_type])
+        else:
+            source.pop(entity)
+            destination.append(entity, state.components)
+        self._locations[entity.id] = destination
+        self._update_queries(entity, state.changed, destination)
+
+    def snapshot(self) -> SceneSnapshot:
+        """
+        Capture the entities and component data of the scene. Numeric and
+        vector fields are copied into arrays, while assets such as images
+        and surfaces are shared with the live components.
+        """
+        generations, free = self.allocator.state()
+        return SceneSnapshot(
+            generations,
+            free,
+            list(self._locations),
+            dict(self.entities),
+            list(self.archetypes.values()),
+            list(self.column_stores.values()),
+            list(self._queries.values()),
+        )
+
+    def restore(self, snapshot: SceneSnapshot) -> None:
+        """
+        Put the scene back the way it was when the snapshot was taken. The
+        same entity handles and component objects come back, and entities
+        created since are gone. No signals are emitted, and pending
+        commands are dropped.
+        """
+        captured = snapshot.components()
+        for archetype in self.archetypes.values():
+            for column in archetype.columns.values():
+                for component in column:
+                    if (
+                        component.column_store is not None
+                        and id(component) not in captured
+                    ):
+                        self._detach(component)
+            archetype.entities = []
+            archetype.columns = {
+                component_type: [] for component_type in archetype.columns
+            }
+            archetype.rows = {}
+        for archetype, entities, columns, rows in snapshot.tables:
+            archetype.entities = list(entities)
+            archetype.columns = {
+                component_type: list(column)
+                for component_type, column in columns.items()
+            }
+            archetype.rows = dict(rows)
+        # Everything that comes back counts as changed.
+        tick = current_change_tick()
+        for store, arrays, occupied in snapshot.stores:
+            store.restore(arrays, occupied)
+            store.changed[store.occupied] = tick
+        for buffer in snapshot.buffers:
+            buffer.restore(tick)
+
+        self.allocator.restore(snapshot.generations, snapshot.free)
+        self._locations = list(snapshot.locations)
+        self._locations.extend(
+            [None] * (self.allocator.capacity - len(self._locations))
+        )
+        self.entities = dict(snapshot.entities)
+        self.commands.clear()
+        for query in self._queries.values():
+            members = snapshot.queries.get(query)
+            if members is None:
+                query.build(self.archetypes.values())
+            else:
+                query.restore(members)
 
     def get_signal_for_component_addition(
         self, component_type: type[Component], maid: Maid
     ) -> Signal[tuple[Entity, Component]]:
-        signal = Signal[tuple[Entity, Component]]()
-
-        async def handler(args: tuple[Entity, Component]) -> None:
-            entity, component = args
-            if isinstance(component, component_type):
-                await signal.emit((entity, component))
-
-        maid.add(self.on_component_added.connect(handler))
-        return signal
+        return self._forward(self._added_router, component_type, maid)
 
     def get_signal_for_component_removal(
         self, component_type: type[Component], maid: Maid
     ) -> Signal[tuple[Entity, Component]]:
+        return self._forward(self._removed_router, component_type, maid)
+
+    def _forward(
+        self,
+        router: ComponentSignalRouter,
+        component_type: type[Component],
+        maid: Maid,
+    ) -> Signal[tuple[Entity, Component]]:
+        # Only events for the component type, or a subclass of it, reach
+        # the handler, so subscribers do not filter every event in the
+        # scene themselves.
         signal = Signal[tuple[Entity, Component]]()
 
         async def handler(args: tuple[Entity, Component]) -> None:
-            entity, component = args
-            if isinstance(component, component_type):
-                await signal.emit((entity, component))
+            await signal.emit(args)
 
-        maid.add(self.on_component_removed.connect(handler))
+        maid.add(router.signal(component_type).connect(handler))
         return signal
 
     @overload
     def query(
-        self, component_type: type[C1]
+        self,
+        component_type: type[C1] | Maybe[C1],
+        *,
+        without: Iterable[type[Component]] = (),
+        changed: ChangedTerms = (),
     ) -> Iterable[tuple[Entity, tuple[C1]]]: ...
 
     @overload
     def query(
-        self, first_component_type: type[C1], second_component_type: type[C2]
+        self,
+        first_component_type: type[C1] | Maybe[C1],
+        second_component_type: type[C2] | Maybe[C2],
+        *,
+        without: Iterable[type[Component]] = (),
+        changed: ChangedTerms = (),
     ) -> Iterable[tuple[Entity, tuple[C1, C2]]]: ...
 
     @overload
     def query(
         self,
-        first_component_type: type[C1],
-        second_component_type: type[C2],
-        third_component_type: type[C3],
+        first_component_type: type[C1] | Maybe[C1],
+        second_component_type: type[C2] | Maybe[C2],
+        third_component_type: type[C3] | Maybe[C3],
+        *,
+        without: Iterable[type[Component]] = (),
+        changed: ChangedTerms = (),
     ) -> Iterable[tuple[Entity, tuple[C1, C2, C3]]]: ...
 
     @overload
     def query(
         self,
-        first_component_type: type[C1],
-        second_component_type: type[C2],
-        third_component_type: type[C3],
-        fourth_component_type: type[C4],
+        first_component_type: type[C1] | Maybe[C1],
+        second_component_type: type[C2] | Maybe[C2],
+        third_component_type: type[C3] | Maybe[C3],
+        fourth_component_type: type[C4] | Maybe[C4],
+        *,
+        without: Iterable[type[Component]] = (),
+        changed: ChangedTerms = (),
     ) -> Iterable[tuple[Entity, tuple[C1, C2, C3, C4]]]: ...
 
     # https://discuss.python.org/t/pre-pep-considerations-and-feedback-type-transformations-on-variadic-generics/50605
     def query(  # type: ignore
-        self, *classes: type[Component]
-    ) -> Iterable[tuple[Entity, tuple[Component, ...]]]:
-        if self._query_cache.get(classes) is not None:
-            yield from self._query_cache[classes]
-            return
-        results: list[tuple[Entity, tuple[Component, ...]]] = []
-        for entity_id, components in self.components.items():
-            if all(
-                component_type in components.keys()
-                for component_type in classes
-            ):
-                entity = self.entities[entity_id]
-                components_tuple = tuple(
-                    components[component_type] for component_type in classes
+        self,
+        *terms: QueryTerm,
+        without: Iterable[type[Component]] = (),
+        changed: ChangedTerms = (),
+    ) -> Iterable[QueryRow]:
+        query = self._get_query(terms, without)
+        if changed:
+            yield from self._changed_rows(query, changed)
+        else:
+            yield from query.results()
+
+    def _changed_rows(
+        self, query: Query, changed: ChangedTerms
+    ) -> list[QueryRow]:
+        # Only rows where one of the given components was written since the
+        # running processor last ran, or every row outside of a processor.
+        component_types = (
+            (changed,) if isinstance(changed, type) else tuple(changed)
+        )
+        positions: list[int] = []
+        for component_type in component_types:
+            if component_type not in query.terms:
+                raise ValueError(
+                    f"Changes to {component_type.__name__} can only be "
+                    f"tracked when it is a required term of {query}."
                 )
-                results.append((entity, components_tuple))
-                yield (entity, components_tuple)
-        self._query_cache[classes] = results
+            positions.append(query.terms.index(component_type))
+        rows = query.results()
+        since = last_run_tick()
+        if not rows or since == 0:
+            return rows
+        stores = [
+            self.column_stores.get(component_type)
+            if self.columnar and component_type.columnar_fields
+            else None
+            for component_type in component_types
+        ]
+        if all(store is not None for store in stores):
+            indices = query.indices()
+            mask = np.zeros(len(indices), dtype=np.bool_)
+            for store in stores:
+                assert store is not None
+                mask |= store.changed[indices] > since
+            return [rows[row] for row in np.flatnonzero(mask)]
+        return [
+            row
+            for row in rows
+            if any(
+                cast(Component, row[1][position]).last_changed() > since
+                for position in positions
+            )
+        ]
+
+    def query_indices(
+        self,
+        *terms: QueryTerm,
+        without: Iterable[type[Component]] = (),
+    ) -> np.ndarray:
+        return self._get_query(terms, without).indices()
+
+    def query_count(
+        self,
+        *terms: QueryTerm,
+        without: Iterable[type[Component]] = (),
+    ) -> int:
+        return len(self._get_query(terms, without))
 
     @overload
     def query_one(
-        self, component_type: type[C1]
+        self,
+        component_type: type[C1] | Maybe[C1],
+        *,
+        without: Iterable[type[Component]] = (),
     ) -> tuple[Entity, tuple[C1]] | None: ...
 
     @overload
     def query_one(
-        self, first_component_type: type[C1], second_component_type: type[C2]
+        self,
+        first_component_type: type[C1] | Maybe[C1],
+        second_component_type: type[C2] | Maybe[C2],
+        *,
+        without: Iterable[type[Component]] = (),
     ) -> tuple[Entity, tuple[C1, C2]] | None: ...
 
     @overload
     def query_one(
         self,
-        first_component_type: type[C1],
-        second_component_type: type[C2],
-        third_component_type: type[C3],
+        first_component_type: type[C1] | Maybe[C1],
+        second_component_type: type[C2] | Maybe[C2],
+        third_component_type: type[C3] | Maybe[C3],
+        *,
+        without: Iterable[type[Component]] = (),
     ) -> tuple[Entity, tuple[C1, C2, C3]] | None: ...
 
     @overload
     def query_one(
         self,
-        first_component_type: type[C1],
-        second_component_type: type[C2],
-        third_component_type: type[C3],
-        fourth_component_type: type[C4],
+        first_component_type: type[C1] | Maybe[C1],
+        second_component_type: type[C2] | Maybe[C2],
+        third_component_type: type[C3] | Maybe[C3],
+        fourth_component_type: type[C4] | Maybe[C4],
+        *,
+        without: Iterable[type[Component]] = (),
     ) -> tuple[Entity, tuple[C1, C2, C3, C4]] | None: ...
 
     def query_one(  # type: ignore
-        self, *classes: type[Component]
-    ) -> tuple[Entity, tuple[Component, ...]] | None:
-        if self._query_one_cache.get(classes) is not None:
-            return self._query_one_cache[classes]
-        for entity_id, components in self.components.items():
-            if all(
-                component_type in components.keys()
-                for component_type in classes
-            ):
-                entity = self.entities[entity_id]
-                components_tuple = tuple(
-                    components[component_type] for component_type in classes
-                )
-                self._query_one_cache[classes] = (entity, components_tuple)
-                return (entity, components_tuple)
-        return None
+        self,
+        *terms: QueryTerm,
+        without: Iterable[type[Component]] = (),
+    ) -> QueryRow | None:
+        return self._get_query(terms, without).first()
 
 
 class Processor:
@@ -252,6 +859,31 @@ class Processor:
     debug_only: bool = (
         False
     )
+    # Processors that need the event loop, for example to emit signals or
+    # load images, never leave the main thread, see `ExecutionBackend`.
+    main_thread: bool = False
+    # Processors that only work on column stores can run their work in a
+    # worker process instead, see `offload`.
+    offloadable: bool = False
+    # Processors that do not need to run on every tick run only once every
+    # `rate` ticks, or at most `frequency` times a second. The `phase` is
+    # the tick of the first run, counted from when the processor is added,
+    # and is chosen to spread processors out over the ticks when None.
+    rate: int = 1
+    frequency: float | None = None
+    phase: int | None = None
+    # The query the processor does its work on. When it matches no entity,
+    # the scheduler skips the processor without running it at all.
+    primary_query: tuple[QueryTerm, ...] = ()
+    # Processors below NORMAL priority can be deferred to a later tick when
+    # a tick is about to go over the frame budget, see `ProcessorPriority`.
+    priority: ProcessorPriority = ProcessorPriority.NORMAL
+    # Processors that advance the simulation run with the same delta time
+    # every time, as many times a tick as the simulation rate asks for,
+    # before the rest of the tick. See `Options.simulation_rate`.
+    fixed_step: bool = False
+    # The change tick this processor last ran at, used by changed queries.
+    last_run_tick: int = 0
 
     def __init__(self) -> None:
         self.maid = Maid()
@@ -278,6 +910,20 @@ class Processor:
     ) -> None:
         raise NotImplementedError
 
+    def offload(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> OffloadJob | None:
+        """
+        The work of this tick as a job for a worker process, or None when
+        there is nothing to do. Called on the main thread in place of
+        `update` when processors are offloaded, and only for processors
+        that are offloadable.
+        """
+        raise NotImplementedError
+
     def __repr__(self) -> str:
         return f"<Processor {self.__class__.__name__}>"
 
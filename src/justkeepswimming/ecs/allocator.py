@@ -0,0 +1,62 @@
+class EntityAllocator:
+    """
+    Hands out entity indices together with a generation. Deleted indices go
+    onto a free list and are reused by later entities with a bumped
+    generation, so a handle to a deleted entity can never be mistaken for
+    the entity that took over its index.
+    """
+
+    __slots__ = ("generations", "_free")
+
+    def __init__(self) -> None:
+        self.generations: list[int] = []
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.generations) - len(self._free)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.generations)
+
+    def allocate(self) -> tuple[int, int]:
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self.generations)
+            self.generations.append(0)
+        return index, self.generations[index]
+
+    def release(self, index: int) -> None:
+        self.generations[index] += 1
+        self._free.append(index)
+
+    def state(self) -> tuple[list[int], list[int]]:
+        return list(self.generations), list(self._free)
+
+    def restore(self, generations: list[int], free: list[int]) -> None:
+        # Indices that were free in the restored state, or did not exist
+        # yet, stay free. Those handed out since are released with a
+        # bumped generation so their handles go stale.
+        current = self.generations
+        current_free = set(self._free)
+        restored = list(generations)
+        for index in free:
+            restored[index] = max(
+                generations[index],
+                current[index] + (index not in current_free),
+            )
+        released = range(len(generations), len(current))
+        restored.extend(
+            current[index] + (index not in current_free)
+            for index in released
+        )
+        self.generations = restored
+        self._free = list(free)
+        self._free.extend(reversed(released))
+
+    def is_alive(self, index: int, generation: int) -> bool:
+        return (
+            index < len(self.generations)
+            and self.generations[index] == generation
+        )
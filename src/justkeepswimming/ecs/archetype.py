@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs import Component, Entity
+
+
+class Archetype:
+    """
+    A table of every entity that has exactly the same set of component types.
+    Components are stored column-wise so queries can walk tightly packed rows
+    instead of looking up each component type on each entity.
+    """
+
+    __slots__ = (
+        "component_types",
+        "entities",
+        "columns",
+        "rows",
+        "add_edges",
+        "remove_edges",
+    )
+
+    def __init__(self, component_types: frozenset[type[Component]]) -> None:
+        self.component_types = component_types
+        self.entities: list[Entity] = []
+        self.columns: dict[type[Component], list[Component]] = {
+            component_type: [] for component_type in component_types
+        }
+        self.rows: dict[int, int] = {}
+        self.add_edges: dict[type[Component], Archetype] = {}
+        self.remove_edges: dict[type[Component], Archetype] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __repr__(self) -> str:
+        names = ", ".join(
+            sorted(
+                component_type.__name__
+                for component_type in self.component_types
+            )
+        )
+        return f"<Archetype {{{names}}} ({len(self.entities)} entities)>"
+
+    def append(
+        self,
+        entity: Entity,
+        components: dict[type[Component], Component],
+    ) -> int:
+        row = len(self.entities)
+        self.entities.append(entity)
+        for component_type, column in self.columns.items():
+            column.append(components[component_type])
+        self.rows[entity.id] = row
+        return row
+
+    def pop(self, entity: Entity) -> dict[type[Component], Component]:
+        # Swap the last row into the hole so the columns stay packed.
+        row = self.rows.pop(entity.id)
+        last = len(self.entities) - 1
+        components: dict[type[Component], Component] = {}
+        for component_type, column in self.columns.items():
+            components[component_type] = column[row]
+            if row != last:
+                column[row] = column[last]
+            column.pop()
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.rows[moved.id] = row
+        self.entities.pop()
+        return components
+
+    def get(
+        self, entity: Entity, component_type: type[Component]
+    ) -> Component:
+        return self.columns[component_type][self.rows[entity.id]]
+
+    def set(self, entity: Entity, component: Component) -> None:
+        self.columns[type(component)][self.rows[entity.id]] = component
+
+    def components(
+        self, entity: Entity
+    ) -> dict[type[Component], Component]:
+        row = self.rows[entity.id]
+        return {
+            component_type: column[row]
+            for component_type, column in self.columns.items()
+        }
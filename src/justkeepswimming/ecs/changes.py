@@ -0,0 +1,60 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any
+
+# A single counter shared by every scene. The scheduler advances it around
+# every processor run, so a processor can tell the writes that happened
+# since it last ran apart from the ones it has already seen.
+_change_tick = 1
+# Processors of one layer may run on several threads at once.
+_change_tick_lock = threading.Lock()
+
+# The (last run, this run) ticks of the processor running in the current
+# task, or None outside of a processor.
+_processor_ticks: ContextVar[tuple[int, int] | None] = ContextVar(
+    "processor_ticks", default=None
+)
+
+
+def advance_change_tick() -> int:
+    global _change_tick
+    with _change_tick_lock:
+        _change_tick += 1
+        return _change_tick
+
+
+def current_change_tick() -> int:
+    ticks = _processor_ticks.get()
+    return _change_tick if ticks is None else ticks[1]
+
+
+def last_run_tick() -> int:
+    ticks = _processor_ticks.get()
+    return 0 if ticks is None else ticks[0]
+
+
+def begin_processor_run(last_run: int) -> tuple[int, Token[Any]]:
+    """
+    Start a processor run without a context manager, for the scheduler,
+    which runs every processor every tick. `end_processor_run` has to be
+    called with the token once it is done.
+    """
+    this_run = advance_change_tick()
+    return this_run, _processor_ticks.set((last_run, this_run))
+
+
+def end_processor_run(token: Token[Any]) -> None:
+    _processor_ticks.reset(token)
+    # Writes made after the processor finished must look new to it.
+    advance_change_tick()
+
+
+@contextmanager
+def processor_run(last_run: int) -> Iterator[int]:
+    this_run, token = begin_processor_run(last_run)
+    try:
+        yield this_run
+    finally:
+        end_processor_run(token)
@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import types
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, get_type_hints
+
+import numpy as np
+from pygame import Vector2
+
+from justkeepswimming.ecs.offload import SharedColumnMemory
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs import Component
+
+logger = logging.getLogger(__name__)
+
+INITIAL_CAPACITY = 64
+
+# Vector2 methods that change the vector they are called on rather than
+# returning a new one.
+IN_PLACE_METHODS = frozenset({"scale_to_length", "from_polar"})
+
+
+def rotate_degrees(
+    vectors: np.ndarray, degrees: np.ndarray, epsilon: float = 1e-6
+) -> np.ndarray:
+    """
+    Rotate each row of ``vectors`` by the matching angle, exactly like
+    `Vector2.rotate`, including its special cases for quarter turns.
+    """
+    angles = np.fmod(np.radians(degrees), 2 * np.pi)
+    angles = np.where(angles < 0, angles + 2 * np.pi, angles)
+    x = vectors[:, 0]
+    y = vectors[:, 1]
+    sin = np.sin(angles)
+    cos = np.cos(angles)
+    rotated = np.empty_like(vectors)
+    rotated[:, 0] = cos * x - sin * y
+    rotated[:, 1] = sin * x + cos * y
+    quarter = np.fmod(angles + epsilon, np.pi / 2) < 2 * epsilon
+    if quarter.any():
+        turns = ((angles + epsilon) / (np.pi / 2)).astype(np.intp) % 4
+        quarter_turns = ((x, y), (-y, x), (-x, -y), (y, -x))
+        for turn, (new_x, new_y) in enumerate(quarter_turns):
+            mask = quarter & (turns == turn)
+            rotated[mask, 0] = new_x[mask]
+            rotated[mask, 1] = new_y[mask]
+    return rotated
+
+
+class ColumnException(Exception):
+    pass
+
+
+class VectorView:
+    """
+    A Vector2-like window onto one row of a two-wide column. Reads and
+    writes go straight to the array, so code written against Vector2 fields
+    keeps working when the component lives in a column store.
+    """
+
+    __slots__ = ("store", "name", "index")
+
+    def __init__(self, store: ColumnStore, name: str, index: int) -> None:
+        self.store = store
+        self.name = name
+        self.index = index
+
+    @property
+    def x(self) -> float:
+        return float(self.store.arrays[self.name][self.index, 0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self.store.arrays[self.name][self.index, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.store.arrays[self.name][self.index, 1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self.store.arrays[self.name][self.index, 1] = value
+
+    def copy(self) -> Vector2:
+        x, y = self.store.arrays[self.name][self.index]
+        return Vector2(float(x), float(y))
+
+    def update(self, *args: Any) -> None:
+        vector = Vector2(*args)
+        row = self.store.arrays[self.name][self.index]
+        row[0] = vector.x
+        row[1] = vector.y
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything else that Vector2 offers runs on a snapshot, which is
+        # then written back for the methods that work in place. Protocol
+        # lookups, such as the ones `copy` makes, are left to the view, so
+        # a copied view keeps pointing at its, likewise copied, store.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        vector = self.copy()
+        attribute = getattr(vector, name)
+        if not callable(attribute) or not (
+            name.endswith("_ip") or name in IN_PLACE_METHODS
+        ):
+            return attribute
+
+        def in_place(*args: Any, **kwargs: Any) -> Any:
+            result = attribute(*args, **kwargs)
+            self.update(vector)
+            return result
+
+        return in_place
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.copy())
+
+    def __getitem__(self, key: int) -> float:
+        return float(self.store.arrays[self.name][self.index, key])
+
+    def __setitem__(self, key: int, value: float) -> None:
+        self.store.arrays[self.name][self.index, key] = value
+
+    def __eq__(self, other: object) -> bool:
+        return self.copy() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __bool__(self) -> bool:
+        return bool(self.copy())
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def __str__(self) -> str:
+        return str(self.copy())
+
+    def __neg__(self) -> Vector2:
+        return -self.copy()
+
+    def __pos__(self) -> Vector2:
+        return self.copy()
+
+    def __add__(self, other: Any) -> Vector2:
+        return self.copy() + other
+
+    def __radd__(self, other: Any) -> Vector2:
+        return other + self.copy()
+
+    def __sub__(self, other: Any) -> Vector2:
+        return self.copy() - other
+
+    def __rsub__(self, other: Any) -> Vector2:
+        return other - self.copy()
+
+    def __mul__(self, other: Any) -> Any:
+        return self.copy() * other
+
+    def __rmul__(self, other: Any) -> Any:
+        return other * self.copy()
+
+    def __truediv__(self, other: Any) -> Vector2:
+        return self.copy() / other
+
+    def __floordiv__(self, other: Any) -> Vector2:
+        return self.copy() // other
+
+    def __iadd__(self, other: Any) -> VectorView:
+        self.update(self.copy() + other)
+        return self
+
+    def __isub__(self, other: Any) -> VectorView:
+        self.update(self.copy() - other)
+        return self
+
+    def __imul__(self, other: Any) -> VectorView:
+        self.update(self.copy() * other)
+        return self
+
+    def __itruediv__(self, other: Any) -> VectorView:
+        self.update(self.copy() / other)
+        return self
+
+
+class ColumnField:
+    """
+    Installed on a component class in place of one of its dataclass fields.
+    Detached components keep the value in the slot the field replaced, or
+    in their ``__dict__`` if the class is not slotted; attached ones read
+    and write the column store they are bound to.
+    """
+
+    __slots__ = ("name", "width", "slot")
+
+    def __init__(
+        self, name: str, width: int, slot: Any | None = None
+    ) -> None:
+        self.name = name
+        self.width = width
+        self.slot = slot
+
+    def __get__(self, instance: Component | None, owner: type) -> Any:
+        if instance is None:
+            return self
+        store = instance.column_store
+        if store is None:
+            return self.load(instance)
+        if self.width == 1:
+            return float(store.arrays[self.name][instance.column_index])
+        return VectorView(store, self.name, instance.column_index)
+
+    def __set__(self, instance: Component, value: Any) -> None:
+        store = instance.column_store
+        if store is None:
+            self.save(instance, value)
+        elif self.width == 1:
+            store.arrays[self.name][instance.column_index] = value
+        else:
+            row = store.arrays[self.name][instance.column_index]
+            row[0] = value[0]
+            row[1] = value[1]
+
+    def load(self, instance: Component) -> Any:
+        if self.slot is None:
+            return instance.__dict__[self.name]
+        return self.slot.__get__(instance, type(instance))
+
+    def save(self, instance: Component, value: Any) -> None:
+        if self.slot is None:
+            instance.__dict__[self.name] = value
+        else:
+            self.slot.__set__(instance, value)
+
+    def clear(self, instance: Component) -> Any:
+        # Hands the value over to a column store, so the component does not
+        # keep a stale copy alive while it is attached.
+        value = self.load(instance)
+        if self.slot is None:
+            del instance.__dict__[self.name]
+        else:
+            self.slot.__delete__(instance)
+        return value
+
+
+def column_widths(component_type: type[Component]) -> dict[str, int]:
+    hints = get_type_hints(component_type)
+    field_names = {field.name for field in dataclasses.fields(component_type)}
+    widths: dict[str, int] = {}
+    for name in component_type.columnar_fields:
+        if name not in field_names:
+            raise ColumnException(
+                f"{component_type.__name__} has no dataclass field {name}."
+            )
+        hint = hints.get(name)
+        if hint is float:
+            widths[name] = 1
+        elif hint is Vector2:
+            widths[name] = 2
+        else:
+            raise ColumnException(
+                f"Field {component_type.__name__}.{name} must be a float or "
+                f"a Vector2 to be stored in a column, not {hint}."
+            )
+    return widths
+
+
+def install_column_fields(
+    component_type: type[Component], widths: dict[str, int]
+) -> dict[str, ColumnField]:
+    # The descriptors are shared by every scene, and fall back to ordinary
+    # attribute storage for components that are not in a column store.
+    fields: dict[str, ColumnField] = {}
+    for name, width in widths.items():
+        existing = component_type.__dict__.get(name)
+        if isinstance(existing, ColumnField):
+            fields[name] = existing
+            continue
+        slot = (
+            existing
+            if isinstance(existing, types.MemberDescriptorType)
+            else None
+        )
+        fields[name] = ColumnField(name, width, slot)
+        setattr(component_type, name, fields[name])
+    return fields
+
+
+class ColumnStore:
+    """
+    Struct-of-arrays storage for the columnar fields of one component type.
+    Rows are indexed by entity index, so the columns of different component
+    types line up and can be combined with a single index array.
+    """
+
+    __slots__ = (
+        "component_type",
+        "widths",
+        "fields",
+        "arrays",
+        "occupied",
+        "changed",
+        "memory",
+    )
+
+    def __init__(
+        self,
+        component_type: type[Component],
+        capacity: int = INITIAL_CAPACITY,
+        shared: bool = False,
+    ) -> None:
+        self.component_type = component_type
+        self.widths = column_widths(component_type)
+        self.fields = install_column_fields(component_type, self.widths)
+        # Shared stores keep their arrays in shared memory, so processors
+        # can work on them from worker processes, see `ecs.offload`.
+        self.memory: SharedColumnMemory | None = None
+        self.arrays: dict[str, np.ndarray]
+        self.occupied: np.ndarray
+        # The change tick of each row, see `justkeepswimming.ecs.changes`.
+        self.changed: np.ndarray
+        self._allocate(capacity, shared)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.occupied))
+
+    def __repr__(self) -> str:
+        return (
+            f"<ColumnStore {self.component_type.__name__} "
+            f"({len(self)}/{self.capacity} rows)>"
+        )
+
+    @property
+    def capacity(self) -> int:
+        return len(self.occupied)
+
+    def _allocate(
+        self, capacity: int, shared: bool
+    ) -> SharedColumnMemory | None:
+        # Swaps in zeroed arrays. The caller copies what it needs over and
+        # then releases the shared memory of the old ones, if any.
+        previous = self.memory
+        if shared:
+            self.memory = SharedColumnMemory(
+                tuple(self.widths.items()), capacity
+            )
+            self.arrays, self.changed, self.occupied = self.memory.arrays()
+            return previous
+        self.memory = None
+        self.arrays = {
+            name: np.zeros(
+                (capacity, 2) if width == 2 else capacity, dtype=np.float64
+            )
+            for name, width in self.widths.items()
+        }
+        self.occupied = np.zeros(capacity, dtype=np.bool_)
+        self.changed = np.zeros(capacity, dtype=np.int64)
+        return previous
+
+    def _copy_rows(
+        self,
+        arrays: dict[str, np.ndarray],
+        occupied: np.ndarray,
+        changed: np.ndarray,
+    ) -> None:
+        count = min(len(occupied), self.capacity)
+        for name, array in arrays.items():
+            self.arrays[name][:count] = array[:count]
+        self.occupied[:count] = occupied[:count]
+        self.changed[:count] = changed[:count]
+
+    def _reallocate(
+        self,
+        capacity: int,
+        shared: bool,
+        arrays: dict[str, np.ndarray] | None = None,
+        occupied: np.ndarray | None = None,
+    ) -> None:
+        old = (self.arrays, self.occupied, self.changed)
+        memory = self._allocate(capacity, shared)
+        self._copy_rows(*old)
+        if arrays is not None and occupied is not None:
+            self._copy_rows(arrays, occupied, self.changed)
+        # Views of the old shared memory have to go before it can be closed.
+        del old
+        if memory is not None:
+            memory.release()
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.capacity:
+            return
+        new_capacity = self.capacity
+        while new_capacity < capacity:
+            new_capacity *= 2
+        self._reallocate(new_capacity, self.memory is not None)
+
+    def restore(
+        self, arrays: dict[str, np.ndarray], occupied: np.ndarray
+    ) -> None:
+        # Used by SceneContext.restore. The rows keep their change ticks,
+        # the restored components stamp their own afterwards.
+        self._reallocate(
+            len(occupied), self.memory is not None, arrays, occupied
+        )
+
+    def release(self) -> None:
+        """
+        Move a shared store back into private memory and free the shared
+        memory, which is not reclaimed otherwise until the game exits.
+        """
+        if self.memory is not None:
+            self._reallocate(self.capacity, False)
+
+    def attach(self, component: Component, index: int) -> None:
+        if component.column_store is not None:
+            raise ColumnException(
+                f"{component} is already stored in {component.column_store}."
+            )
+        self.reserve(index + 1)
+        for name, field in self.fields.items():
+            self.arrays[name][index] = field.clear(component)
+        self.occupied[index] = True
+        self.changed[index] = component.changed_tick
+        component.column_store = self
+        component.column_index = index
+
+    def detach(self, component: Component) -> None:
+        # Copy the values back so the component stays usable on its own,
+        # for example when a removed component is added to another entity.
+        index = component.column_index
+        for name, field in self.fields.items():
+            value = self.arrays[name][index]
+            if self.widths[name] == 1:
+                field.save(component, float(value))
+            else:
+                field.save(
+                    component, Vector2(float(value[0]), float(value[1]))
+                )
+        self.occupied[index] = False
+        component.changed_tick = int(self.changed[index])
+        component.column_store = None
+        component.column_index = -1
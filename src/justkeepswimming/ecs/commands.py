@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from enum import Enum, auto
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs import Component, Entity, SceneContext
+    from justkeepswimming.ecs.archetype import Archetype
+
+
+class CommandType(Enum):
+    SPAWN = auto()
+    DESPAWN = auto()
+    ADD = auto()
+    REMOVE = auto()
+
+
+type Command = tuple[CommandType, Entity, object]
+
+# Processors running on worker threads may reserve entities at the same
+# time. The lock lives here rather than on the buffer, which is deep copied
+# with its scene.
+_reserve_lock = threading.Lock()
+
+
+class CommandBuffer:
+    """
+    Records structural changes to a scene so they can be applied together.
+    The scheduler flushes the buffer between execution layers, so processors
+    that spawn, despawn or change entities mid-iteration never disturb the
+    queries that other processors in the same layer are walking.
+    """
+
+    __slots__ = ("context", "_commands")
+
+    def __init__(self, context: SceneContext) -> None:
+        self.context = context
+        self._commands: list[Command] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def spawn(
+        self, name: str, components: Iterable[Component] = ()
+    ) -> Entity:
+        # The handle is reserved straight away so that later commands in
+        # the same batch can refer to it.
+        with _reserve_lock:
+            entity = self.context.reserve_entity(name)
+        self._commands.append((CommandType.SPAWN, entity, tuple(components)))
+        return entity
+
+    def despawn(self, entity: Entity) -> None:
+        self._commands.append((CommandType.DESPAWN, entity, None))
+
+    def add_component(self, entity: Entity, component: Component) -> None:
+        self._commands.append((CommandType.ADD, entity, component))
+
+    def remove_component(
+        self, entity: Entity, component_type: type[Component]
+    ) -> None:
+        self._commands.append((CommandType.REMOVE, entity, component_type))
+
+    def clear(self) -> None:
+        self._commands.clear()
+
+    def flush(self) -> None:
+        if not self._commands:
+            return
+        commands, self._commands = self._commands, []
+        self.context.apply_commands(commands)
+
+
+class PendingEntity:
+    """The state of one entity while a batch of commands is replayed."""
+
+    __slots__ = ("entity", "source", "components", "changed", "despawned")
+
+    def __init__(
+        self,
+        entity: Entity,
+        source: Archetype | None,
+        components: dict[type[Component], Component],
+    ) -> None:
+        self.entity = entity
+        self.source = source
+        self.components = components
+        self.changed: set[type[Component]] = set()
+        self.despawned = False
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs import Processor
+
+
+class ProcessorPriority(IntEnum):
+    """
+    How readily the scheduler defers a processor when a tick is about to
+    go over its budget, lowest first. Processors at NORMAL or above are
+    never deferred.
+    """
+
+    LOWEST = 0
+    LOW = 1
+    NORMAL = 2
+
+
+class ProcessorCosts:
+    """Running estimates of how long each processor takes, in milliseconds."""
+
+    __slots__ = ("estimates", "smoothing")
+
+    def __init__(self, smoothing: float = 0.2) -> None:
+        self.estimates: dict[Processor, float] = {}
+        # The weight of the latest run, the rest goes to the ones before.
+        self.smoothing = smoothing
+
+    def observe(self, processor: Processor, milliseconds: float) -> None:
+        previous = self.estimates.get(processor)
+        if previous is None:
+            self.estimates[processor] = milliseconds
+        else:
+            self.estimates[processor] = previous + self.smoothing * (
+                milliseconds - previous
+            )
+
+    def estimate(self, processor: Processor) -> float:
+        # Processors that never ran are assumed to be free, so they run
+        # and get measured.
+        return self.estimates.get(processor, 0.0)
+
+    def forget(self, processor: Processor) -> None:
+        self.estimates.pop(processor, None)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs.columns import ColumnStore
+
+logger = logging.getLogger(__name__)
+
+# Worker processes keep the segments they have mapped open between jobs,
+# up to this many, so a job only maps the stores that have grown since.
+MAX_ATTACHED_SEGMENTS = 32
+
+type ColumnWidths = tuple[tuple[str, int], ...]
+type ColumnHandle = tuple[str, ColumnWidths, int]
+type Kernel = Callable[..., None]
+
+
+class OffloadException(Exception):
+    pass
+
+
+# Every segment this process has created and not released yet.
+_segments: set[SharedColumnMemory] = set()
+
+
+def column_bytes(widths: ColumnWidths, capacity: int) -> int:
+    row = sum(8 * width for _, width in widths) + 8 + 1
+    return row * capacity
+
+
+def column_arrays(
+    buffer: memoryview, widths: ColumnWidths, capacity: int
+) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    # The columns, the change ticks and the occupancy of a store, back to
+    # back. Both sides lay a segment out through here.
+    arrays: dict[str, np.ndarray] = {}
+    offset = 0
+    for name, width in widths:
+        shape = (capacity, 2) if width == 2 else (capacity,)
+        arrays[name] = np.ndarray(
+            shape, dtype=np.float64, buffer=buffer, offset=offset
+        )
+        offset += arrays[name].nbytes
+    changed = np.ndarray(
+        (capacity,), dtype=np.int64, buffer=buffer, offset=offset
+    )
+    offset += changed.nbytes
+    occupied = np.ndarray(
+        (capacity,), dtype=np.bool_, buffer=buffer, offset=offset
+    )
+    return arrays, changed, occupied
+
+
+class SharedColumnMemory:
+    """The arrays of a column store, in one shared memory segment."""
+
+    __slots__ = ("memory", "widths", "capacity")
+
+    def __init__(self, widths: ColumnWidths, capacity: int) -> None:
+        self.widths = widths
+        self.capacity = capacity
+        self.memory = SharedMemory(
+            create=True, size=max(column_bytes(widths, capacity), 1)
+        )
+        _segments.add(self)
+
+    def __repr__(self) -> str:
+        return f"<SharedColumnMemory {self.memory.name} ({self.capacity})>"
+
+    @property
+    def handle(self) -> ColumnHandle:
+        return (self.memory.name, self.widths, self.capacity)
+
+    def arrays(
+        self,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray]:
+        arrays, changed, occupied = column_arrays(
+            self.memory.buf, self.widths, self.capacity
+        )
+        for array in (*arrays.values(), changed, occupied):
+            array.fill(0)
+        return arrays, changed, occupied
+
+    def unlink(self) -> None:
+        # The segment is freed once the last mapping of it goes, while the
+        # mapping here keeps working.
+        if self in _segments:
+            _segments.discard(self)
+            self.memory.unlink()
+
+    def release(self) -> None:
+        self.unlink()
+        try:
+            self.memory.close()
+        except BufferError:
+            # Something still holds a view of the arrays. The mapping goes
+            # away with the last of them instead.
+            logger.debug(f"{self} is still in use, leaving it mapped.")
+
+
+class ColumnView:
+    """A column store as a worker process sees it: only its arrays."""
+
+    __slots__ = ("arrays", "changed", "occupied")
+
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        changed: np.ndarray,
+        occupied: np.ndarray,
+    ) -> None:
+        self.arrays = arrays
+        self.changed = changed
+        self.occupied = occupied
+
+
+class OffloadJob:
+    """
+    The work of an offloadable processor for one tick: a module level
+    kernel, the column stores it works on and any other arguments, which
+    are pickled and so should be small, such as index arrays.
+
+    The kernel is called as ``kernel(stores, *arguments)``, where
+    ``stores`` maps the keys of ``stores`` to objects with the ``arrays``,
+    ``changed`` and ``occupied`` of a `ColumnStore`.
+    """
+
+    __slots__ = ("kernel", "stores", "arguments")
+
+    def __init__(
+        self,
+        kernel: Kernel,
+        stores: dict[str, ColumnStore],
+        arguments: tuple[Any, ...] = (),
+    ) -> None:
+        self.kernel = kernel
+        self.stores = stores
+        self.arguments = arguments
+
+    def run(self) -> None:
+        """Run the kernel in this process."""
+        self.kernel(self.stores, *self.arguments)
+
+    def handles(self) -> dict[str, ColumnHandle]:
+        handles: dict[str, ColumnHandle] = {}
+        for key, store in self.stores.items():
+            if store.memory is None:
+                raise OffloadException(
+                    f"{store} is not in shared memory, so it cannot be "
+                    f"offloaded."
+                )
+            handles[key] = store.memory.handle
+        return handles
+
+
+_attached: dict[str, SharedMemory] = {}
+
+
+def _view(handle: ColumnHandle) -> ColumnView:
+    name, widths, capacity = handle
+    memory = _attached.get(name)
+    if memory is None:
+        # The main process owns the segment and unlinks it.
+        memory = SharedMemory(name, track=False)
+        _attached[name] = memory
+    return ColumnView(*column_arrays(memory.buf, widths, capacity))
+
+
+def run_job(
+    kernel: Kernel,
+    handles: dict[str, ColumnHandle],
+    arguments: tuple[Any, ...],
+) -> None:
+    """The entry point of a job in a worker process."""
+    stores = {key: _view(handle) for key, handle in handles.items()}
+    try:
+        kernel(stores, *arguments)
+    finally:
+        # The views have to go before their segments can be closed.
+        del stores
+        if len(_attached) > MAX_ATTACHED_SEGMENTS:
+            in_use = {name for name, _, _ in handles.values()}
+            for name in list(_attached):
+                if name not in in_use:
+                    _attached.pop(name).close()
+
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def process_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    # Shared by every scene. Workers are spawned rather than forked, so they
+    # do not inherit the window, the event loop or other threads.
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.debug(f"Started a pool of {_process_pool._max_workers} workers")
+    return _process_pool
+
+
+async def run_offloaded(job: OffloadJob, workers: int | None = None) -> None:
+    """Run a job in a worker process and wait for it to finish."""
+    future = process_pool(workers).submit(
+        run_job, job.kernel, job.handles(), job.arguments
+    )
+    await asyncio.wrap_future(future)
+
+
+def shutdown_offload() -> None:
+    """
+    Stop the worker processes and free the segments of every column store
+    still in shared memory. The stores keep working from their mappings.
+    """
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+    for segment in list(_segments):
+        # Arrays do not hold on to the mapping, so closing it would pull
+        # the memory out from under the stores.
+        segment.unlink()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs import Component, Entity
+    from justkeepswimming.ecs.archetype import Archetype
+
+C = TypeVar("C")
+
+
+@dataclass(frozen=True, slots=True)
+class Maybe(Generic[C]):
+    """A query term that yields None for entities without the component."""
+
+    component_type: type[C]
+
+    def __repr__(self) -> str:
+        return f"Maybe[{self.component_type.__name__}]"
+
+
+type QueryTerm = type[Component] | Maybe[Any]
+type QuerySignature = tuple[
+    tuple[QueryTerm, ...], frozenset[type[Component]]
+]
+type QueryRow = tuple[Entity, tuple[Component | None, ...]]
+
+
+class Query:
+    """
+    The live membership of one query signature. Structural changes to the
+    scene update the membership of the queries that mention the affected
+    component type, so every other query keeps its materialized results.
+    """
+
+    __slots__ = (
+        "terms",
+        "without",
+        "component_types",
+        "optional_types",
+        "archetypes",
+        "members",
+        "_results",
+        "_indices",
+    )
+
+    def __init__(
+        self,
+        terms: tuple[QueryTerm, ...],
+        without: frozenset[type[Component]] = frozenset(),
+    ) -> None:
+        self.terms = terms
+        self.without = without
+        self.component_types: frozenset[type[Component]] = frozenset(
+            term for term in terms if not isinstance(term, Maybe)
+        )
+        self.optional_types: frozenset[type[Component]] = frozenset(
+            term.component_type for term in terms if isinstance(term, Maybe)
+        )
+        self.archetypes: list[Archetype] = []
+        self.members: dict[int, QueryRow] = {}
+        self._results: list[QueryRow] | None = None
+        self._indices: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __repr__(self) -> str:
+        names = ", ".join(
+            repr(term) if isinstance(term, Maybe) else term.__name__
+            for term in self.terms
+        )
+        if self.without:
+            names += " without " + ", ".join(
+                sorted(component.__name__ for component in self.without)
+            )
+        return f"<Query ({names}) ({len(self.members)} entities)>"
+
+    @property
+    def signature(self) -> QuerySignature:
+        return self.terms, self.without
+
+    @property
+    def referenced_types(self) -> frozenset[type[Component]]:
+        # Adding or removing any of these can change the membership or the
+        # rows of the query.
+        return self.component_types | self.optional_types | self.without
+
+    def matches(self, archetype: Archetype) -> bool:
+        return archetype.component_types.issuperset(
+            self.component_types
+        ) and archetype.component_types.isdisjoint(self.without)
+
+    def _columns(
+        self, archetype: Archetype
+    ) -> list[list[Component] | None]:
+        return [
+            archetype.columns.get(term.component_type)
+            if isinstance(term, Maybe)
+            else archetype.columns[term]
+            for term in self.terms
+        ]
+
+    def row(self, entity: Entity, archetype: Archetype) -> QueryRow:
+        row = archetype.rows[entity.id]
+        return (
+            entity,
+            tuple(
+                None if column is None else column[row]
+                for column in self._columns(archetype)
+            ),
+        )
+
+    def build(self, archetypes: Iterable[Archetype]) -> None:
+        self.archetypes = [
+            archetype for archetype in archetypes if self.matches(archetype)
+        ]
+        rows: list[QueryRow] = []
+        for archetype in self.archetypes:
+            if not archetype.entities:
+                continue
+            columns = [
+                repeat(None) if column is None else column
+                for column in self._columns(archetype)
+            ]
+            rows.extend(
+                zip(
+                    archetype.entities,
+                    zip(*columns) if columns else repeat(()),
+                )
+            )
+        # Order by entity rather than by archetype so that the result does
+        # not depend on the order in which the archetypes were created.
+        rows.sort(key=lambda row: row[0].id)
+        self.members = {entity.id: (entity, row) for entity, row in rows}
+        self._invalidate()
+
+    def restore(self, members: dict[int, QueryRow]) -> None:
+        self.members = dict(members)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._results = None
+        self._indices = None
+
+    def update(self, entity: Entity, archetype: Archetype) -> None:
+        if self.matches(archetype):
+            self.insert(entity, archetype)
+        else:
+            self.discard(entity)
+
+    def insert(self, entity: Entity, archetype: Archetype) -> None:
+        self.members[entity.id] = self.row(entity, archetype)
+        self._invalidate()
+
+    def extend(self, entities: Iterable[Entity], archetype: Archetype) -> None:
+        columns = self._columns(archetype)
+        rows = archetype.rows
+        for entity in entities:
+            row = rows[entity.id]
+            self.members[entity.id] = (
+                entity,
+                tuple(
+                    None if column is None else column[row]
+                    for column in columns
+                ),
+            )
+        self._invalidate()
+
+    def discard(self, entity: Entity) -> None:
+        if self.members.pop(entity.id, None) is not None:
+            self._invalidate()
+
+    def results(self) -> list[QueryRow]:
+        # Handing out a snapshot keeps iteration safe while processors add
+        # or remove components part way through a loop.
+        if self._results is None:
+            self._results = list(self.members.values())
+        return self._results
+
+    def indices(self) -> np.ndarray:
+        # The entity indices of the members, in result order, for gathering
+        # rows out of column stores.
+        if self._indices is None:
+            self._indices = np.fromiter(
+                self.members, dtype=np.intp, count=len(self.members)
+            )
+        return self._indices
+
+    def first(self) -> QueryRow | None:
+        for row in self.members.values():
+            return row
+        return None
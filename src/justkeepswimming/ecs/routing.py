@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from justkeepswimming.utilities.signal import Signal
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs import Component, Entity
+
+type ComponentEvent = tuple[Entity, Component]
+
+
+class ComponentSignalRouter:
+    """
+    One signal per subscribed component type, next to a signal that fires
+    for every component. A component event fires the signals of the
+    component's own type and of any subscribed base types, so subscribers
+    never see, or pay for, events about other types.
+    """
+
+    __slots__ = ("catch_all", "_signals", "_routes")
+
+    def __init__(self, catch_all: Signal[ComponentEvent]) -> None:
+        self.catch_all = catch_all
+        self._signals: dict[type[Component], Signal[ComponentEvent]] = {}
+        # The signals to fire for each concrete component type, resolved
+        # over its MRO the first time an event for that type is routed.
+        self._routes: dict[
+            type[Component], tuple[Signal[ComponentEvent], ...]
+        ] = {}
+
+    def signal(
+        self, component_type: type[Component]
+    ) -> Signal[ComponentEvent]:
+        signal = self._signals.get(component_type)
+        if signal is None:
+            signal = Signal[ComponentEvent]()
+            self._signals[component_type] = signal
+            self._routes.clear()
+        return signal
+
+    def route(
+        self, component_type: type[Component]
+    ) -> tuple[Signal[ComponentEvent], ...]:
+        route = self._routes.get(component_type)
+        if route is None:
+            route = tuple(
+                self._signals[base]
+                for base in component_type.__mro__
+                if base in self._signals
+            )
+            self._routes[component_type] = route
+        return route
+
+    def emissions(
+        self, entity: Entity, component: Component
+    ) -> Iterator[tuple[Signal[Any], tuple[Any, ...]]]:
+        args = ((entity, component),)
+        yield self.catch_all, args
+        for signal in self.route(type(component)):
+            if signal.connections:
+                yield signal, args
@@ -1,6 +1,12 @@
 import asyncio
 import copy
+import heapq
 import logging
+import math
+import os
+import time
+from collections.abc import Callable, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Set, Type
 
 from justkeepswimming.datatypes.dag import (
@@ -9,11 +15,43 @@ from justkeepswimming.datatypes.dag import (
 )
 from justkeepswimming.debug.scopes import ProfilerScope
 from justkeepswimming.ecs import Component, Processor, SceneContext
+from justkeepswimming.ecs.changes import (
+    begin_processor_run,
+    end_processor_run,
+    processor_run,
+)
+from justkeepswimming.ecs.costs import ProcessorCosts, ProcessorPriority
+from justkeepswimming.ecs.offload import run_offloaded
+from justkeepswimming.ecs.query import Query
 from justkeepswimming.systems.clock import TickContext
 from justkeepswimming.utilities.context import EngineContext
+from justkeepswimming.utilities.launch import ExecutionBackend
 
 logger = logging.getLogger(__name__)
 
+type StepRun = Callable[
+    [TickContext, SceneContext, EngineContext], Coroutine[Any, Any, None]
+]
+
+# The critical path is planned again once the estimated cost of a processor
+# moves this far, relative to the one it was planned with, or at least
+# PLAN_DRIFT_MS.
+PLAN_DRIFT = 0.25
+PLAN_DRIFT_MS = 0.05
+
+# Low priority processors that have not run for this many ticks are not
+# deferred again, however far over budget the tick is.
+MAX_DEFERRED_TICKS = 8
+
+# The most simulation steps a tick runs. A tick that is further behind than
+# that leaves the rest of the time out of the simulation.
+MAX_SIMULATION_STEPS = 5
+
+# Shared by every scene, since a scene that is being left may still finish
+# a tick after it has been cleaned up.
+_thread_pool: ThreadPoolExecutor | None = None
+_thread_pool_workers = 0
+
 
 class SchedulerException(Exception):
     pass
@@ -31,6 +69,163 @@ class SystemConflictException(SchedulerException):
     pass
 
 
+class MainThreadRequiredException(SchedulerException):
+    pass
+
+
+class InvalidRateException(SchedulerException):
+    pass
+
+
+class FixedStepOrderException(SchedulerException):
+    pass
+
+
+def run_to_completion(coroutine: Coroutine[Any, Any, None]) -> None:
+    """
+    Run a coroutine without an event loop, as worker threads have none.
+    Processors normally only await other coroutines, which never suspend,
+    so anything that waits on a future has to run on the main thread.
+    """
+    try:
+        while coroutine.send(None) is None:
+            # A bare yield, as in asyncio.sleep(0), just asks to be resumed.
+            pass
+    except StopIteration:
+        return
+    coroutine.close()
+    raise MainThreadRequiredException(
+        "A processor waited on the event loop from a worker thread, "
+        "set main_thread on it."
+    )
+
+
+class ProcessorPacing:
+    """
+    The ticks a processor with a rate or a frequency has skipped since it
+    last ran, and the time they took.
+    """
+
+    __slots__ = ("phase", "slot", "frames", "delta", "started")
+
+    def __init__(self, phase: int, slot: int) -> None:
+        self.phase = phase
+        # The tick of the scheduler, modulo the rate, that it runs on.
+        self.slot = slot
+        self.frames = 0
+        self.delta = 0.0
+        self.started = False
+
+    def due(self, processor: Processor) -> bool:
+        if not self.started:
+            return self.frames > self.phase
+        if processor.frequency is not None:
+            # Within rounding, as ticks rarely add up to a period exactly.
+            return self.delta * processor.frequency > 1 - 1e-6
+        return self.frames >= processor.rate
+
+
+class CriticalPathPlan:
+    """
+    The processors of an execution order, ranked by the estimated cost of
+    the longest path from each one to the end of the tick.
+    """
+
+    __slots__ = (
+        "order",
+        "costs",
+        "ranks",
+        "sequence",
+        "dependencies",
+        "dependents",
+    )
+
+    def __init__(
+        self,
+        order: list[Set[Processor]],
+        costs: Dict[Processor, float],
+        ranks: Dict[Processor, float],
+        dependencies: Dict[Processor, list[Processor]],
+        dependents: Dict[Processor, list[Processor]],
+    ) -> None:
+        self.order = order
+        self.costs = costs
+        self.ranks = ranks
+        # Ties between ranks go to the order the processors were ranked in,
+        # which keeps the processors themselves from being compared.
+        self.sequence = {
+            processor: index for index, processor in enumerate(ranks)
+        }
+        self.dependencies = dependencies
+        self.dependents = dependents
+
+    def drifted(self, costs: ProcessorCosts) -> bool:
+        for processor, planned in self.costs.items():
+            difference = abs(costs.estimate(processor) - planned)
+            if difference > max(planned * PLAN_DRIFT, PLAN_DRIFT_MS):
+                return True
+        return False
+
+
+class PlanStep:
+    """A processor of an execution plan, bound to what running it takes."""
+
+    __slots__ = ("processor", "name", "query", "run")
+
+    def __init__(
+        self, processor: Processor, query: Query | None, run: StepRun
+    ) -> None:
+        self.processor = processor
+        self.name = type(processor).__name__
+        # Whether the processor has anything to do, see `primary_query`.
+        self.query = query
+        self.run = run
+
+
+class ExecutionPlan:
+    """
+    An execution order compiled for the settings it was compiled with.
+    Processors that do not run in this mode are left out, and the rest
+    are bound to their queries and to a run that does no more than those
+    settings ask for, so a tick looks none of it up again.
+    """
+
+    __slots__ = (
+        "order",
+        "key",
+        "steps",
+        "layers",
+        "groups",
+        "simulation",
+        "critical_path",
+    )
+
+    def __init__(
+        self,
+        order: list[Set[Processor]],
+        key: tuple[Any, ...],
+        steps: Dict[Processor, PlanStep],
+    ) -> None:
+        self.order = order
+        self.key = key
+        self.steps = steps
+        self.layers: list[tuple[PlanStep, ...]] = []
+        for layer in order:
+            plan_layer = tuple(
+                steps[processor] for processor in layer if processor in steps
+            )
+            if plan_layer:
+                self.layers.append(plan_layer)
+        # The same layers as sets, for the backends that pick processors
+        # out of them.
+        self.groups: list[Set[Processor]] = [
+            {step.processor for step in layer} for layer in self.layers
+        ]
+        # The fixed step processors, when they run in a phase of their own.
+        self.simulation: ExecutionPlan | None = None
+        self.critical_path: CriticalPathPlan | None = None
+
+
 class ProcessorScheduler:
     def __init__(
         self, scene_context: SceneContext, engine_context: EngineContext
@@ -39,6 +234,24 @@ class ProcessorScheduler:
         self._nodes: Dict[Processor, DirectedAcyclicGraphNode[Processor]] = {}
         self._graph: DirectedAcyclicGraph[Processor] = DirectedAcyclicGraph()
         self._execution_order: list[Set[Processor]] = []
+        # The graph is kept up to date as processors are added, but only
+        # rebuilt from scratch after a removal, and the execution order is
+        # only sorted again once it is needed.
+        self._graph_stale = False
+        self._order_stale = False
+        # Processors that skip ticks, see `Processor.rate`, and for this
+        # tick the ones that sit it out and the contexts of those that run.
+        self._pacing: Dict[Processor, ProcessorPacing] = {}
+        self._idle: Set[Processor] = set()
+        self._tick_contexts: Dict[Processor, TickContext] = {}
+        self._ticks = 0
+        # Low priority processors put off to keep within the frame budget,
+        # with the ticks they missed.
+        self.costs = ProcessorCosts()
+        self._deferred: Dict[Processor, TickContext] = {}
+        self._compiled: ExecutionPlan | None = None
+        # The time the simulation is behind, less than a step after a tick.
+        self._accumulator = 0.0
         self.engine_context = engine_context
         self.scene_context = scene_context
         self.profiler = engine_context.profiler
@@ -55,6 +268,11 @@ class ProcessorScheduler:
         new_scheduler._execution_order = copy.deepcopy(
             self._execution_order, memo
         )
+        new_scheduler._graph_stale = self._graph_stale
+        new_scheduler._order_stale = self._order_stale
+        new_scheduler._pacing = copy.deepcopy(self._pacing, memo)
+        new_scheduler._ticks = self._ticks
+        new_scheduler._accumulator = self._accumulator
         return new_scheduler
 
     def _fmt_components(self, components: frozenset[Type[Component]]) -> str:
@@ -65,58 +283,820 @@ class ProcessorScheduler:
             processor.maid.cleanup()
             processor.teardown(self.scene_context, self.engine_context)
 
+    def _thread_pool(self) -> ThreadPoolExecutor | None:
+        global _thread_pool, _thread_pool_workers
+        options = self.engine_context.options
+        if options.execution_backend is ExecutionBackend.ASYNCIO:
+            return None
+        if _thread_pool is None:
+            # The same default as ThreadPoolExecutor's, worked out here so
+            # the critical path backend knows how many threads it has.
+            _thread_pool_workers = options.worker_threads or min(
+                32, (os.process_cpu_count() or 1) + 4
+            )
+            _thread_pool = ThreadPoolExecutor(
+                _thread_pool_workers, thread_name_prefix="processor"
+            )
+        return _thread_pool
+
     async def process_tick(
         self,
         tick_context: TickContext,
         scene_context: SceneContext,
         engine_context: EngineContext,
     ) -> None:
-        for system_group in self._execution_order:
+        # Structural changes recorded between ticks, or by the processors of
+        # a layer, are applied before the next layer starts iterating.
+        started = time.perf_counter()
+        scene_context.commands.flush()
+        plan = self._execution_plan()
+        if plan.simulation is None:
+            self._pace(tick_context)
+            await self._run_phase(
+                plan, started, tick_context, scene_context, engine_context
+            )
+            return
+        rate = engine_context.options.simulation_rate
+        assert rate is not None
+        step = TickContext(1 / rate)
+        self._accumulator += tick_context.delta_time
+        steps = 0
+        # Within rounding, as ticks rarely add up to a step exactly.
+        while self._accumulator * rate > 1 - 1e-6:
+            if steps == MAX_SIMULATION_STEPS:
+                # Rather than falling further behind every tick, the
+                # simulation slows down.
+                logger.debug(
+                    f"Dropped {self._accumulator:.3f}s of simulation"
+                )
+                self._accumulator = 0.0
+                break
+            self._pace(step, fixed_step=True)
+            await self._run_phase(
+                plan.simulation,
+                started,
+                step,
+                scene_context,
+                engine_context,
+            )
+            self._accumulator = max(self._accumulator - step.delta_time, 0.0)
+            steps += 1
+        tick_context = TickContext(
+            tick_context.delta_time,
+            tick_context.frames,
+            min(self._accumulator * rate, 1.0),
+        )
+        self._pace(tick_context, fixed_step=False)
+        await self._run_phase(
+            plan, started, tick_context, scene_context, engine_context
+        )
+
+    async def _run_phase(
+        self,
+        plan: ExecutionPlan,
+        started: float,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        executor = self._thread_pool()
+        offload = (
+            engine_context.options.offload_processors
+            and scene_context.shared_columns
+        )
+        budget = engine_context.options.frame_budget_ms
+        if executor is None and not offload and budget is None:
+            await self._run_plan(
+                plan, tick_context, scene_context, engine_context
+            )
+            return
+        if (
+            executor is not None
+            and engine_context.options.execution_backend
+            is ExecutionBackend.CRITICAL_PATH
+        ):
+            await self._run_critical_path(
+                executor,
+                plan,
+                started,
+                offload,
+                tick_context,
+                scene_context,
+                engine_context,
+            )
+            scene_context.commands.flush()
+            return
+        if budget is not None:
+            reserved = self._reserved_costs(plan.groups)
+        for index, system_group in enumerate(plan.groups):
+            if self._idle:
+                system_group = system_group - self._idle
+            system_group = self._skip_empty(system_group, plan)
+            if budget is not None:
+                elapsed = (time.perf_counter() - started) * 1000
+                system_group = self._fit_budget(
+                    system_group,
+                    budget - elapsed - reserved[index],
+                    tick_context,
+                )
+            if not system_group:
+                continue
+            if offload and any(
+                system.offloadable for system in system_group
+            ):
+                await self._run_offloading(
+                    executor,
+                    plan,
+                    system_group,
+                    tick_context,
+                    scene_context,
+                    engine_context,
+                )
+            else:
+                await self._run_layer(
+                    executor,
+                    plan,
+                    system_group,
+                    tick_context,
+                    scene_context,
+                    engine_context,
+                )
+            scene_context.commands.flush()
+
+    def _execution_plan(self) -> ExecutionPlan:
+        execution_order = self.execution_order()
+        options = self.engine_context.options
+        key = (
+            options.debug,
+            self.profiler.options.enabled,
+            options.frame_budget_ms is not None,
+            options.execution_backend,
+            options.simulation_rate is not None,
+        )
+        plan = self._compiled
+        if (
+            plan is None
+            or plan.order is not execution_order
+            or plan.key != key
+        ):
+            plan = self._compiled = self._compile(execution_order, key)
+        return plan
+
+    def _compile(
+        self, execution_order: list[Set[Processor]], key: tuple[Any, ...]
+    ) -> ExecutionPlan:
+        options = self.engine_context.options
+        budgeted = options.frame_budget_ms is not None
+        # Costs are only estimated for the backends that make use of them.
+        measured = (
+            budgeted
+            or options.execution_backend is ExecutionBackend.CRITICAL_PATH
+        )
+        steps: Dict[Processor, PlanStep] = {}
+        for layer in execution_order:
+            for processor in layer:
+                if processor.debug_only and not options.debug:
+                    continue
+                query = None
+                if processor.primary_query:
+                    query = self.scene_context._get_query(
+                        processor.primary_query
+                    )
+                steps[processor] = PlanStep(
+                    processor,
+                    query,
+                    self._compile_run(
+                        processor,
+                        self.profiler.options.enabled,
+                        measured,
+                        # Deferred processors get a context of their own.
+                        budgeted or processor in self._pacing,
+                    ),
+                )
+        logger.debug(f"Compiled an execution plan of {len(steps)} processors")
+        if options.simulation_rate is None:
+            return ExecutionPlan(execution_order, key, steps)
+        self._check_phases(steps)
+        plan = ExecutionPlan(
+            execution_order,
+            key,
+            {
+                processor: step
+                for processor, step in steps.items()
+                if not processor.fixed_step
+            },
+        )
+        plan.simulation = ExecutionPlan(
+            execution_order,
+            key,
+            {
+                processor: step
+                for processor, step in steps.items()
+                if processor.fixed_step
+            },
+        )
+        return plan
+
+    def _check_phases(self, steps: Dict[Processor, PlanStep]) -> None:
+        # The simulation runs before everything else in a tick, so it
+        # cannot wait on anything else.
+        for processor in steps:
+            if not processor.fixed_step:
+                continue
+            for dependency in self._nodes[processor].depends_on:
+                if not dependency.value.fixed_step:
+                    raise FixedStepOrderException(
+                        f"{processor} is a fixed step processor, but has "
+                        f"to run after {dependency.value}, which is not."
+                    )
+
+    def _compile_run(
+        self,
+        processor: Processor,
+        profiled: bool,
+        measured: bool,
+        paced: bool,
+    ) -> StepRun:
+        update = processor.update
+        name = type(processor).__name__
+        profiler = self.profiler
+        costs = self.costs
+        tick_contexts = self._tick_contexts
+        clock = time.time
+        perf_counter = time.perf_counter
+
+        async def run(
+            tick_context: TickContext,
+            scene_context: SceneContext,
+            engine_context: EngineContext,
+        ) -> None:
+            start = clock() * 1000 if profiled else 0.0
+            # Processors that skipped ticks get the time since they last ran.
+            if paced:
+                tick_context = tick_contexts.get(processor, tick_context)
+            this_run, token = begin_processor_run(processor.last_run_tick)
+            try:
+                started = perf_counter() if measured else 0.0
+                await update(tick_context, scene_context, engine_context)
+                if measured:
+                    costs.observe(
+                        processor, (perf_counter() - started) * 1000
+                    )
+                processor.last_run_tick = this_run
+            finally:
+                end_processor_run(token)
+            if profiled:
+                profiler.record(
+                    ProfilerScope.PROCESSOR, name, start, clock() * 1000
+                )
+
+        return run
+
+    async def _run_plan(
+        self,
+        plan: ExecutionPlan,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        # With nothing to spread over threads or fit into a budget, the
+        # processors of a layer simply run one after the other.
+        idle = self._idle
+        profiler = self.profiler
+        commands = scene_context.commands
+        for layer in plan.layers:
+            for step in layer:
+                if step.processor in idle:
+                    continue
+                if step.query is not None and not step.query:
+                    profiler.skip(ProfilerScope.PROCESSOR, step.name)
+                    continue
+                await step.run(tick_context, scene_context, engine_context)
+            commands.flush()
+
+    def _plan_critical_path(
+        self, execution_order: list[Set[Processor]]
+    ) -> CriticalPathPlan:
+        costs = {
+            processor: self.costs.estimate(processor)
+            for layer in execution_order
+            for processor in layer
+        }
+        # Processors left out of the plan cost nothing.
+        ranks = self._graph.bottom_levels(
+            lambda processor: costs.get(processor, 0.0)
+        )
+        plan = CriticalPathPlan(
+            execution_order,
+            costs,
+            ranks,
+            {
+                processor: [
+                    dependency.value
+                    for dependency in self._nodes[processor].depends_on
+                ]
+                for processor in costs
+            },
+            {
+                processor: [
+                    dependent.value
+                    for dependent in self._nodes[processor].dependents
+                ]
+                for processor in costs
+            },
+        )
+        logger.debug(
+            "Planned the critical path: "
+            + ", ".join(
+                f"{type(processor).__name__} ({rank:.2f}ms)"
+                for processor, rank in sorted(
+                    ranks.items(), key=lambda item: item[1], reverse=True
+                )
+            )
+        )
+        return plan
+
+    async def _run_critical_path(
+        self,
+        executor: ThreadPoolExecutor,
+        execution_plan: ExecutionPlan,
+        started: float,
+        offload: bool,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        # Every pair of processors that must not overlap has an edge of its
+        # own in the graph, so a processor only waits for those it depends
+        # on directly, and a skipped processor holds up none. Commands are
+        # applied at the end of the tick, as there is no point at which no
+        # processor is iterating.
+        plan = execution_plan.critical_path
+        if plan is None or plan.drifted(self.costs):
+            plan = execution_plan.critical_path = self._plan_critical_path(
+                execution_plan.groups
+            )
+
+        systems = set(plan.costs)
+        if self._idle:
+            systems -= self._idle
+        systems = self._skip_empty(systems, execution_plan)
+        budget = engine_context.options.frame_budget_ms
+        if budget is not None:
+            elapsed = (time.perf_counter() - started) * 1000
+            reserved = sum(
+                plan.costs[system]
+                for system in systems
+                if system.priority >= ProcessorPriority.NORMAL
+            )
+            systems = self._fit_budget(
+                systems, budget - elapsed - reserved, tick_context
+            )
+
+        waiting = {
+            system: sum(
+                dependency in systems
+                for dependency in plan.dependencies[system]
+            )
+            for system in systems
+        }
+        sequence = plan.sequence
+        steps = execution_plan.steps
+        ready = [
+            (-plan.ranks[system], sequence[system], system)
+            for system, count in waiting.items()
+            if count == 0
+        ]
+        heapq.heapify(ready)
+
+        loop = asyncio.get_running_loop()
+        slots = _thread_pool_workers
+        running: Dict[asyncio.Future[None], Processor] = {}
+        on_workers: Set[asyncio.Future[None]] = set()
+        on_main: Set[asyncio.Future[None]] = set()
+        while ready or running:
+            blocked: list[tuple[float, int, Processor]] = []
+            while ready:
+                entry = heapq.heappop(ready)
+                system = entry[2]
+                if offload and system.offloadable:
+                    future = asyncio.ensure_future(
+                        self._run_offloaded(
+                            system, tick_context, scene_context, engine_context
+                        )
+                    )
+                elif system.main_thread or (
+                    # The main thread takes a share of the work when it
+                    # would otherwise only wait, as handing a processor to
+                    # a worker costs more than running it when nothing
+                    # else can run alongside.
+                    not on_main
+                    and (not ready or len(on_workers) >= slots)
+                ):
+                    future = asyncio.ensure_future(
+                        steps[system].run(
+                            tick_context, scene_context, engine_context
+                        )
+                    )
+                    on_main.add(future)
+                elif len(on_workers) < slots:
+                    future = loop.run_in_executor(
+                        executor,
+                        run_to_completion,
+                        steps[system].run(
+                            tick_context, scene_context, engine_context
+                        ),
+                    )
+                    on_workers.add(future)
+                else:
+                    blocked.append(entry)
+                    continue
+                running[future] = system
+            for entry in blocked:
+                heapq.heappush(ready, entry)
+
+            done, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                system = running.pop(future)
+                on_workers.discard(future)
+                on_main.discard(future)
+                future.result()
+                for dependent in plan.dependents[system]:
+                    if dependent not in waiting:
+                        continue
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        heapq.heappush(
+                            ready,
+                            (
+                                -plan.ranks[dependent],
+                                sequence[dependent],
+                                dependent,
+                            ),
+                        )
+
+    async def _run_layer(
+        self,
+        executor: ThreadPoolExecutor | None,
+        plan: ExecutionPlan,
+        system_group: Set[Processor],
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        if executor is not None and len(system_group) > 1:
+            await self._run_threaded(
+                executor,
+                plan,
+                system_group,
+                tick_context,
+                scene_context,
+                engine_context,
+            )
+        else:
             await asyncio.gather(
                 *(
-                    self._run_with_profiler(
-                        system, tick_context, scene_context, engine_context
+                    plan.steps[system].run(
+                        tick_context, scene_context, engine_context
                     )
                     for system in system_group
                 )
             )
 
-    async def _run_with_profiler(
+    async def _run_offloading(
+        self,
+        executor: ThreadPoolExecutor | None,
+        plan: ExecutionPlan,
+        system_group: Set[Processor],
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        # Offloadable processors only touch column stores, which live in
+        # shared memory, so worker processes write them in place while the
+        # rest of the layer runs here. Both are done before the next layer.
+        offloaded = {system for system in system_group if system.offloadable}
+        await asyncio.gather(
+            *(
+                self._run_offloaded(
+                    system, tick_context, scene_context, engine_context
+                )
+                for system in offloaded
+            ),
+            self._run_layer(
+                executor,
+                plan,
+                system_group - offloaded,
+                tick_context,
+                scene_context,
+                engine_context,
+            ),
+        )
+
+    async def _run_offloaded(
         self,
         system: Processor,
         tick_context: TickContext,
         scene_context: SceneContext,
         engine_context: EngineContext,
-    ):
-        if system.debug_only and not engine_context.options.debug:
-            return
+    ) -> None:
         with engine_context.profiler.scope(
             ProfilerScope.PROCESSOR, system.__class__.__name__
-        ):
-            return await system.update(
-                tick_context, scene_context, engine_context
+        ), processor_run(system.last_run_tick) as this_run:
+            tick_context = self._tick_contexts.get(system, tick_context)
+            job = system.offload(tick_context, scene_context, engine_context)
+            if job is not None:
+                await run_offloaded(
+                    job, engine_context.options.worker_processes
+                )
+            system.last_run_tick = this_run
+
+    async def _run_threaded(
+        self,
+        executor: ThreadPoolExecutor,
+        plan: ExecutionPlan,
+        system_group: Set[Processor],
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        # The processors of a layer never write what another one reads or
+        # writes, so they can run at the same time, and the main thread
+        # takes one share of the work instead of only waiting. Processors
+        # bound to the main thread go last, so signal handlers they trigger
+        # never run while the workers are busy.
+        on_main: list[PlanStep] = []
+        on_workers: list[PlanStep] = []
+        for system in system_group:
+            step = plan.steps[system]
+            (on_main if system.main_thread else on_workers).append(step)
+        if len(on_workers) > 1:
+            loop = asyncio.get_running_loop()
+            inline = on_workers.pop()
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        run_to_completion,
+                        step.run(tick_context, scene_context, engine_context),
+                    )
+                    for step in on_workers
+                ),
+                inline.run(tick_context, scene_context, engine_context),
+            )
+        else:
+            on_main.extend(on_workers)
+        await asyncio.gather(
+            *(
+                step.run(tick_context, scene_context, engine_context)
+                for step in on_main
+            )
+        )
+
+    def _skip_empty(
+        self, system_group: Set[Processor], plan: ExecutionPlan
+    ) -> Set[Processor]:
+        # Checked right before the layer runs, as the commands of the
+        # layers before it may have added or removed entities.
+        empty = {
+            system
+            for system in system_group
+            if (query := plan.steps[system].query) is not None
+            and not query
+        }
+        if not empty:
+            return system_group
+        for system in empty:
+            self.profiler.skip(
+                ProfilerScope.PROCESSOR, system.__class__.__name__
+            )
+        return system_group - empty
+
+    def _reserved_costs(
+        self, execution_order: list[Set[Processor]]
+    ) -> list[float]:
+        # The estimated time of the processors that cannot be deferred, in
+        # each layer and every one after it.
+        reserved = [0.0] * (len(execution_order) + 1)
+        for index in range(len(execution_order) - 1, -1, -1):
+            reserved[index] = reserved[index + 1] + sum(
+                self.costs.estimate(system)
+                for system in execution_order[index]
+                if system.priority >= ProcessorPriority.NORMAL
+            )
+        return reserved
+
+    def _fit_budget(
+        self,
+        system_group: Set[Processor],
+        available: float,
+        tick_context: TickContext,
+    ) -> Set[Processor]:
+        deferrable = sorted(
+            (
+                system
+                for system in system_group
+                if system.priority < ProcessorPriority.NORMAL
+            ),
+            key=lambda system: (-system.priority, self.costs.estimate(system)),
+        )
+        deferred: Set[Processor] = set()
+        for system in deferrable:
+            cost = self.costs.estimate(system)
+            context = self._tick_contexts.get(system, tick_context)
+            if cost <= available or context.frames >= MAX_DEFERRED_TICKS:
+                available -= cost
+                continue
+            self._deferred[system] = context
+            deferred.add(system)
+        if not deferred:
+            return system_group
+        logger.debug(
+            "Deferred "
+            + ", ".join(type(system).__name__ for system in deferred)
+            + " to stay within the frame budget"
+        )
+        return system_group - deferred
+
+    def _pace(
+        self, tick_context: TickContext, fixed_step: bool | None = None
+    ) -> None:
+        # With a simulation rate, the processors of each phase are paced by
+        # the ticks of that phase, so only theirs are counted.
+        def in_phase(processor: Processor) -> bool:
+            return fixed_step is None or processor.fixed_step is fixed_step
+
+        if fixed_step is None:
+            self._idle.clear()
+            self._tick_contexts.clear()
+        else:
+            self._idle = {
+                processor
+                for processor in self._idle
+                if not in_phase(processor)
+            }
+            for processor in list(self._tick_contexts):
+                if in_phase(processor):
+                    del self._tick_contexts[processor]
+        if not fixed_step:
+            self._ticks += 1
+        for processor, pacing in self._pacing.items():
+            if not in_phase(processor):
+                continue
+            pacing.frames += 1
+            pacing.delta += tick_context.delta_time
+            # Deferred processors run as soon as they can, even when it is
+            # not their turn.
+            if not pacing.due(processor) and processor not in self._deferred:
+                self._idle.add(processor)
+                continue
+            self._tick_contexts[processor] = TickContext(
+                pacing.delta, pacing.frames, tick_context.alpha
+            )
+            pacing.frames = 0
+            pacing.delta = 0.0
+            pacing.started = True
+        # Deferred processors make up for the ticks they missed.
+        for processor, missed in list(self._deferred.items()):
+            if not in_phase(processor):
+                continue
+            current = self._tick_contexts.get(processor, tick_context)
+            self._tick_contexts[processor] = TickContext(
+                missed.delta_time + current.delta_time,
+                missed.frames + current.frames,
+                tick_context.alpha,
+            )
+            del self._deferred[processor]
+
+    def _add_pacing(self, processor: Processor) -> None:
+        if processor.rate < 1:
+            raise InvalidRateException(
+                f"{processor} has a rate of {processor.rate}, it has to be "
+                f"at least 1."
+            )
+        if processor.frequency is not None and processor.frequency <= 0:
+            raise InvalidRateException(
+                f"{processor} has a frequency of {processor.frequency}."
             )
+        if processor.rate == 1 and processor.frequency is None:
+            return
+        phase = processor.phase
+        if phase is None:
+            phase = self._stagger(processor)
+        self._pacing[processor] = ProcessorPacing(
+            phase, (self._ticks + phase) % processor.rate
+        )
+
+    def _stagger(self, processor: Processor) -> int:
+        # Processors with the same frequency start one tick apart, and
+        # keep that distance as long as ticks take about as long.
+        if processor.frequency is not None:
+            return sum(
+                other.frequency == processor.frequency
+                for other in self._pacing
+            )
+        # Processors with a rate go on the tick that the fewest others
+        # share, weighed by how often they coincide.
+        rate = processor.rate
+        load = [0.0] * rate
+        for other, pacing in self._pacing.items():
+            if other.frequency is not None:
+                continue
+            shared = math.gcd(rate, other.rate)
+            for slot in range(pacing.slot % shared, rate, shared):
+                load[slot] += shared / other.rate
+        slot = min(range(rate), key=load.__getitem__)
+        return (slot - self._ticks) % rate
 
     def add_processor(self, processor: Processor) -> None:
+        self.add_processors([processor])
+
+    def add_processors(self, processors: Iterable[Processor]) -> None:
+        """
+        Add several processors at once. Only the pairs that involve a new
+        processor are compared, and the execution order is sorted again the
+        next time it is needed rather than after every processor.
+        """
         debug_mode = self.engine_context.options.debug
-        if processor.debug_only and not debug_mode:
-            logger.debug(
-                " ".join(
-                    [
-                        "Skipping addition of debug-only system",
-                        f"{str(processor)}",
-                        " in non-debug mode.",
-                    ]
+        added: list[Processor] = []
+        for processor in processors:
+            if processor.debug_only and not debug_mode:
+                logger.debug(
+                    " ".join(
+                        [
+                            "Skipping addition of debug-only system",
+                            f"{str(processor)}",
+                            " in non-debug mode.",
+                        ]
+                    )
                 )
-            )
-        if processor in self.processors:
-            raise SystemDuplicateEntryException(
-                f"System {processor} is already in the scheduler."
-            )
-        self.processors.add(processor)
-        processor.initialize(self.scene_context, self.engine_context)
-        logger.debug(f"Added system {processor} to the scheduler.")
-        self._rebuild()
+            if processor in self.processors:
+                raise SystemDuplicateEntryException(
+                    f"System {processor} is already in the scheduler."
+                )
+            self._add_pacing(processor)
+            self.processors.add(processor)
+            processor.initialize(self.scene_context, self.engine_context)
+            logger.debug(f"Added system {processor} to the scheduler.")
+            added.append(processor)
+        self._connect(added)
+
+    def load_processors(
+        self,
+        processors: list[Processor],
+        execution_order: list[list[int]],
+        dependencies: list[tuple[int, int]],
+    ) -> None:
+        """
+        Add processors together with the dependencies and execution order
+        computed for them earlier, such as the ones stored in a baked scene,
+        instead of comparing every pair of them. Both hold indices into
+        ``processors``, the dependencies as (processor, dependency) pairs,
+        see `dependencies`.
+        """
+        if self.processors:
+            self.add_processors(processors)
+            return
+        for processor in processors:
+            if processor in self.processors:
+                raise SystemDuplicateEntryException(
+                    f"System {processor} is already in the scheduler."
+                )
+            self._add_pacing(processor)
+            self.processors.add(processor)
+            processor.initialize(self.scene_context, self.engine_context)
+            self._insert_node(processor)
+        try:
+            for index, dependency in dependencies:
+                self._graph.set_dependency(
+                    self._nodes[processors[index]],
+                    self._nodes[processors[dependency]],
+                )
+        except Exception:
+            self._graph_stale = True
+            raise
+        # Processors added later are connected to these as usual.
+        self._execution_order = [
+            {processors[index] for index in layer}
+            for layer in execution_order
+        ]
+        self._order_stale = False
+        logger.debug(
+            f"Loaded {len(processors)} systems in "
+            f"{len(self._execution_order)} layers."
+        )
+
+    def dependencies(self) -> list[tuple[Processor, Processor]]:
+        """Every (processor, dependency) pair of the DAG."""
+        if self._graph_stale:
+            self._rebuild()
+        return [
+            (processor, dependency.value)
+            for processor, node in self._nodes.items()
+            for dependency in node.depends_on
+        ]
 
     def remove_processor(self, processor: Processor) -> None:
         if processor not in self.processors:
@@ -124,11 +1104,21 @@ class ProcessorScheduler:
                 f"System {processor} not found in the scheduler."
             )
         self.processors.remove(processor)
+        self._pacing.pop(processor, None)
+        self._idle.discard(processor)
+        self._tick_contexts.pop(processor, None)
+        self._deferred.pop(processor, None)
+        self.costs.forget(processor)
         processor.maid.cleanup()
         processor.teardown(self.scene_context, self.engine_context)
-        self._rebuild()
+        self._graph_stale = True
+        self._order_stale = True
 
     def execution_order(self) -> list[Set[Processor]]:
+        if self._graph_stale:
+            self._rebuild()
+        if self._order_stale:
+            self._sort()
         return self._execution_order
 
     def _explicit_order(self, a: Processor, b: Processor) -> int | None:
@@ -138,79 +1128,113 @@ class ProcessorScheduler:
             return 1
         return None
 
+    def _insert_node(self, processor: Processor) -> None:
+        node = DirectedAcyclicGraphNode(processor)
+        self._nodes[processor] = node
+        self._graph.insert_node(node)
+        logger.debug(
+            f"Inserted node for processor {processor} "
+            f"(reads={self._fmt_components(processor.reads)}, "
+            f"writes={self._fmt_components(processor.writes)})"
+        )
+
+    def _connect(self, added: list[Processor]) -> None:
+        if self._graph_stale:
+            self._rebuild()
+            return
+        existing = list(self._nodes)
+        try:
+            for processor in added:
+                self._insert_node(processor)
+            for index, a in enumerate(added):
+                for b in existing:
+                    self._order_pair(a, b)
+                for b in added[:index]:
+                    self._order_pair(a, b)
+        except Exception:
+            # Leave no half connected nodes behind.
+            self._graph_stale = True
+            raise
+        if added:
+            self._order_stale = True
+
     def _rebuild(self) -> None:
         logger.debug("Rebuilding processor scheduler DAG")
 
         self._graph = DirectedAcyclicGraph()
         self._nodes = {}
+        self._graph_stale = False
 
-        for processor in self.processors:
-            node = DirectedAcyclicGraphNode(processor)
-            self._nodes[processor] = node
-            self._graph.insert_node(node)
-            logger.debug(
-                f"Inserted node for processor {processor} "
-                f"(reads={self._fmt_components(processor.reads)}, "
-                f"writes={self._fmt_components(processor.writes)})"
-            )
-
-        processor = list(self.processors)
+        processors = list(self.processors)
+        for processor in processors:
+            self._insert_node(processor)
+        for index, a in enumerate(processors):
+            for b in processors[:index]:
+                self._order_pair(a, b)
+        self._order_stale = True
 
-        for i in range(len(processor)):
-            for j in range(len(processor)):
-                if i == j:
-                    continue
+    def _order_pair(self, a: Processor, b: Processor) -> None:
+        # The inferred rules are symmetric, so each pair is only compared
+        # once. Explicit ones are read from both sides, so that processors
+        # which contradict each other still end up in a cycle.
+        node_a = self._nodes[a]
+        node_b = self._nodes[b]
 
-                a = processor[i]
-                b = processor[j]
-
-                node_a = self._nodes[a]
-                node_b = self._nodes[b]
+        explicit = False
+        for first, second in ((a, b), (b, a)):
+            order = self._explicit_order(first, second)
+            if order is None:
+                continue
+            explicit = True
+            node_first = self._nodes[first]
+            node_second = self._nodes[second]
+            if order < 0:
+                logger.debug(
+                    f"Explicit override: {first} runs BEFORE {second}"
+                )
+                self._graph.set_dependency(node_second, node_first)
+            else:
+                logger.debug(
+                    f"Explicit override: {first} runs AFTER {second}"
+                )
+                self._graph.set_dependency(node_first, node_second)
+        if explicit:
+            return
 
-                order = self._explicit_order(a, b)
-                if order is not None:
-                    if order < 0:
-                        logger.debug(f"Explicit override: {a} runs BEFORE {b}")
-                        self._graph.set_dependency(node_b, node_a)
-                    else:
-                        logger.debug(f"Explicit override: {a} runs AFTER {b}")
-                        self._graph.set_dependency(node_a, node_b)
-                    continue
+        components_a_writes_that_b_reads = a.writes & b.reads
+        if components_a_writes_that_b_reads:
+            formatted_components = self._fmt_components(
+                components_a_writes_that_b_reads
+            )
+            logger.debug(
+                f"Inferred: {a} runs BEFORE {b} "
+                f"because {b} reads {formatted_components}"
+            )
+            self._graph.set_dependency(node_b, node_a)
 
-                components_a_writes_that_b_reads = a.writes & b.reads
-                if components_a_writes_that_b_reads:
-                    formatted_components = self._fmt_components(
-                        components_a_writes_that_b_reads
-                    )
-                    logger.debug(
-                        f"Inferred: {a} runs BEFORE {b} "
-                        f"because {b} reads {formatted_components}"
-                    )
-                    self._graph.set_dependency(node_b, node_a)
+        components_a_reads_that_b_writes = a.reads & b.writes
+        if components_a_reads_that_b_writes:
+            formatted = self._fmt_components(components_a_reads_that_b_writes)
+            logger.debug(
+                f"Inferred: {b} runs BEFORE {a} "
+                f"because {a} reads {formatted}"
+            )
+            self._graph.set_dependency(node_a, node_b)
 
-                components_a_reads_that_b_writes = a.reads & b.writes
-                if components_a_reads_that_b_writes:
-                    formatted = self._fmt_components(
-                        components_a_reads_that_b_writes
-                    )
-                    logger.debug(
-                        f"Inferred: {b} runs BEFORE {a} "
-                        f"because {a} reads {formatted}"
-                    )
-                    self._graph.set_dependency(node_a, node_b)
-
-                components_both_write = a.writes & b.writes
-                if components_both_write:
-                    if type(a) in b.alongside or type(b) in a.alongside:
-                        ...
-                    else:
-                        raise SystemConflictException(
-                            f"Unresolved write-write conflict between {a} "
-                            f"and {b} on "
-                            f"{self._fmt_components(components_both_write)}"
-                        )
+        components_both_write = a.writes & b.writes
+        if components_both_write:
+            if type(a) in b.alongside or type(b) in a.alongside:
+                ...
+            else:
+                raise SystemConflictException(
+                    f"Unresolved write-write conflict between {a} "
+                    f"and {b} on "
+                    f"{self._fmt_components(components_both_write)}"
+                )
 
+    def _sort(self) -> None:
         self._execution_order = self._graph.parallel_sort()
+        self._order_stale = False
 
         logger.debug(
             "Final execution layers: "
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import dataclasses
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pygame import Color, Vector2
+
+if TYPE_CHECKING:
+    from justkeepswimming.ecs import Component, Entity
+    from justkeepswimming.ecs.archetype import Archetype
+    from justkeepswimming.ecs.columns import ColumnStore
+    from justkeepswimming.ecs.query import Query, QueryRow
+
+NUMBER_TYPES = (bool, int, float)
+
+
+class FieldKind(Enum):
+    VECTOR = auto()
+    NUMBER = auto()
+    COLOR = auto()
+    REFERENCE = auto()
+
+
+def pack_field(values: list[Any]) -> tuple[FieldKind, Any]:
+    # Mutable values are copied into compact buffers. Everything else,
+    # such as images, fonts and signals, is treated as an immutable asset
+    # and kept by reference.
+    first = type(values[0])
+    if any(type(value) is not first for value in values):
+        return FieldKind.REFERENCE, list(values)
+    if first is Vector2:
+        # Going through tuples is much faster than letting NumPy walk the
+        # Vector2 sequence protocol.
+        return FieldKind.VECTOR, np.array(
+            [(value.x, value.y) for value in values], dtype=np.float64
+        )
+    if first in NUMBER_TYPES:
+        return FieldKind.NUMBER, np.array(values, dtype=first)
+    if first is Color:
+        return FieldKind.COLOR, [tuple(value) for value in values]
+    return FieldKind.REFERENCE, list(values)
+
+
+def unpack_field(kind: FieldKind, data: Any) -> list[Any]:
+    if kind is FieldKind.VECTOR:
+        return [Vector2(x, y) for x, y in data.tolist()]
+    if kind is FieldKind.NUMBER:
+        return data.tolist()
+    if kind is FieldKind.COLOR:
+        return [Color(value) for value in data]
+    return data
+
+
+class ComponentBuffer:
+    """The field values of every component of one type in a snapshot."""
+
+    __slots__ = ("components", "locations", "fields")
+
+    def __init__(
+        self, component_type: type[Component], components: list[Component]
+    ) -> None:
+        self.components = components
+        # Fields in a column store are captured with the store instead.
+        locations = [
+            (component.column_store, component.column_index)
+            for component in components
+        ]
+        attached = any(store is not None for store, _ in locations)
+        self.locations = locations if attached else None
+        skipped = set(component_type.columnar_fields) if attached else set()
+        self.fields: list[tuple[str, FieldKind, Any]] = []
+        if not dataclasses.is_dataclass(component_type):
+            return
+        for field in dataclasses.fields(component_type):
+            if field.name in skipped:
+                continue
+            kind, data = pack_field(
+                [getattr(component, field.name) for component in components]
+            )
+            self.fields.append((field.name, kind, data))
+
+    def restore(self, tick: int) -> None:
+        # Attached components are stamped through their column store.
+        components = self.components
+        if self.locations is not None:
+            for component, (store, index) in zip(
+                components, self.locations
+            ):
+                component.column_store = store
+                component.column_index = index
+        for name, kind, data in self.fields:
+            for component, value in zip(components, unpack_field(kind, data)):
+                setattr(component, name, value)
+        for component in components:
+            component.changed_tick = tick
+
+
+class SceneSnapshot:
+    """
+    The entities and component data of a scene at one point in time, see
+    `SceneContext.snapshot`. A snapshot can be restored any number of times.
+    """
+
+    __slots__ = (
+        "generations",
+        "free",
+        "locations",
+        "entities",
+        "tables",
+        "stores",
+        "buffers",
+        "queries",
+    )
+
+    def __init__(
+        self,
+        generations: list[int],
+        free: list[int],
+        locations: list[Archetype | None],
+        entities: dict[int, Entity],
+        archetypes: list[Archetype],
+        column_stores: list[ColumnStore],
+        queries: list[Query],
+    ) -> None:
+        self.generations = generations
+        self.free = free
+        self.locations = locations
+        self.entities = entities
+        self.tables: list[
+            tuple[
+                Archetype,
+                list[Entity],
+                dict[type[Component], list[Component]],
+                dict[int, int],
+            ]
+        ] = []
+        by_type: dict[type[Component], list[Component]] = {}
+        for archetype in archetypes:
+            columns = {
+                component_type: list(column)
+                for component_type, column in archetype.columns.items()
+            }
+            self.tables.append(
+                (
+                    archetype,
+                    list(archetype.entities),
+                    columns,
+                    dict(archetype.rows),
+                )
+            )
+            for component_type, column in columns.items():
+                by_type.setdefault(component_type, []).extend(column)
+        self.stores = [
+            (
+                store,
+                {name: array.copy() for name, array in store.arrays.items()},
+                store.occupied.copy(),
+            )
+            for store in column_stores
+        ]
+        self.buffers = [
+            ComponentBuffer(component_type, components)
+            for component_type, components in by_type.items()
+            if components
+        ]
+        # The component objects come back as they were, so the rows of the
+        # queries can be restored instead of rebuilt.
+        self.queries: dict[Query, dict[int, QueryRow]] = {
+            query: dict(query.members) for query in queries
+        }
+
+    def __repr__(self) -> str:
+        return f"<SceneSnapshot ({len(self.entities)} entities)>"
+
+    def components(self) -> set[int]:
+        return {
+            id(component)
+            for buffer in self.buffers
+            for component in buffer.components
+        }
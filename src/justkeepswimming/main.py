@@ -7,7 +7,7 @@ import logging
 from justkeepswimming.prelude import setup_logging
 from justkeepswimming.scenes import SceneID
 from justkeepswimming.systems.engine import Engine
-from justkeepswimming.utilities.launch import Options
+from justkeepswimming.utilities.launch import ExecutionBackend, Options
 
 logger = logging.getLogger()
 
@@ -48,6 +48,51 @@ def main():
         default=1000,
         help="Number of profiler records to keep.",
     )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Store hot components in NumPy arrays.",
+    )
+    parser.add_argument(
+        "--bake-scenes",
+        action="store_true",
+        help="Cache constructed scenes on disk and reuse them.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=[backend.value for backend in ExecutionBackend],
+        default=ExecutionBackend.ASYNCIO.value,
+        help="How the processors of a tick are run.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker threads for the threads backend.",
+    )
+    parser.add_argument(
+        "--offload",
+        action="store_true",
+        help="Run simulation processors in worker processes.",
+    )
+    parser.add_argument(
+        "--frame-budget",
+        type=float,
+        default=None,
+        help="Milliseconds per tick before low priority processors wait.",
+    )
+    parser.add_argument(
+        "--simulation-rate",
+        type=float,
+        default=None,
+        help="Fixed steps per second of the simulation processors.",
+    )
+    parser.add_argument(
+        "--offload-workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for offloaded processors.",
+    )
     args = parser.parse_args()
     setup_logging(args.log_level or 1)
     if args.debug:
@@ -61,6 +106,14 @@ def main():
         debug=args.debug,
         profiler_enabled=args.profiler,
         profiler_history=args.profiler_history,
+        columnar_storage=args.columnar,
+        bake_scenes=args.bake_scenes,
+        execution_backend=ExecutionBackend(args.backend),
+        worker_threads=args.workers,
+        offload_processors=args.offload,
+        worker_processes=args.offload_workers,
+        frame_budget_ms=args.frame_budget,
+        simulation_rate=args.simulation_rate,
     )
     asyncio.run(game_loop(launch_options))
 
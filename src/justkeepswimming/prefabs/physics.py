@@ -1,5 +1,6 @@
 from justkeepswimming.components.physics import (
     AngularPhysicsComponent,
+    InterpolatedTransformComponent,
     LinearPhysicsComponent,
     TransformComponent,
 )
@@ -7,6 +8,10 @@ from justkeepswimming.debug.processors.physics import (
     LinearPhysicsDebuggerProcessor,
 )
 from justkeepswimming.ecs import Component, Processor
+from justkeepswimming.processors.interpolation import (
+    TransformHistoryProcessor,
+    TransformInterpolationProcessor,
+)
 from justkeepswimming.processors.physics import (
     AngularPhysicsProcessor,
     LinearPhysicsProcessor,
@@ -26,9 +31,12 @@ class PhysicsObjectPrefab(Prefab):
     components = [
         LinearPhysicsComponent(),
         AngularPhysicsComponent(),
+        InterpolatedTransformComponent(),
     ]
     processors = [
         LinearPhysicsDebuggerProcessor,
         LinearPhysicsProcessor,
         AngularPhysicsProcessor,
+        TransformHistoryProcessor,
+        TransformInterpolationProcessor,
     ]
@@ -12,7 +12,7 @@ from justkeepswimming.components.physics import (
     TransformComponent,
 )
 from justkeepswimming.components.render import RendererComponent
-from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs import Processor, ProcessorPriority, SceneContext
 from justkeepswimming.processors.render import (
     RendererPreProcessor,
     RendererProcessor,
@@ -32,6 +32,9 @@ class AnimationTrackPlaybackProcessor(Processor):
     after = frozenset(
         {RendererTransformConstraintProcessor, RendererPreProcessor}
     )
+    # Animation tracks emit signals as they loop and finish.
+    main_thread = True
+    primary_query = (AnimatorComponent, RendererComponent)
 
     async def update(
         self,
@@ -66,6 +69,12 @@ class CharacterAnimationStateProcessor(Processor):
         {AnimationStateComponent, TransformComponent, LinearPhysicsComponent}
     )
     writes = frozenset({AnimationStateComponent})
+    frequency = 30
+    primary_query = (
+        AnimationStateComponent,
+        TransformComponent,
+        LinearPhysicsComponent,
+    )
 
     ACCEL_EPS = 0.1
     DOT_HYST = 0.2
@@ -119,6 +128,13 @@ class CharacterAnimationProcessor(Processor):
     )
     writes = frozenset({AnimatorComponent})
     before = frozenset({RendererProcessor, AnimationTrackPlaybackProcessor})
+    # Starting and stopping tracks emits signals.
+    main_thread = True
+    primary_query = (
+        AnimatorComponent,
+        AnimationStateComponent,
+        SpritesheetComponent,
+    )
 
     async def update(
         self,
@@ -169,6 +185,12 @@ class VelocityAffectsAnimationSpeedProcessor(Processor):
     writes = frozenset({AnimationStateComponent})
     before = frozenset({})
     after = frozenset({CharacterAnimationStateProcessor})
+    primary_query = (
+        AnimationStateComponent,
+        LinearPhysicsComponent,
+        VelocityAffectsAnimationSpeedComponent,
+    )
+    priority = ProcessorPriority.LOW
 
     async def update(
         self,
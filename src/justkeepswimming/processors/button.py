@@ -7,7 +7,7 @@ from justkeepswimming.components.font import TextComponent
 from justkeepswimming.components.physics import TransformComponent
 from justkeepswimming.components.render import RendererComponent
 from justkeepswimming.components.ui import ButtonComponent
-from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs import Maybe, Processor, SceneContext
 from justkeepswimming.processors.font import TextProcessor
 from justkeepswimming.processors.render import (
     RendererPreProcessor,
@@ -48,12 +48,20 @@ class ButtonProcessor(Processor):
     )
     before = frozenset({RendererProcessor, TextProcessor})
     alongside = frozenset({TileTextureProcessor})
+    # Emits the button signals.
+    main_thread = True
+    primary_query = (
+        ButtonComponent,
+        TransformComponent,
+        RendererComponent,
+        Maybe(TextComponent),
+    )
 
     async def on_mouse_moved(
         self, scene_context: SceneContext, mouse: Mouse
     ) -> None:
-        for entity, (button, transform) in scene_context.query(
-            ButtonComponent, TransformComponent
+        for entity, (button, transform, text) in scene_context.query(
+            ButtonComponent, TransformComponent, Maybe(TextComponent)
         ):
             rect = Rect()
             rect.width, rect.height = int(transform.size.x), int(
@@ -69,9 +77,9 @@ class ButtonProcessor(Processor):
                     button.hovering = True
                     logger.debug(f"Mouse is hovering over {entity.name}")
                     await button.on_hover.emit()
-                    if entity.has_component(TextComponent):
-                        text = entity.get_component(TextComponent)
+                    if text is not None:
                         text.color = button.label_color_hover
+                        text.mark_changed()
             else:
                 if button.hovering:
                     button.hovering = False
@@ -79,9 +87,9 @@ class ButtonProcessor(Processor):
                         f"Mouse is no longer hovering over {entity.name}"
                     )
                     await button.on_unhover.emit()
-                    if entity.has_component(TextComponent):
-                        text = entity.get_component(TextComponent)
+                    if text is not None:
                         text.color = button.label_color
+                        text.mark_changed()
 
     async def on_mouse_button_pressed(
         self,
@@ -176,8 +184,11 @@ class ButtonProcessor(Processor):
         scene_context: SceneContext,
         engine_context: EngineContext,
     ) -> None:
-        for entity, (button, transform, renderer) in scene_context.query(
-            ButtonComponent, TransformComponent, RendererComponent
+        for _, (button, transform, renderer, text) in scene_context.query(
+            ButtonComponent,
+            TransformComponent,
+            RendererComponent,
+            Maybe(TextComponent),
         ):
             rect = Rect()
             rect.width, rect.height = int(transform.size.x), int(
@@ -214,13 +225,15 @@ class ButtonProcessor(Processor):
                     Rect(Vector2(0, 0), Vector2(rect.width, rect.height)),
                     border_radius=min(rect.width, rect.height) // 2,
                 )
-            if entity.has_component(TextComponent):
+            if text is not None:
                 if button.hovering:
-                    text = entity.get_component(TextComponent)
-                    text.color = button.label_color_hover
+                    label_color = button.label_color_hover
                 elif button.active:
-                    text = entity.get_component(TextComponent)
-                    text.color = button.label_color_active
+                    label_color = button.label_color_active
                 else:
-                    text = entity.get_component(TextComponent)
-                    text.color = button.label_color
+                    label_color = button.label_color
+                # Only written when it differs, so the label is not
+                # rendered again every frame.
+                if text.color != label_color:
+                    text.color = label_color
+                    text.mark_changed()
@@ -18,6 +18,9 @@ from justkeepswimming.utilities.context import EngineContext
 class CameraProcessor(Processor):
     reads = frozenset({TransformComponent, ScenePseudoComponent})
     writes = frozenset({CameraComponent, WindowPseudoComponent})
+    # Presents the frame to the window.
+    main_thread = True
+    primary_query = (CameraComponent, TransformComponent)
 
     async def update(
         self,
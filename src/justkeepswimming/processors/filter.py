@@ -26,6 +26,7 @@ class TintProcessor(Processor):
         }
     )
     before = frozenset({RendererProcessor})
+    primary_query = (TintComponent, RendererComponent)
 
     async def update(
         self,
@@ -32,6 +32,11 @@ class TextProcessor(Processor):
         {RendererTransformConstraintProcessor, RendererPreProcessor}
     )
     alongside: frozenset[type["Processor"]] = frozenset({TileTextureProcessor})
+    primary_query = (TextComponent, RendererComponent)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rendered: dict[int, tuple[TextComponent, Surface]] = {}
 
     async def update(
         self,
@@ -39,11 +44,25 @@ class TextProcessor(Processor):
         scene_context: SceneContext,
         engine_context: EngineContext,
     ) -> None:
-        for _, (text, renderer) in scene_context.query(
+        # Rebuilt every run, so entities that are gone, or whose ids were
+        # handed to new entities, do not keep their surfaces around.
+        previous = self._rendered
+        self._rendered = {}
+        for entity, (text, renderer) in scene_context.query(
             TextComponent,
             RendererComponent,
         ):
-            cached = RENDER_CACHE.get(hash(text))
+            # Text that was not written since the last run renders to the
+            # same surface, which saves hashing the component every frame.
+            rendered = previous.get(entity.id)
+            if (
+                rendered is not None
+                and rendered[0] is text
+                and text.last_changed() <= self.last_run_tick
+            ):
+                cached = rendered[1]
+            else:
+                cached = RENDER_CACHE.get(hash(text))
             if cached is None:
                 bg_color = (
                     text.background_color
@@ -60,8 +79,11 @@ class TextProcessor(Processor):
                 if RENDER_CACHE_LINKS.get(text):
                     del RENDER_CACHE[RENDER_CACHE_LINKS[text]]
                 RENDER_CACHE_LINKS[text] = hash(text)
+            self._rendered[entity.id] = (text, cached)
             if text.autosize:
-                renderer.surface = cached
+                if renderer.surface is not cached:
+                    renderer.surface = cached
+                    renderer.mark_changed()
             else:
                 internal_position = (
                     Vector2(renderer.surface.get_size()).elementwise()
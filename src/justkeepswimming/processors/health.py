@@ -9,6 +9,11 @@ class HealthProcessor(Processor):
     writes = frozenset({HealthComponent})
     after = frozenset({})
     before = frozenset({})
+    # Emits on_died.
+    main_thread = True
+    frequency = 30
+    fixed_step = True
+    primary_query = (HealthComponent,)
 
     async def update(
         self,
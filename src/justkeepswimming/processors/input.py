@@ -22,6 +22,8 @@ LINEAR_INPUT_ACTION_TO_WISH_VECTOR: dict[InputActionId, Vector2] = {
 class PlayerLinearMovementInputProcessor(Processor):
     reads = frozenset({InputPseudoComponent})
     writes = frozenset({PlayerLinearMovementInputComponent})
+    fixed_step = True
+    primary_query = (PlayerLinearMovementInputComponent,)
 
     async def update(
         self,
@@ -57,6 +59,8 @@ ANGULAR_INPUT_ACTION_TO_WISH_TORQUE: dict[InputActionId, float] = {
 class PlayerAngularMovementInputProcessor(Processor):
     reads = frozenset({InputPseudoComponent})
     writes = frozenset({PlayerAngularMovementInputComponent})
+    fixed_step = True
+    primary_query = (PlayerAngularMovementInputComponent,)
 
     async def update(
         self,
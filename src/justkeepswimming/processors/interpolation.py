@@ -0,0 +1,155 @@
+from pygame import Vector2
+
+from justkeepswimming.components.physics import (
+    InterpolatedTransformComponent,
+    TransformComponent,
+)
+from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs.changes import current_change_tick
+from justkeepswimming.processors.physics import (
+    AngularPhysicsProcessor,
+    LinearPhysicsProcessor,
+)
+from justkeepswimming.processors.position import (
+    SceneCenterConstraintProcessor,
+)
+from justkeepswimming.processors.sizing import (
+    AspectRatioConstraintProcessor,
+    ScreenSizeConstraintProcessor,
+)
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.utilities.context import EngineContext
+
+# Processors besides the simulation that move transforms around.
+TRANSFORM_CONSTRAINTS = frozenset(
+    {
+        SceneCenterConstraintProcessor,
+        AspectRatioConstraintProcessor,
+        ScreenSizeConstraintProcessor,
+    }
+)
+
+
+def same_position(first: Vector2, second: Vector2) -> bool:
+    # Exactly, as vectors compare equal within an epsilon, which would
+    # take slow movement for no movement at all.
+    return first[0] == second[0] and first[1] == second[1]
+
+
+def seed(
+    transform: TransformComponent, interpolated: InterpolatedTransformComponent
+) -> None:
+    # Entities start out at rest where they were placed, rather than
+    # coming in from the origin.
+    interpolated.previous_position = Vector2(transform.position)
+    interpolated.simulated_position = Vector2(transform.position)
+    interpolated.shown_position = Vector2(transform.position)
+    interpolated.previous_rotation = transform.rotation
+    interpolated.simulated_rotation = transform.rotation
+    interpolated.shown_rotation = transform.rotation
+    interpolated.seeded = True
+
+
+class TransformHistoryProcessor(Processor):
+    """
+    Puts back the simulated state of interpolated transforms before each
+    simulation step, and keeps it as the state to interpolate from.
+    """
+
+    reads = frozenset({InterpolatedTransformComponent})
+    writes = frozenset({TransformComponent, InterpolatedTransformComponent})
+    before = (
+        frozenset({LinearPhysicsProcessor, AngularPhysicsProcessor})
+        | TRANSFORM_CONSTRAINTS
+    )
+    fixed_step = True
+    primary_query = (TransformComponent, InterpolatedTransformComponent)
+
+    async def update(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        if engine_context.options.simulation_rate is None:
+            return
+        tick = current_change_tick()
+        for _, (transform, interpolated) in scene_context.query(
+            TransformComponent, InterpolatedTransformComponent
+        ):
+            if not interpolated.seeded:
+                seed(transform, interpolated)
+            # Anything other than the interpolation that moved the
+            # transform since is kept.
+            if same_position(
+                transform.position, interpolated.shown_position
+            ):
+                transform.position = Vector2(interpolated.simulated_position)
+                transform.mark_changed(tick)
+            if transform.rotation == interpolated.shown_rotation:
+                transform.rotation = interpolated.simulated_rotation
+                transform.mark_changed(tick)
+            interpolated.previous_position = Vector2(transform.position)
+            interpolated.previous_rotation = transform.rotation
+
+
+class TransformInterpolationProcessor(Processor):
+    """
+    Shows interpolated transforms between their last two simulated states,
+    as far along as the tick is between the simulation steps.
+    """
+
+    reads = frozenset({InterpolatedTransformComponent})
+    writes = frozenset({TransformComponent, InterpolatedTransformComponent})
+    after = frozenset(
+        {
+            TransformHistoryProcessor,
+            LinearPhysicsProcessor,
+            AngularPhysicsProcessor,
+        }
+    )
+    before = TRANSFORM_CONSTRAINTS
+    primary_query = (TransformComponent, InterpolatedTransformComponent)
+
+    async def update(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        # Without a simulation rate every tick is a simulation step, so
+        # there is nothing to interpolate and transforms are left alone.
+        if engine_context.options.simulation_rate is None:
+            return
+        alpha = tick_context.alpha
+        tick = current_change_tick()
+        for _, (transform, interpolated) in scene_context.query(
+            TransformComponent, InterpolatedTransformComponent
+        ):
+            if not interpolated.seeded:
+                seed(transform, interpolated)
+            # A transform that no longer shows the interpolation has been
+            # simulated, or moved, since the last tick.
+            if not same_position(
+                transform.position, interpolated.shown_position
+            ):
+                interpolated.simulated_position = Vector2(transform.position)
+            if transform.rotation != interpolated.shown_rotation:
+                interpolated.simulated_rotation = transform.rotation
+            position = interpolated.previous_position.lerp(
+                interpolated.simulated_position, alpha
+            )
+            rotation = interpolated.previous_rotation + alpha * (
+                interpolated.simulated_rotation
+                - interpolated.previous_rotation
+            )
+            interpolated.shown_position = position
+            interpolated.shown_rotation = rotation
+            # Only written when it differs, so a transform at rest is not
+            # marked as changed every tick.
+            if not same_position(transform.position, position):
+                transform.position = Vector2(position)
+                transform.mark_changed(tick)
+            if transform.rotation != rotation:
+                transform.rotation = rotation
+                transform.mark_changed(tick)
@@ -1,3 +1,4 @@
+import numpy as np
 from pygame import Vector2
 
 from justkeepswimming.components.input import (
@@ -9,16 +10,105 @@ from justkeepswimming.components.physics import (
     LinearPhysicsComponent,
     TransformComponent,
 )
-from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs import Maybe, Processor, SceneContext
+from justkeepswimming.ecs.changes import current_change_tick
+from justkeepswimming.ecs.columns import ColumnStore, rotate_degrees
+from justkeepswimming.ecs.offload import OffloadJob
 from justkeepswimming.systems.clock import TickContext
 from justkeepswimming.utilities.context import EngineContext
 
 
+def integrate_angular(
+    stores: dict[str, ColumnStore],
+    indices: np.ndarray,
+    input_indices: np.ndarray,
+    input_torque: np.ndarray,
+    delta: float,
+    tick: int,
+) -> None:
+    # Mirrors the loop in AngularPhysicsProcessor.update operation for
+    # operation, so both paths produce the same floating point results.
+    angular = stores["angular"].arrays
+    transform = stores["transform"].arrays
+
+    torque_acceleration = np.zeros(len(angular["torque"]))
+    if len(input_indices):
+        torque_acceleration[input_indices] = (
+            input_torque * angular["torque"][input_indices]
+        )
+
+    angular_velocity = angular["angular_velocity"][indices]
+    angular_velocity += torque_acceleration[indices] * delta
+    angular_velocity -= (
+        angular_velocity * angular["angular_drag"][indices] * delta
+    )
+    max_angular_velocity = angular["max_angular_velocity"][indices]
+    angular_velocity = np.where(
+        np.abs(angular_velocity) > max_angular_velocity,
+        np.where(
+            angular_velocity > 0,
+            max_angular_velocity,
+            -max_angular_velocity,
+        ),
+        angular_velocity,
+    )
+    angular["angular_velocity"][indices] = angular_velocity
+    transform["rotation"][indices] += angular_velocity * delta
+
+    stores["angular"].changed[indices] = tick
+    stores["transform"].changed[indices] = tick
+
+
+def integrate_linear(
+    stores: dict[str, ColumnStore],
+    indices: np.ndarray,
+    input_indices: np.ndarray,
+    wish_direction: np.ndarray,
+    delta: float,
+    tick: int,
+) -> None:
+    # Mirrors the loop in LinearPhysicsProcessor.update operation for
+    # operation, so both paths produce the same floating point results.
+    linear = stores["linear"].arrays
+    transform = stores["transform"].arrays
+
+    linear["acceleration"][indices] = 0.0
+    if len(input_indices):
+        length_squared = (
+            wish_direction[:, 0] * wish_direction[:, 0]
+            + wish_direction[:, 1] * wish_direction[:, 1]
+        )
+        too_long = length_squared > 1
+        wish_direction[too_long] /= np.sqrt(length_squared[too_long])[
+            :, np.newaxis
+        ]
+        moving = (wish_direction[:, 0] != 0) | (wish_direction[:, 1] != 0)
+        moving_indices = input_indices[moving]
+        linear["acceleration"][moving_indices] = rotate_degrees(
+            wish_direction[moving] * linear["thrust"][moving_indices],
+            transform["rotation"][moving_indices],
+        )
+
+    velocity = linear["velocity"][indices]
+    velocity += linear["acceleration"][indices] * delta
+    velocity *= np.maximum(1 - linear["drag"][indices] * delta, 0)
+    max_velocity = linear["max_velocity"][indices]
+    velocity = np.maximum(-max_velocity, np.minimum(velocity, max_velocity))
+    linear["velocity"][indices] = velocity
+    transform["position"][indices] += velocity * delta
+
+    stores["linear"].changed[indices] = tick
+    stores["transform"].changed[indices] = tick
+
+
 class AngularPhysicsProcessor(Processor):
     reads = frozenset(
         {AngularPhysicsComponent, PlayerAngularMovementInputComponent}
     )
     writes = frozenset({TransformComponent, AngularPhysicsComponent})
+    offloadable = True
+    fixed_step = True
+    primary_query = (AngularPhysicsComponent, TransformComponent)
 
     async def update(
         self,
@@ -28,17 +118,25 @@ class AngularPhysicsProcessor(Processor):
     ) -> None:
         delta = tick_context.delta_time * scene_context.time_scale
 
-        for entity, (angular_physics, transform) in scene_context.query(
+        if scene_context.columnar:
+            job = self._job(delta, scene_context)
+            if job is not None:
+                job.run()
+            return
+
+        tick = current_change_tick()
+        for _, (
+            angular_physics,
+            transform,
+            input_component,
+        ) in scene_context.query(
             AngularPhysicsComponent,
             TransformComponent,
+            Maybe(PlayerAngularMovementInputComponent),
         ):
             torque_acceleration: float = 0.0
 
-            if entity.has_component(PlayerAngularMovementInputComponent):
-                input_component = entity.get_component(
-                    PlayerAngularMovementInputComponent
-                )
-
+            if input_component is not None:
                 torque_acceleration = (
                     input_component.torque * angular_physics.torque
                 )
@@ -60,6 +158,59 @@ class AngularPhysicsProcessor(Processor):
                 )
 
             transform.rotation += angular_physics.angular_velocity * delta
+            angular_physics.mark_changed(tick)
+            transform.mark_changed(tick)
+
+    def offload(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> OffloadJob | None:
+        delta = tick_context.delta_time * scene_context.time_scale
+        return self._job(delta, scene_context)
+
+    def _job(
+        self, delta: float, scene_context: SceneContext
+    ) -> OffloadJob | None:
+        indices = scene_context.query_indices(
+            AngularPhysicsComponent, TransformComponent
+        )
+        if not len(indices):
+            return None
+        input_indices = scene_context.query_indices(
+            PlayerAngularMovementInputComponent,
+            AngularPhysicsComponent,
+            TransformComponent,
+        )
+        input_torque = np.fromiter(
+            (
+                input_component.torque
+                for _, (input_component, _, _) in scene_context.query(
+                    PlayerAngularMovementInputComponent,
+                    AngularPhysicsComponent,
+                    TransformComponent,
+                )
+            ),
+            dtype=np.float64,
+            count=len(input_indices),
+        )
+        return OffloadJob(
+            integrate_angular,
+            {
+                "angular": scene_context.column_store(
+                    AngularPhysicsComponent
+                ),
+                "transform": scene_context.column_store(TransformComponent),
+            },
+            (
+                indices,
+                input_indices,
+                input_torque,
+                delta,
+                current_change_tick(),
+            ),
+        )
 
 
 class LinearPhysicsProcessor(Processor):
@@ -68,6 +219,9 @@ class LinearPhysicsProcessor(Processor):
     )
     writes = frozenset({TransformComponent, LinearPhysicsComponent})
     alongside = frozenset({AngularPhysicsProcessor})
+    offloadable = True
+    fixed_step = True
+    primary_query = (LinearPhysicsComponent, TransformComponent)
 
     async def update(
         self,
@@ -77,17 +231,25 @@ class LinearPhysicsProcessor(Processor):
     ) -> None:
         delta = tick_context.delta_time * scene_context.time_scale
 
-        for entity, (linear_physics, transform) in scene_context.query(
+        if scene_context.columnar:
+            job = self._job(delta, scene_context)
+            if job is not None:
+                job.run()
+            return
+
+        tick = current_change_tick()
+        for _, (
+            linear_physics,
+            transform,
+            input_component,
+        ) in scene_context.query(
             LinearPhysicsComponent,
             TransformComponent,
+            Maybe(PlayerLinearMovementInputComponent),
         ):
             wish_direction = Vector2()
 
-            if entity.has_component(PlayerLinearMovementInputComponent):
-                input_component = entity.get_component(
-                    PlayerLinearMovementInputComponent
-                )
-
+            if input_component is not None:
                 wish_direction = input_component.thrust
 
                 if wish_direction.length_squared() > 1:
@@ -123,3 +285,53 @@ class LinearPhysicsProcessor(Processor):
             )
 
             transform.position += linear_physics.velocity * delta
+            linear_physics.mark_changed(tick)
+            transform.mark_changed(tick)
+
+    def offload(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> OffloadJob | None:
+        delta = tick_context.delta_time * scene_context.time_scale
+        return self._job(delta, scene_context)
+
+    def _job(
+        self, delta: float, scene_context: SceneContext
+    ) -> OffloadJob | None:
+        indices = scene_context.query_indices(
+            LinearPhysicsComponent, TransformComponent
+        )
+        if not len(indices):
+            return None
+        input_indices = scene_context.query_indices(
+            PlayerLinearMovementInputComponent,
+            LinearPhysicsComponent,
+            TransformComponent,
+        )
+        wish_direction = np.array(
+            [
+                (input_component.thrust.x, input_component.thrust.y)
+                for _, (input_component, _, _) in scene_context.query(
+                    PlayerLinearMovementInputComponent,
+                    LinearPhysicsComponent,
+                    TransformComponent,
+                )
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        return OffloadJob(
+            integrate_linear,
+            {
+                "linear": scene_context.column_store(LinearPhysicsComponent),
+                "transform": scene_context.column_store(TransformComponent),
+            },
+            (
+                indices,
+                input_indices,
+                wish_direction,
+                delta,
+                current_change_tick(),
+            ),
+        )
@@ -26,6 +26,7 @@ class SceneCenterConstraintProcessor(Processor):
     after = frozenset({SceneSizeConstraintProcessor})
     before = frozenset({RendererProcessor})
     alongside = frozenset({LinearPhysicsProcessor, AngularPhysicsProcessor})
+    primary_query = (TransformComponent, SceneCenterConstraintComponent)
 
     async def update(
         self,
@@ -33,9 +34,10 @@ class SceneCenterConstraintProcessor(Processor):
         scene_context: SceneContext,
         engine_context: EngineContext,
     ) -> None:
+        center = Vector2(scene_context.surface.get_size()) / 2
         for _, (transform, _) in scene_context.query(
             TransformComponent, SceneCenterConstraintComponent
         ):
-            size = Vector2(scene_context.surface.get_size())
-            transform.position.x = size.x / 2
-            transform.position.y = size.y / 2
+            if transform.position != center:
+                transform.position = Vector2(center)
+                transform.mark_changed()
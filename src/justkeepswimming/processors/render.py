@@ -46,6 +46,7 @@ class RendererPreProcessor(Processor):
     reads = frozenset({})
     writes = frozenset({RendererComponent})
     before = frozenset({RendererProcessor})
+    primary_query = (RendererComponent,)
 
     async def update(
         self,
@@ -25,6 +25,7 @@ class SceneSizeConstraintProcessor(Processor):
     writes = frozenset({ScenePseudoComponent})
     before = frozenset({RendererProcessor})
     after = frozenset({})
+    primary_query = (TransformComponent, SceneSizeConstraintComponent)
 
     async def update(
         self,
@@ -32,11 +33,15 @@ class SceneSizeConstraintProcessor(Processor):
         scene_context: SceneContext,
         engine_context: EngineContext,
     ) -> None:
-        surface = scene_context.surface
+        size = Vector2(scene_context.surface.get_size())
         for _, (transform, _) in scene_context.query(
             TransformComponent, SceneSizeConstraintComponent
         ):
-            transform.size = Vector2(surface.get_size())
+            # Only write when the size differs, so the transform is not
+            # marked as changed every frame.
+            if transform.size != size:
+                transform.size = Vector2(size)
+                transform.mark_changed()
 
 
 class RendererTransformConstraintProcessor(Processor):
@@ -44,6 +49,7 @@ class RendererTransformConstraintProcessor(Processor):
     writes = frozenset({RendererComponent})
     before = frozenset({RendererProcessor, RendererPreProcessor})
     after = frozenset({})
+    primary_query = (TransformComponent, RendererComponent)
 
     async def update(
         self,
@@ -52,7 +58,9 @@ class RendererTransformConstraintProcessor(Processor):
         engine_context: EngineContext,
     ) -> None:
         for _, (transform, renderer) in scene_context.query(
-            TransformComponent, RendererComponent
+            TransformComponent,
+            RendererComponent,
+            changed=(TransformComponent, RendererComponent),
         ):
             if transform.size != Vector2(renderer.surface.get_size()):
                 surface = Surface(
@@ -68,6 +76,7 @@ class RendererTransformConstraintProcessor(Processor):
                     area=Rect((0, 0), transform.size),
                 )
                 renderer.surface = surface
+                renderer.mark_changed()
 
 
 class AspectRatioConstraintProcessor(Processor):
@@ -75,6 +84,7 @@ class AspectRatioConstraintProcessor(Processor):
     writes = frozenset({TransformComponent})
     before = frozenset({})
     after = frozenset({})
+    primary_query = (TransformComponent, AspectRatioConstraintComponent)
 
     async def update(
         self,
@@ -83,7 +93,9 @@ class AspectRatioConstraintProcessor(Processor):
         engine_context: EngineContext,
     ) -> None:
         for _, (transform, aspect_ratio_constraint) in scene_context.query(
-            TransformComponent, AspectRatioConstraintComponent
+            TransformComponent,
+            AspectRatioConstraintComponent,
+            changed=(TransformComponent, AspectRatioConstraintComponent),
         ):
             width, height = transform.size
             target_aspect_ratio = aspect_ratio_constraint.aspect_ratio
@@ -95,7 +107,9 @@ class AspectRatioConstraintProcessor(Processor):
             else:
                 height = width / target_aspect_ratio
 
-            transform.size = Vector2(width, height)
+            if transform.size != (width, height):
+                transform.size = Vector2(width, height)
+                transform.mark_changed()
 
 
 class ScreenSizeConstraintProcessor(Processor):
@@ -103,6 +117,7 @@ class ScreenSizeConstraintProcessor(Processor):
     writes = frozenset({TransformComponent})
     before = frozenset({})
     after = frozenset({})
+    primary_query = (TransformComponent, ScreenSizeConstraintComponent)
 
     async def update(
         self,
@@ -114,4 +129,6 @@ class ScreenSizeConstraintProcessor(Processor):
         for _, (transform, _) in scene_context.query(
             TransformComponent, ScreenSizeConstraintComponent
         ):
-            transform.size = window.size
+            if transform.size != window.size:
+                transform.size = window.size
+                transform.mark_changed()
@@ -17,6 +17,9 @@ class SpriteProcessor(Processor):
     writes = frozenset({RendererComponent})
     before = frozenset({RendererProcessor})
     after = frozenset({RendererTransformConstraintProcessor})
+    # Images load on the event loop.
+    main_thread = True
+    primary_query = (SpriteComponent, RendererComponent)
 
     async def update(
         self,
@@ -15,7 +15,7 @@ from justkeepswimming.components.tile import (
     MouseRelativeTileScrollComponent,
     TileTextureComponent,
 )
-from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs import Processor, ProcessorPriority, SceneContext
 from justkeepswimming.processors.animation import (
     AnimationTrackPlaybackProcessor,
 )
@@ -46,7 +46,14 @@ class TileTextureProcessor(Processor):
     )
     before = frozenset({RendererProcessor, TintProcessor})
     alongside = frozenset({AnimationTrackPlaybackProcessor})
+    # Images load on the event loop.
+    main_thread = True
     logger = logging.getLogger(__name__)
+    primary_query = (
+        RendererComponent,
+        TransformComponent,
+        TileTextureComponent,
+    )
 
     async def update(
         self,
@@ -129,6 +136,8 @@ class AutoTileScrollProcessor(Processor):
     )
     writes = frozenset({TileTextureComponent})
     before = frozenset({TileTextureProcessor, RendererProcessor})
+    primary_query = (AutoTileScrollComponent, TileTextureComponent)
+    priority = ProcessorPriority.LOW
 
     async def update(
         self,
@@ -161,6 +170,11 @@ class FitTileSizeToTransformProcessor(Processor):
             AnimationTrackPlaybackProcessor,
         }
     )
+    primary_query = (
+        FitTileSizeToTransformComponent,
+        TransformComponent,
+        TileTextureComponent,
+    )
 
     async def update(
         self,
@@ -194,6 +208,8 @@ class MouseRelativeTileScrollProcessor(Processor):
         {FitTileSizeToTransformProcessor, AutoTileScrollProcessor}
     )
     before = frozenset({TileTextureProcessor, RendererProcessor})
+    primary_query = (MouseRelativeTileScrollComponent, TileTextureComponent)
+    priority = ProcessorPriority.LOW
 
     async def update(
         self,
@@ -11,7 +11,9 @@ from justkeepswimming.prefabs.cameras import MainCameraPrefab
 from justkeepswimming.prefabs.player import PlayerPrefab
 from justkeepswimming.scenes import SceneID
 from justkeepswimming.systems.stage import StageContext
+from justkeepswimming.utilities.bake import construct_scene
 from justkeepswimming.utilities.context import EngineContext
+from justkeepswimming.utilities.prefab import PrefabGroup
 from justkeepswimming.utilities.scene import Scene
 from justkeepswimming.systems.input import (
     InputAction,
@@ -21,12 +23,26 @@ from justkeepswimming.systems.input import (
 
 logger = logging.getLogger(__name__)
 
+BACKGROUNDS = [MinesBackgroundPrefabGroup, OceanBackgroundPrefabGroup]
+
+
+def construct(scene: Scene, background: type[PrefabGroup]) -> None:
+    MainCameraPrefab().construct("MainCamera", scene)
+    PlayerPrefab().construct("Player", scene)
+    background().construct("Background", scene)
+
 
 async def load(
     stage_context: StageContext, engine_context: EngineContext
 ) -> Scene:
     scene = Scene(SceneID.MENU, engine_context)
-    MainCameraPrefab().construct("MainCamera", scene)
+    # Each background gets a baked scene of its own.
+    background = random.choice(BACKGROUNDS)
+    construct_scene(
+        scene,
+        f"game-{background.__name__}",
+        lambda scene: construct(scene, background),
+    )
     scene.actions = [
         InputAction(
             InputActionId.PLAYER_MOVE_UP, "Move up", [KeyboardKeyType.W]
@@ -58,9 +74,4 @@ async def load(
     go_back_action.on_triggered.connect(
         lambda: stage_context.on_request_switch_scene.emit(SceneID.MENU, True)
     )
-
-    PlayerPrefab().construct("Player", scene)
-    random.choice(
-        [MinesBackgroundPrefabGroup, OceanBackgroundPrefabGroup]
-    )().construct("Background", scene)
     return scene
@@ -13,21 +13,31 @@ from justkeepswimming.prefabs.cameras import MainCameraPrefab
 from justkeepswimming.prefabs.text import TitleScreenTextPrefab
 from justkeepswimming.scenes import SceneID
 from justkeepswimming.systems.stage import StageContext
+from justkeepswimming.utilities.bake import construct_scene
 from justkeepswimming.utilities.context import CustomEventType, EngineContext
 from justkeepswimming.utilities.scene import Scene
 
 logger = logging.getLogger(__name__)
 
 
+def construct(scene: Scene) -> None:
+    MainCameraPrefab().construct("MainCamera", scene)
+    TropicalBackgroundPrefabGroup().construct("Background", scene)
+    TitleScreenTextPrefab().construct("TitleText", scene)
+    PlayButtonPrefab().construct("PlayButton", scene)
+    SettingsButtonPrefab().construct("SettingsButton", scene)
+    QuitButtonPrefab().construct("QuitButton", scene)
+
+
 async def load(
     stage_context: StageContext, engine_context: EngineContext
 ) -> Scene:
     scene = Scene(SceneID.MENU, engine_context)
-    MainCameraPrefab().construct("MainCamera", scene)
-    TropicalBackgroundPrefabGroup().construct("Background", scene)
-    TitleScreenTextPrefab().construct("TitleText", scene)
+    construct_scene(scene, "menu", construct)
 
-    play_button_prefab = PlayButtonPrefab().construct("PlayButton", scene)
+    play_button_prefab = scene.context.find_entity("PlayButton")
+    quit_button_prefab = scene.context.find_entity("QuitButton")
+    assert play_button_prefab is not None and quit_button_prefab is not None
 
     async def on_play_button_click():
         await stage_context.on_request_switch_scene.emit(SceneID.GAME, True)
@@ -36,10 +46,6 @@ async def load(
         on_play_button_click
     )
 
-    SettingsButtonPrefab().construct("SettingsButton", scene)
-
-    quit_button_prefab = QuitButtonPrefab().construct("QuitButton", scene)
-
     async def on_quit_button_click():
         logger.info("Exiting game...")
         engine_context.custom_events[CustomEventType.QUIT].dispatch()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -5,7 +6,7 @@ from datetime import datetime
 from pygame.time import Clock as PygameClock
 
 from justkeepswimming.debug.profiler import Profiler
-from justkeepswimming.utilities.signal import Signal
+from justkeepswimming.utilities.signal import Signal, deferred_events
 
 PYGAME_DELTA_TIME_SCALE = 0.001
 
@@ -27,6 +28,14 @@ class ClockAlreadyRunningException(ClockException):
 @dataclass(frozen=True)
 class TickContext:
     delta_time: float
+    # The number of ticks this context covers. Processors that skip ticks
+    # get one for all the ticks since they last ran, with their delta time
+    # added up, see `Processor.rate`.
+    frames: int = 1
+    # How far the tick is from the last simulation step to the next one,
+    # from 0 to 1, for processors that interpolate between the states of
+    # the simulation, see `Processor.fixed_step`.
+    alpha: float = 1.0
 
 
 class Clock:
@@ -48,6 +57,9 @@ class Clock:
         self.start_timestamp = datetime.now().timestamp()
         while self.running:
             await self._tick()
+            # A tick can run from start to finish without suspending, so
+            # other tasks, such as image loads, get their turn here.
+            await asyncio.sleep(0)
 
     async def _tick(self) -> None:
         with self.profiler.measure():
@@ -55,6 +67,9 @@ class Clock:
             delta_time: float = tick * PYGAME_DELTA_TIME_SCALE
             tick_data = TickContext(delta_time)
             await self.on_tick.emit(tick_data)
+            # Everything the tick deferred, such as entity and component
+            # events, goes out here, once all of it has run.
+            await deferred_events.flush()
 
     async def _stop(self) -> None:
         if not self.running:
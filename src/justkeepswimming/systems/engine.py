@@ -5,6 +5,7 @@ import time
 import pygame
 
 from justkeepswimming.debug.profiler import Profiler
+from justkeepswimming.ecs.offload import shutdown_offload
 from justkeepswimming.scenes import SceneID, menu, game
 from justkeepswimming.systems.clock import Clock, TickContext
 from justkeepswimming.systems.dispatcher import Dispatcher
@@ -58,6 +59,7 @@ class Engine:
         self._attach_debug_action()
         self.clock.on_tick.connect(self._process_game)
         self.clock.on_stop.connect(self.__profiler_save_dump)
+        self.clock.on_stop.connect(self.__shutdown_offload)
 
     async def _toggle_debug_mode(self) -> None:
         self.context.options.debug = not self.context.options.debug
@@ -78,6 +80,9 @@ class Engine:
     async def __profiler_save_dump(self) -> None:
         self.profiler.save()
 
+    async def __shutdown_offload(self) -> None:
+        shutdown_offload()
+
     def _attach_quit_handler(self) -> None:
         async def _on_quit(_: pygame.event.Event) -> None:
             await self._quit()
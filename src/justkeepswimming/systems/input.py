@@ -208,7 +208,7 @@ class Mouse:
         self._on_button_up.connect(self._handle_mouse_button_up_event)
         self._on_window_resize.connect(self._handle_window_resize_event)
 
-    async def _handle_window_resize_event(self, event: Event) -> None:
+    def _handle_window_resize_event(self, event: Event) -> None:
         self._window_size = Vector2(event.size)
 
     async def _handle_motion_event(self, event: Event) -> None:
@@ -110,7 +110,13 @@ class Stage:
     async def _transition_scene(self, scene_id: SceneID) -> None:
         await self._load_scene(scene_id)
         self.engine_context.window.fade(0.0)
-        await self.engine_context.window.reached_target_fade.wait()
+        # The fade events are deferred, so waiting for the next one here
+        # would hold up the flush that is meant to deliver it.
+        self.engine_context.window.reached_target_fade.once(
+            self._finish_transition
+        )
+
+    def _finish_transition(self) -> None:
         self.busy = True
 
     async def _load_scene(self, scene_id: SceneID) -> None:
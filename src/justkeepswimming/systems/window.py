@@ -57,8 +57,12 @@ class Window:
             self._current_fade = max(
                 self._target_fade, self._current_fade - self.fade_speed
             )
-        if self._current_fade == self._target_fade:
-            self.reached_target_fade.emit_sync()
+        if (
+            self._current_fade == self._target_fade
+            and not self._sent_fade_reached_event
+        ):
+            self._sent_fade_reached_event = True
+            self.reached_target_fade.defer()
         if self._current_fade > 0.0:
             self.draw_fade_overlay()
         pygame.display.flip()
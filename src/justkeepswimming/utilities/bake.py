@@ -0,0 +1,238 @@
+import hashlib
+import importlib
+import io
+import logging
+import pickle
+import zlib
+from collections.abc import Callable
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from pygame import Color, Vector2
+
+import justkeepswimming
+from justkeepswimming.ecs import Component, Processor
+from justkeepswimming.utilities.image import Image
+from justkeepswimming.utilities.prefab import Prefab, component_arguments
+from justkeepswimming.utilities.scene import Scene
+
+logger = logging.getLogger(__name__)
+
+BAKE_DIRECTORY = Path("cache", "scenes")
+MAGIC = b"JKSSCENE"
+FORMAT_VERSION = 2
+
+# Values that are always written out as they are, even when a prefab
+# template holds the very same object.
+BY_VALUE = (bool, int, float, str, bytes, type(None), Enum, Vector2, Color)
+
+type ComponentSpec = tuple[type[Component], dict[str, Any]]
+type TemplateReference = tuple[str, str, int, str]
+
+
+class SceneImage:
+    """
+    A fully constructed scene: the components of every entity, the
+    processors of the scheduler and the dependencies and execution order
+    computed for them.
+    """
+
+    __slots__ = ("entities", "processors", "execution_order", "dependencies")
+
+    def __init__(
+        self,
+        entities: list[tuple[str, list[ComponentSpec]]],
+        processors: list[type[Processor]],
+        execution_order: list[list[int]],
+        dependencies: list[tuple[int, int]],
+    ) -> None:
+        self.entities = entities
+        self.processors = processors
+        self.execution_order = execution_order
+        self.dependencies = dependencies
+
+
+@cache
+def source_fingerprint() -> bytes | None:
+    # Any change to the game's code, prefabs included, invalidates every
+    # baked scene. Compiled builds ship without sources and never bake.
+    root = Path(justkeepswimming.__file__).parent
+    sources = sorted(root.rglob("*.py"))
+    if not sources:
+        return None
+    # Sizes and modification times are enough to notice an edit, without
+    # reading every file on each start.
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(FORMAT_VERSION.to_bytes(2, "little"))
+    for source in sources:
+        stat = source.stat()
+        digest.update(
+            f"{source.relative_to(root).as_posix()}:{stat.st_size}:"
+            f"{stat.st_mtime_ns};".encode()
+        )
+    return digest.digest()
+
+
+def _prefab_classes() -> list[type[Prefab]]:
+    found: list[type[Prefab]] = []
+    pending = [Prefab]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            found.append(subclass)
+            pending.append(subclass)
+    return found
+
+
+def _template_references() -> dict[int, TemplateReference]:
+    # Fonts, signals, animations and the like are shared between a prefab
+    # template and every entity built from it, so they are stored as a
+    # reference to the template rather than copied.
+    references: dict[int, TemplateReference] = {}
+    for prefab in _prefab_classes():
+        components = prefab.__dict__.get("components", ())
+        for index, component in enumerate(components):
+            for name, value in component_arguments(component).items():
+                if not isinstance(value, BY_VALUE):
+                    references.setdefault(
+                        id(value),
+                        (prefab.__module__, prefab.__qualname__, index, name),
+                    )
+    return references
+
+
+def _resolve_template(reference: TemplateReference) -> Any:
+    module_name, qualname, index, name = reference
+    owner: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        owner = getattr(owner, part)
+    return getattr(owner.__dict__["components"][index], name)
+
+
+class ScenePickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.references = _template_references()
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, BY_VALUE):
+            return None
+        reference = self.references.get(id(obj))
+        if reference is not None:
+            return ("template", reference)
+        if isinstance(obj, Image):
+            return ("image", obj.path.as_posix())
+        return None
+
+
+class SceneUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        kind, value = pid
+        if kind == "template":
+            return _resolve_template(value)
+        if kind == "image":
+            return Image(Path(value))
+        raise pickle.UnpicklingError(f"Unknown persistent id {kind}.")
+
+
+def capture(scene: Scene) -> SceneImage:
+    context = scene.context
+    entities = [
+        (
+            entity.name,
+            [
+                (type(component), component_arguments(component))
+                for component in context.get_components(entity).values()
+            ],
+        )
+        for entity in sorted(context.entities.values(), key=lambda e: e.id)
+    ]
+    processors = list(scene.scheduler.processors)
+    indices = {processor: index for index, processor in enumerate(processors)}
+    execution_order = [
+        sorted(indices[processor] for processor in layer)
+        for layer in scene.scheduler.execution_order()
+    ]
+    dependencies = [
+        (indices[processor], indices[dependency])
+        for processor, dependency in scene.scheduler.dependencies()
+    ]
+    return SceneImage(
+        entities,
+        [type(processor) for processor in processors],
+        execution_order,
+        dependencies,
+    )
+
+
+def apply(image: SceneImage, scene: Scene) -> None:
+    scene.context.spawn_many(
+        (
+            name,
+            [
+                component_type(**arguments)
+                for component_type, arguments in components
+            ],
+        )
+        for name, components in image.entities
+    )
+    scene.scheduler.load_processors(
+        [processor_type() for processor_type in image.processors],
+        image.execution_order,
+        image.dependencies,
+    )
+
+
+def write(image: SceneImage, path: Path, fingerprint: bytes) -> None:
+    buffer = io.BytesIO()
+    ScenePickler(buffer).dump(image)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(MAGIC + fingerprint + zlib.compress(buffer.getvalue()))
+
+
+def read(path: Path, fingerprint: bytes) -> SceneImage | None:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    header = MAGIC + fingerprint
+    if not data.startswith(header):
+        logger.debug(f"Baked scene {path} is out of date.")
+        return None
+    payload = zlib.decompress(data[len(header) :])
+    return SceneUnpickler(io.BytesIO(payload)).load()
+
+
+def construct_scene(
+    scene: Scene, key: str, construct: Callable[[Scene], None]
+) -> None:
+    """
+    Construct a scene through ``construct``, or load it from the baked
+    scene stored under ``key`` when the game's sources have not changed
+    since it was written. Only what ``construct`` builds is baked, so
+    signal connections and other wiring belong after this call.
+    """
+    options = scene.scheduler.engine_context.options
+    fingerprint = source_fingerprint() if options.bake_scenes else None
+    if fingerprint is None:
+        construct(scene)
+        return
+
+    path = BAKE_DIRECTORY / f"{key}.scene"
+    try:
+        image = read(path, fingerprint)
+    except Exception as error:
+        logger.warning(f"Failed to read baked scene {path}: {error}")
+        image = None
+    if image is not None:
+        logger.debug(f"Loading scene {key} from {path}")
+        apply(image, scene)
+        return
+
+    construct(scene)
+    try:
+        write(capture(scene), path, fingerprint)
+        logger.info(f"Baked scene {key} to {path}")
+    except Exception as error:
+        logger.warning(f"Failed to bake scene {key}: {error}")
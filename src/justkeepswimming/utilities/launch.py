@@ -1,4 +1,15 @@
 from dataclasses import dataclass
+from enum import Enum
+
+
+class ExecutionBackend(Enum):
+    # Processors of a layer take turns on the event loop.
+    ASYNCIO = "asyncio"
+    # Processors of a layer run side by side on a thread pool.
+    THREADS = "threads"
+    # Processors run on a thread pool as soon as the ones they depend on
+    # have finished, rather than layer by layer, longest path first.
+    CRITICAL_PATH = "critical-path"
 
 
 @dataclass
@@ -6,3 +17,18 @@ class Options:
     debug: bool = False
     profiler_enabled: bool = False
     profiler_history: int = 1000
+    columnar_storage: bool = False
+    bake_scenes: bool = False
+    execution_backend: ExecutionBackend = ExecutionBackend.ASYNCIO
+    # The number of worker threads, or None to let Python decide.
+    worker_threads: int | None = None
+    # Run offloadable processors in worker processes, which implies
+    # columnar storage, kept in shared memory.
+    offload_processors: bool = False
+    worker_processes: int | None = None
+    # The milliseconds the processors of a tick may take before low
+    # priority ones are deferred, or None to always run everything.
+    frame_budget_ms: float | None = None
+    # The steps a second of the fixed step processors, or None to run them
+    # once a tick like every other processor.
+    simulation_rate: float | None = None
@@ -1,46 +1,108 @@
+import dataclasses
 import logging
+from typing import Any
 
 from justkeepswimming.ecs import Component, Entity, Processor
+from justkeepswimming.ecs.columns import VectorView
 from justkeepswimming.utilities.scene import Scene
 
 
+def component_arguments(component: Component) -> dict[str, Any]:
+    # Components that are not dataclasses take no constructor arguments.
+    if not dataclasses.is_dataclass(component):
+        return {}
+    arguments: dict[str, Any] = {}
+    for field in dataclasses.fields(component):
+        if not field.init:
+            continue
+        value = getattr(component, field.name)
+        if isinstance(value, VectorView):
+            value = value.copy()
+        arguments[field.name] = value
+    return arguments
+
+
+def copy_component(component: Component) -> Component:
+    # Only the constructor arguments are copied, so bookkeeping such as the
+    # change tick does not leak from the template into the new component.
+    return component.__class__(**component_arguments(component))
+
+
 class Prefab:
     extends: "Prefab | list[Prefab] | None" = None
     components: list[Component]
     processors: list[type[Processor]]
     logger = logging.getLogger(__name__)
 
+    def bases(self) -> "list[Prefab]":
+        if self.extends is None:
+            return []
+        if isinstance(self.extends, list):
+            return self.extends
+        return [self.extends]
+
+    def resolve_components(self) -> dict[type[Component], Component]:
+        # Components from later prefabs replace those of the same type that
+        # an extended prefab provides.
+        components: dict[type[Component], Component] = {}
+        for prefab in self.bases():
+            components.update(prefab.resolve_components())
+        for component in self.components:
+            components[type(component)] = copy_component(component)
+        return components
+
+    def processor_types(self) -> list[type[Processor]]:
+        processor_types: list[type[Processor]] = []
+        for prefab in self.bases():
+            processor_types.extend(prefab.processor_types())
+        processor_types.extend(self.processors)
+        return processor_types
+
+    def add_processors(self, scene: "Scene") -> None:
+        # The missing processors are handed to the scheduler in one batch.
+        existing = [
+            type(processor) for processor in scene.scheduler.processors
+        ]
+        missing: list[type[Processor]] = []
+        for processor_cls in self.processor_types():
+            if not any(
+                issubclass(processor_type, processor_cls)
+                for processor_type in existing + missing
+            ):
+                missing.append(processor_cls)
+        scene.scheduler.add_processors(
+            processor_cls() for processor_cls in missing
+        )
+
     def construct(
         self, name: str, scene: "Scene", use_entity: Entity | None = None
     ) -> Entity:
+        components = self.resolve_components()
         entity: Entity
         if use_entity is not None:
             entity = use_entity
+            for component_type, component in components.items():
+                if entity.has_component(component_type):
+                    entity.remove_component(
+                        entity.get_component(component_type)
+                    )
+                entity.add_component(component)
         else:
-            entity = scene.context.create_entity(name)
-
-        if self.extends:
-            if isinstance(self.extends, list):
-                for prefab in self.extends:
-                    prefab.construct(name, scene, use_entity=entity)
-            else:
-                self.extends.construct(name, scene, use_entity=entity)
-
-        for component in self.components:
-            component_type = type(component)
-            if entity.has_component(component_type):
-                entity.remove_component(entity.get_component(component_type))
-            entity.add_component(component.__class__(**vars(component)))
-
-        for processor_cls in self.processors:
-            if not any(
-                isinstance(processor, processor_cls)
-                for processor in scene.scheduler.processors
-            ):
-                scene.scheduler.add_processor(processor_cls())
-
+            entity = scene.context.spawn(name, components.values())
+        self.add_processors(scene)
         return entity
 
+    def construct_many(
+        self, count: int, name: str, scene: "Scene"
+    ) -> list[Entity]:
+        entities = scene.context.spawn_batch(
+            count,
+            lambda _: self.resolve_components().values(),
+            name,
+        )
+        self.add_processors(scene)
+        return entities
+
 
 class PrefabGroup:
     prefabs: dict[str, Prefab]
@@ -19,7 +19,10 @@ logger = logging.getLogger(__name__)
 class Scene:
     def __init__(self, id: SceneID, engine_context: EngineContext) -> None:
         self.id: SceneID = id
-        self.context = SceneContext()
+        self.context = SceneContext(
+            columnar=engine_context.options.columnar_storage,
+            shared_columns=engine_context.options.offload_processors,
+        )
         self.scheduler = ProcessorScheduler(self.context, engine_context)
 
         self.actions: list[InputAction] = []
@@ -59,6 +62,7 @@ class Scene:
             engine_context.input.action_manager.unregister_action(action)
         self.context.maid.cleanup()
         self.scheduler.cleanup()
+        self.context.release_column_stores()
 
     async def _on_window_resize(self, event: Event) -> None:
         self.context.surface = Surface(Vector2(event.w, event.h))
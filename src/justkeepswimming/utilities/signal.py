@@ -1,13 +1,18 @@
 import asyncio
+import inspect
 import logging
 from asyncio import CancelledError, Future
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any, Generic, ParamSpec
 
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 
+# Callbacks can be coroutine functions, or plain functions, which run right
+# away, and may return an awaitable to wait for.
+type Callback[**P] = Callable[P, Awaitable[Any] | None]
+
 
 class SignalException(Exception):
     pass
@@ -18,15 +23,15 @@ class ConnectionNotFoundException(SignalException):
 
 
 class Connection(Generic[P]):
-    def __init__(
-        self, signal: "Signal[P]", callback: Callable[P, Awaitable[Any]]
-    ) -> None:
-        self.callback: Callable[P, Awaitable[Any]] = callback
+    def __init__(self, signal: "Signal[P]", callback: Callback[P]) -> None:
+        self.callback: Callback[P] = callback
         self.signal = signal
 
     async def fire(self, *args: P.args, **kwargs: P.kwargs) -> None:
         if self.callback is not None:
-            await self.callback(*args, **kwargs)
+            result = self.callback(*args, **kwargs)
+            if result is not None and inspect.isawaitable(result):
+                await result
 
     @property
     def is_connected(self) -> bool:
@@ -40,7 +45,7 @@ class Signal(Generic[P]):
     def __init__(self) -> None:
         self.connections: list[Connection[P]] = []
 
-    def connect(self, callback: Callable[P, Awaitable[Any]]) -> Connection[P]:
+    def connect(self, callback: Callback[P]) -> Connection[P]:
         logger.debug(f"Connecting callback: {callback}")
         connection = Connection(self, callback)
         self.connections.append(connection)
@@ -54,29 +59,50 @@ class Signal(Generic[P]):
         self.connections.remove(connection)
 
     async def emit(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        connections = self.connections
+        if not connections:
+            return
         try:
-            tasks = [
-                connection.fire(*args, **kwargs)
-                for connection in self.connections
-            ]
-            await asyncio.gather(*tasks)
+            if len(connections) == 1:
+                # Nothing to run alongside, so no task is needed either.
+                result = connections[0].callback(*args, **kwargs)
+                if result is not None and inspect.isawaitable(result):
+                    await result
+                return
+            # Plain callbacks run as they are called, in order, and the
+            # coroutines of the others then run side by side. A copy, as
+            # callbacks may disconnect.
+            pending: list[Awaitable[Any]] = []
+            try:
+                for connection in tuple(connections):
+                    result = connection.callback(*args, **kwargs)
+                    if result is not None and inspect.isawaitable(result):
+                        pending.append(result)
+            except BaseException:
+                # The coroutines of the callbacks before never get to run.
+                for awaitable in pending:
+                    if inspect.iscoroutine(awaitable):
+                        awaitable.close()
+                raise
+            if len(pending) == 1:
+                await pending[0]
+            elif pending:
+                await asyncio.gather(*pending)
         except CancelledError:
             logger.debug(
                 "Signal emission was cancelled by asyncio, exiting..."
             )
 
-    def emit_sync(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self.emit(*args, **kwargs))
-        except RuntimeError:
-            asyncio.run(self.emit(*args, **kwargs))
+    def defer(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        """Emit at the end of the tick, see `DeferredEvents`."""
+        deferred_events.append(self, args, kwargs)
 
     async def wait(self) -> None:
         future: Future[None] = asyncio.get_event_loop().create_future()
 
         async def _on_emit(*args: P.args, **kwargs: P.kwargs) -> None:
-            future.set_result(None)
+            if not future.done():
+                future.set_result(None)
 
         connection = self.connect(_on_emit)
         try:
@@ -84,13 +110,76 @@ class Signal(Generic[P]):
         finally:
             connection.disconnect()
 
-    def once(self, callback: Callable[P, Awaitable[Any]]) -> Connection[P]:
+    def once(self, callback: Callback[P]) -> Connection[P]:
         connection: Connection[P]
 
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
             if connection:
                 connection.disconnect()
-            await callback(*args, **kwargs)
+            result = callback(*args, **kwargs)
+            if result is not None and inspect.isawaitable(result):
+                await result
 
         connection = self.connect(wrapper)
         return connection
+
+
+type Emission = tuple[Signal[Any], tuple[Any, ...]]
+
+_NO_KEYWORDS: dict[str, Any] = {}
+
+
+class DeferredEvents:
+    """
+    Emissions held back until the clock flushes them, once at the end of
+    every tick, in the order they were deferred. Emissions that handlers
+    defer during a flush go out in the same flush, after the others.
+
+    Handlers run as part of the tick, so one that waits for an emission
+    deferred after its own holds the flush up for good.
+    """
+
+    __slots__ = ("_queue",)
+
+    def __init__(self) -> None:
+        self._queue: list[
+            tuple[Signal[Any], tuple[Any, ...], dict[str, Any]]
+        ] = []
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def append(
+        self,
+        signal: Signal[Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any] = _NO_KEYWORDS,
+    ) -> None:
+        self._queue.append((signal, args, kwargs))
+
+    def extend(self, emissions: Iterable[Emission]) -> None:
+        self._queue.extend(
+            (signal, args, _NO_KEYWORDS) for signal, args in emissions
+        )
+
+    async def flush(self) -> None:
+        while self._queue:
+            queue, self._queue = self._queue, []
+            for signal, args, kwargs in queue:
+                if not signal.connections:
+                    continue
+                try:
+                    await signal.emit(*args, **kwargs)
+                except Exception:
+                    # As with a task of its own, a failing handler does not
+                    # take the rest of the events, or the tick, with it.
+                    logger.exception("Deferred signal emission failed.")
+
+
+# Shared by every world and window, and flushed by the clock.
+deferred_events = DeferredEvents()
+
+
+def defer_batch(emissions: Iterable[Emission]) -> None:
+    """Emit many signals at the end of the tick, in order."""
+    deferred_events.extend(emissions)
@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+
+# The engine context needs a display for its window, which the tests never
+# show, so they run without a real one.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest  # noqa: E402
+
+from justkeepswimming.debug.profiler import Profiler  # noqa: E402
+from justkeepswimming.systems.clock import Clock  # noqa: E402
+from justkeepswimming.systems.dispatcher import Dispatcher  # noqa: E402
+from justkeepswimming.systems.input import Input  # noqa: E402
+from justkeepswimming.systems.window import Window  # noqa: E402
+from justkeepswimming.utilities.context import EngineContext  # noqa: E402
+from justkeepswimming.utilities.launch import Options  # noqa: E402
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def engine_context(monkeypatch: pytest.MonkeyPatch) -> EngineContext:
+    # Assets are loaded relative to the root of the repository.
+    monkeypatch.chdir(ROOT)
+    dispatcher = Dispatcher()
+    profiler = Profiler(False, 1)
+    return EngineContext(
+        clock=Clock(profiler),
+        window=Window(dispatcher),
+        dispatcher=dispatcher,
+        input=Input(dispatcher),
+        profiler=profiler,
+        options=Options(),
+        custom_events={},
+    )
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+
+from justkeepswimming.debug.benchmark import synthetic_processors
+from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs.scheduler import ProcessorScheduler
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.utilities.context import EngineContext
+from justkeepswimming.utilities.launch import ExecutionBackend
+
+type Event = tuple[str, Processor]
+
+
+def record(processor: Processor, events: list[Event]) -> None:
+    """Log when ``processor`` starts and finishes each of its runs."""
+
+    async def update(
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        events.append(("start", processor))
+        # Long enough for the processors running alongside to overlap.
+        time.sleep(0.0005)
+        events.append(("end", processor))
+
+    processor.update = update  # type: ignore[method-assign]
+
+
+@pytest.mark.parametrize("backend", list(ExecutionBackend))
+def test_every_backend_keeps_to_the_dependencies(
+    engine_context: EngineContext, backend: ExecutionBackend
+) -> None:
+    engine_context.options.execution_backend = backend
+    engine_context.options.worker_threads = 2
+    context = SceneContext()
+    scheduler = ProcessorScheduler(context, engine_context)
+    processors = [
+        processor_type() for processor_type in synthetic_processors(24)
+    ]
+    events: list[Event] = []
+    for processor in processors:
+        record(processor, events)
+    scheduler.add_processors(processors)
+    dependencies = scheduler.dependencies()
+    assert dependencies
+
+    async def run() -> list[list[Event]]:
+        ticks = []
+        for _ in range(5):
+            await scheduler.process_tick(
+                TickContext(1 / 60), context, engine_context
+            )
+            ticks.append(list(events))
+            events.clear()
+        return ticks
+
+    for tick in asyncio.run(run()):
+        started = {
+            processor: index
+            for index, (kind, processor) in enumerate(tick)
+            if kind == "start"
+        }
+        ended = {
+            processor: index
+            for index, (kind, processor) in enumerate(tick)
+            if kind == "end"
+        }
+        assert len(tick) == 2 * len(processors)
+        assert set(started) == set(ended) == set(processors)
+        for processor, dependency in dependencies:
+            assert ended[dependency] < started[processor]
@@ -0,0 +1,171 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pygame import Surface
+
+import justkeepswimming
+from justkeepswimming.backgrounds.oceans import OceanBackgroundPrefabGroup
+from justkeepswimming.debug.processors.rendering import MouseDebuggerProcessor
+from justkeepswimming.ecs.scheduler import ProcessorScheduler
+from justkeepswimming.scenes import SceneID, game
+from justkeepswimming.utilities import bake
+from justkeepswimming.utilities.context import EngineContext
+from justkeepswimming.utilities.prefab import component_arguments
+from justkeepswimming.utilities.scene import Scene
+
+
+def construct(scene: Scene) -> None:
+    game.construct(scene, OceanBackgroundPrefabGroup)
+
+
+def describe(scene: Scene) -> list[tuple[str, dict[str, Any]]]:
+    # Surfaces are drawn on at run time and compare by identity, so only
+    # their size is compared.
+    return [
+        (
+            entity.name,
+            {
+                type(component).__name__: {
+                    name: (
+                        value.get_size()
+                        if isinstance(value, Surface)
+                        else value
+                    )
+                    for name, value in component_arguments(
+                        component
+                    ).items()
+                }
+                for component in scene.context.get_components(
+                    entity
+                ).values()
+            },
+        )
+        for entity in sorted(
+            scene.context.entities.values(), key=lambda e: e.id
+        )
+    ]
+
+
+def processors(scene: Scene) -> list[str]:
+    return sorted(
+        type(processor).__name__ for processor in scene.scheduler.processors
+    )
+
+
+def dependencies(scene: Scene) -> list[tuple[str, str]]:
+    return sorted(
+        (type(processor).__name__, type(dependency).__name__)
+        for processor, dependency in scene.scheduler.dependencies()
+    )
+
+
+def layers(scene: Scene) -> list[list[str]]:
+    return [
+        sorted(type(processor).__name__ for processor in layer)
+        for layer in scene.scheduler.execution_order()
+    ]
+
+
+def count_rebuilds(monkeypatch: pytest.MonkeyPatch) -> list[None]:
+    rebuilds: list[None] = []
+    rebuild = ProcessorScheduler._rebuild
+
+    def counted(scheduler: ProcessorScheduler) -> None:
+        rebuilds.append(None)
+        rebuild(scheduler)
+
+    monkeypatch.setattr(ProcessorScheduler, "_rebuild", counted)
+    return rebuilds
+
+
+def test_baked_scenes_load_as_they_were_built(
+    engine_context: EngineContext,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    built = Scene(SceneID.GAME, engine_context)
+    construct(built)
+    path = tmp_path / "game.scene"
+    bake.write(bake.capture(built), path, b"fingerprint")
+    image = bake.read(path, b"fingerprint")
+    assert image is not None
+
+    rebuilds = count_rebuilds(monkeypatch)
+    loaded = Scene(SceneID.GAME, engine_context)
+    bake.apply(image, loaded)
+    assert describe(loaded) == describe(built)
+    assert processors(loaded) == processors(built)
+    assert layers(loaded) == layers(built)
+    assert dependencies(loaded) == dependencies(built)
+
+    # Processors added later, as the debugger is on entering the scene,
+    # slot into the baked graph instead of rebuilding it.
+    loaded.scheduler.add_processor(MouseDebuggerProcessor())
+    built.scheduler.add_processor(MouseDebuggerProcessor())
+    assert layers(loaded) == layers(built)
+    assert rebuilds == []
+
+
+def test_images_of_other_sources_are_ignored(
+    engine_context: EngineContext, tmp_path: Path
+) -> None:
+    scene = Scene(SceneID.GAME, engine_context)
+    construct(scene)
+    path = tmp_path / "game.scene"
+    assert bake.read(path, b"fingerprint") is None
+    bake.write(bake.capture(scene), path, b"fingerprint")
+    assert bake.read(path, b"something else") is None
+    assert bake.read(path, b"fingerprint") is not None
+
+
+def test_construct_scene_bakes_once_per_fingerprint(
+    engine_context: EngineContext,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    engine_context.options.bake_scenes = True
+    fingerprint = b"first"
+    monkeypatch.setattr(bake, "BAKE_DIRECTORY", tmp_path)
+    monkeypatch.setattr(bake, "source_fingerprint", lambda: fingerprint)
+    constructed: list[Scene] = []
+
+    def counted(scene: Scene) -> None:
+        constructed.append(scene)
+        construct(scene)
+
+    def load() -> Scene:
+        scene = Scene(SceneID.GAME, engine_context)
+        bake.construct_scene(scene, "game", counted)
+        return scene
+
+    first = load()
+    assert (tmp_path / "game.scene").exists()
+    second = load()
+    assert constructed == [first]
+    assert len(second.context.entities) == len(first.context.entities)
+
+    fingerprint = b"second"
+    third = load()
+    assert constructed == [first, third]
+
+
+def test_fingerprints_follow_the_sources(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    fingerprint = bake.source_fingerprint.__wrapped__
+    monkeypatch.setattr(
+        justkeepswimming, "__file__", str(tmp_path / "__init__.py")
+    )
+    assert fingerprint() is None
+
+    source = tmp_path / "module.py"
+    source.write_text("answer = 42\n")
+    first = fingerprint()
+    assert first is not None and fingerprint() == first
+
+    source.write_text("answer = 420\n")
+    second = fingerprint()
+    assert second != first
+    (tmp_path / "other.py").write_text("")
+    assert fingerprint() not in (first, second)
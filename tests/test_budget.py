@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from justkeepswimming.ecs import Processor, ProcessorPriority, SceneContext
+from justkeepswimming.ecs.scheduler import (
+    MAX_DEFERRED_TICKS,
+    ProcessorScheduler,
+)
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.utilities.context import EngineContext
+
+DELTA = 1 / 60
+
+
+class Sleeper(Processor):
+    """Takes ``milliseconds`` a run, and keeps the tick context of each."""
+
+    def __init__(
+        self,
+        milliseconds: float,
+        priority: ProcessorPriority = ProcessorPriority.NORMAL,
+    ) -> None:
+        super().__init__()
+        self.milliseconds = milliseconds
+        self.priority = priority
+        self.runs: list[TickContext] = []
+
+    async def update(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        time.sleep(self.milliseconds / 1000)
+        self.runs.append(tick_context)
+
+
+def run_ticks(
+    engine_context: EngineContext, processors: list[Processor], ticks: int
+) -> None:
+    context = SceneContext()
+    scheduler = ProcessorScheduler(context, engine_context)
+    scheduler.add_processors(processors)
+
+    async def run() -> None:
+        for _ in range(ticks):
+            await scheduler.process_tick(
+                TickContext(DELTA), context, engine_context
+            )
+
+    asyncio.run(run())
+
+
+def test_low_priority_processors_wait_for_time_to_spare(
+    engine_context: EngineContext,
+) -> None:
+    engine_context.options.frame_budget_ms = 5
+    busy = Sleeper(4)
+    slow = Sleeper(3, ProcessorPriority.LOW)
+    run_ticks(engine_context, [busy, slow], 20)
+
+    # Processors at normal priority run whatever the budget.
+    assert len(busy.runs) == 20
+    assert len(slow.runs) < 20
+    # Deferred processors make up for every tick they missed, but are
+    # never put off for long.
+    assert all(run.frames <= MAX_DEFERRED_TICKS for run in slow.runs)
+    missed = 20 - sum(run.frames for run in slow.runs)
+    assert 0 <= missed < MAX_DEFERRED_TICKS
+    assert sum(run.delta_time for run in slow.runs) == pytest.approx(
+        (20 - missed) * DELTA
+    )
+
+
+def test_processors_fit_into_the_budget_run_every_tick(
+    engine_context: EngineContext,
+) -> None:
+    engine_context.options.frame_budget_ms = 50
+    busy = Sleeper(1)
+    slow = Sleeper(1, ProcessorPriority.LOWEST)
+    run_ticks(engine_context, [busy, slow], 10)
+    assert len(busy.runs) == len(slow.runs) == 10
+    assert all(run.frames == 1 for run in slow.runs)
+
+
+def test_without_a_budget_nothing_is_deferred(
+    engine_context: EngineContext,
+) -> None:
+    busy = Sleeper(4)
+    slow = Sleeper(3, ProcessorPriority.LOWEST)
+    run_ticks(engine_context, [busy, slow], 5)
+    assert len(slow.runs) == 5
@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+
+import pytest
+
+from justkeepswimming.components.physics import (
+    AngularPhysicsComponent,
+    TransformComponent,
+)
+from justkeepswimming.ecs import SceneContext
+from justkeepswimming.ecs.changes import processor_run
+from justkeepswimming.ecs.query import QueryRow
+
+
+def names(rows: Iterable[QueryRow]) -> list[str]:
+    return sorted(entity.name for entity, _ in rows)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_changed_queries_see_marked_writes_since_the_last_run(
+    columnar: bool,
+) -> None:
+    context = SceneContext(columnar=columnar)
+    first = context.spawn("first", [TransformComponent()])
+    second = context.spawn("second", [TransformComponent()])
+
+    # Everything counts as changed for a processor that never ran.
+    with processor_run(0) as last_run:
+        assert names(
+            context.query(TransformComponent, changed=TransformComponent)
+        ) == ["first", "second"]
+
+    transform = first.get_component(TransformComponent)
+    transform.rotation = 45.0
+    transform.mark_changed()
+    # Writes are only seen once they are marked.
+    second.get_component(TransformComponent).rotation = 90.0
+    with processor_run(last_run) as last_run:
+        assert names(
+            context.query(TransformComponent, changed=TransformComponent)
+        ) == ["first"]
+
+    with processor_run(last_run):
+        assert names(
+            context.query(TransformComponent, changed=TransformComponent)
+        ) == []
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_writes_of_one_processor_are_new_to_the_next(
+    columnar: bool,
+) -> None:
+    context = SceneContext(columnar=columnar)
+    entity = context.spawn("entity", [TransformComponent()])
+    with processor_run(0) as reader_run:
+        pass
+
+    with processor_run(0) as writer_run:
+        entity.get_component(TransformComponent).mark_changed()
+    assert entity.get_component(TransformComponent).last_changed() == (
+        writer_run
+    )
+
+    with processor_run(reader_run):
+        assert names(
+            context.query(TransformComponent, changed=TransformComponent)
+        ) == ["entity"]
+    # The writer has seen its own writes.
+    with processor_run(writer_run):
+        assert names(
+            context.query(TransformComponent, changed=TransformComponent)
+        ) == []
+
+
+def test_added_components_count_as_changed() -> None:
+    context = SceneContext()
+    entity = context.spawn("entity", [TransformComponent()])
+    with processor_run(0) as last_run:
+        pass
+
+    entity.add_component(AngularPhysicsComponent())
+    with processor_run(last_run):
+        assert names(
+            context.query(
+                TransformComponent,
+                AngularPhysicsComponent,
+                changed=AngularPhysicsComponent,
+            )
+        ) == ["entity"]
+        assert names(
+            context.query(TransformComponent, changed=TransformComponent)
+        ) == []
+
+
+def test_changes_need_a_required_term() -> None:
+    context = SceneContext()
+    context.spawn("entity", [TransformComponent()])
+    with pytest.raises(ValueError):
+        list(
+            context.query(
+                TransformComponent, changed=AngularPhysicsComponent
+            )
+        )
@@ -0,0 +1,53 @@
+import copy
+
+from pygame import Vector2
+
+from justkeepswimming.components.physics import TransformComponent
+from justkeepswimming.ecs import SceneContext
+from justkeepswimming.ecs.columns import VectorView
+
+
+def test_column_fields_read_and_write_the_store() -> None:
+    context = SceneContext(columnar=True)
+    entity = context.spawn(
+        "entity", [TransformComponent(position=Vector2(1, 2))]
+    )
+    transform = entity.get_component(TransformComponent)
+    store = context.column_stores[TransformComponent]
+    assert transform.column_store is store
+    assert isinstance(transform.position, VectorView)
+
+    transform.position.x = 3
+    transform.position += Vector2(1, 1)
+    transform.position.scale_to_length(10)
+    transform.rotation = 30.0
+    assert transform.position == Vector2(8, 6)
+    row = store.arrays["position"][transform.column_index]
+    assert row.tolist() == [8, 6]
+    assert store.arrays["rotation"][transform.column_index] == 30.0
+
+
+def test_components_keep_their_values_when_they_leave_the_store() -> None:
+    context = SceneContext(columnar=True)
+    entity = context.spawn(
+        "entity", [TransformComponent(position=Vector2(1, 2))]
+    )
+    transform = entity.get_component(TransformComponent)
+    transform.position.y = 5
+    entity.remove_component(transform)
+    assert transform.column_store is None
+    assert type(transform.position) is Vector2
+    assert transform.position == Vector2(1, 5)
+
+
+def test_copied_scenes_have_stores_of_their_own() -> None:
+    context = SceneContext(columnar=True)
+    entity = context.spawn(
+        "entity", [TransformComponent(position=Vector2(1, 2))]
+    )
+    copied = copy.deepcopy(context)
+    transform = copied.entities[entity.id].get_component(TransformComponent)
+    assert transform.column_store is copied.column_stores[TransformComponent]
+    transform.position.x = 9
+    assert transform.position == Vector2(9, 2)
+    assert entity.get_component(TransformComponent).position == Vector2(1, 2)
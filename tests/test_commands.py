@@ -0,0 +1,111 @@
+import asyncio
+from dataclasses import dataclass
+
+from justkeepswimming.ecs import Component, Entity, SceneContext
+from justkeepswimming.utilities.signal import deferred_events
+
+
+@dataclass(slots=True)
+class Health(Component):
+    points: int
+
+
+@dataclass(slots=True)
+class Armour(Component):
+    points: int
+
+
+def record_events(context: SceneContext, events: list[str]) -> None:
+    """Record the scene's entity and component events as they go out."""
+
+    def created(entity: Entity) -> None:
+        events.append(f"created {entity.name}")
+
+    def deleted(entity: Entity) -> None:
+        events.append(f"deleted {entity.name}")
+
+    def added(event: tuple[Entity, Component]) -> None:
+        entity, component = event
+        events.append(f"added {type(component).__name__} to {entity.name}")
+
+    def removed(event: tuple[Entity, Component]) -> None:
+        entity, component = event
+        events.append(
+            f"removed {type(component).__name__} from {entity.name}"
+        )
+
+    context.on_entity_created.connect(created)
+    context.on_entity_deleted.connect(deleted)
+    context.on_component_added.connect(added)
+    context.on_component_removed.connect(removed)
+
+
+def test_commands_wait_for_the_flush() -> None:
+    context = SceneContext()
+    entity = context.spawn("target", [Health(3)])
+    context.commands.add_component(entity, Armour(1))
+    context.commands.remove_component(entity, Health)
+    assert len(context.commands) == 2
+    assert entity.has_component(Health)
+    assert not entity.has_component(Armour)
+
+    context.commands.flush()
+    assert len(context.commands) == 0
+    assert not entity.has_component(Health)
+    assert entity.get_component(Armour) == Armour(1)
+
+
+def test_commands_apply_in_the_order_they_were_recorded() -> None:
+    context = SceneContext()
+    commands = context.commands
+    entity = commands.spawn("target", [Health(1)])
+    commands.add_component(entity, Armour(1))
+    commands.add_component(entity, Health(2))
+    commands.remove_component(entity, Armour)
+    commands.add_component(entity, Armour(3))
+    commands.flush()
+    assert entity.get_component(Health) == Health(2)
+    assert entity.get_component(Armour) == Armour(3)
+    assert [found for found, _ in context.query(Health, Armour)] == [entity]
+
+
+def test_nothing_applies_to_an_entity_after_its_despawn() -> None:
+    context = SceneContext()
+    commands = context.commands
+    entity = commands.spawn("short-lived", [Health(1)])
+    commands.add_component(entity, Armour(1))
+    commands.despawn(entity)
+    commands.add_component(entity, Armour(2))
+    survivor = commands.spawn("survivor", [Health(2)])
+    commands.flush()
+    assert not entity.alive
+    assert context.entities == {survivor.id: survivor}
+    assert [found for found, _ in context.query(Health)] == [survivor]
+    assert context.query_count(Armour) == 0
+
+
+def test_events_go_out_in_command_order() -> None:
+    context = SceneContext()
+    asyncio.run(deferred_events.flush())
+    events: list[str] = []
+    record_events(context, events)
+    existing = context.spawn("existing", [Health(1)])
+    asyncio.run(deferred_events.flush())
+    events.clear()
+
+    commands = context.commands
+    spawned = commands.spawn("spawned", [Health(2)])
+    commands.add_component(existing, Armour(1))
+    commands.remove_component(existing, Health)
+    commands.despawn(spawned)
+    commands.flush()
+    assert events == []
+
+    asyncio.run(deferred_events.flush())
+    assert events == [
+        "created spawned",
+        "added Health to spawned",
+        "added Armour to existing",
+        "removed Health from existing",
+        "deleted spawned",
+    ]
@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from justkeepswimming.datatypes.dag import (
+    CyclicalDependencyError,
+    DirectedAcyclicGraph,
+    DirectedAcyclicGraphNode,
+    NodeAlreadyExistsError,
+    NodeNotFoundError,
+)
+
+type Graph = tuple[
+    DirectedAcyclicGraph[str], dict[str, DirectedAcyclicGraphNode[str]]
+]
+
+
+def build_graph(names: str, edges: list[tuple[str, str]]) -> Graph:
+    """A graph where each ``(a, b)`` edge makes ``a`` depend on ``b``."""
+    graph = DirectedAcyclicGraph[str]()
+    nodes = {
+        name: graph.insert_node(DirectedAcyclicGraphNode(name))
+        for name in names
+    }
+    for node, dependency in edges:
+        graph.set_dependency(nodes[node], nodes[dependency])
+    return graph, nodes
+
+
+def random_edges(names: str, seed: int) -> list[tuple[str, str]]:
+    # Edges only ever point back in the list of names, so there is no cycle.
+    generator = random.Random(seed)
+    return [
+        (names[later], names[earlier])
+        for later in range(len(names))
+        for earlier in range(later)
+        if generator.random() < 0.2
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_topological_sort_puts_dependencies_first(seed: int) -> None:
+    names = "abcdefghijklmnopqrst"
+    edges = random_edges(names, seed)
+    graph, _ = build_graph(names, edges)
+    order = graph.topological_sort()
+    assert sorted(order) == sorted(names)
+    position = {name: index for index, name in enumerate(order)}
+    for node, dependency in edges:
+        assert position[dependency] < position[node]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parallel_sort_layers_by_longest_path(seed: int) -> None:
+    names = "abcdefghijklmnopqrst"
+    edges = random_edges(names, seed)
+    graph, _ = build_graph(names, edges)
+    layers = graph.parallel_sort()
+    assert sorted(name for layer in layers for name in layer) == sorted(
+        names
+    )
+    layer_of = {
+        name: index for index, layer in enumerate(layers) for name in layer
+    }
+    for name in names:
+        dependencies = [
+            dependency for node, dependency in edges if node == name
+        ]
+        # Every node runs in the layer right after its latest dependency.
+        assert layer_of[name] == max(
+            (layer_of[dependency] + 1 for dependency in dependencies),
+            default=0,
+        )
+
+
+def test_independent_nodes_share_a_layer() -> None:
+    graph, _ = build_graph("abcd", [("c", "a"), ("d", "b"), ("d", "c")])
+    assert graph.parallel_sort() == [{"a", "b"}, {"c"}, {"d"}]
+
+
+def test_dependencies_that_close_a_cycle_are_rejected() -> None:
+    graph, nodes = build_graph("abc", [("b", "a"), ("c", "b")])
+    with pytest.raises(CyclicalDependencyError):
+        graph.set_dependency(nodes["a"], nodes["c"])
+    with pytest.raises(CyclicalDependencyError):
+        graph.set_dependency(nodes["a"], nodes["b"])
+    with pytest.raises(CyclicalDependencyError):
+        graph.set_dependency(nodes["a"], nodes["a"])
+    # A rejected dependency leaves the graph as it was.
+    assert graph.topological_sort() == ["a", "b", "c"]
+    assert not graph.requires(nodes["a"], nodes["c"])
+    assert graph.requires(nodes["c"], nodes["a"])
+
+
+def test_sorts_report_cycles_made_behind_the_graphs_back() -> None:
+    graph, nodes = build_graph("abc", [("b", "a"), ("c", "b")])
+    nodes["a"].depends_on.add(nodes["c"])
+    nodes["c"].dependents.add(nodes["a"])
+    with pytest.raises(CyclicalDependencyError):
+        graph.topological_sort()
+    with pytest.raises(CyclicalDependencyError):
+        graph.parallel_sort()
+
+
+def test_nodes_must_belong_to_the_graph_once() -> None:
+    graph, nodes = build_graph("a", [])
+    with pytest.raises(NodeAlreadyExistsError):
+        graph.insert_node(nodes["a"])
+    with pytest.raises(NodeNotFoundError):
+        graph.set_dependency(nodes["a"], DirectedAcyclicGraphNode("b"))
+
+
+def test_bottom_levels_follow_the_most_expensive_path() -> None:
+    graph, _ = build_graph(
+        "abcd", [("b", "a"), ("c", "a"), ("d", "b"), ("d", "c")]
+    )
+    costs = {"a": 1.0, "b": 5.0, "c": 2.0, "d": 1.0}
+    assert graph.bottom_levels(costs.__getitem__) == {
+        "a": 7.0,
+        "b": 6.0,
+        "c": 3.0,
+        "d": 1.0,
+    }
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+import pytest
+
+from justkeepswimming.debug.profiler import Profiler
+from justkeepswimming.systems.clock import Clock, TickContext
+from justkeepswimming.utilities.signal import (
+    DeferredEvents,
+    Signal,
+    defer_batch,
+    deferred_events,
+)
+
+
+def test_events_go_out_in_the_order_they_were_deferred() -> None:
+    events = DeferredEvents()
+    first, second = Signal[str](), Signal[str]()
+    calls: list[str] = []
+    first.connect(lambda value: calls.append(f"first {value}"))
+    second.connect(lambda value: calls.append(f"second {value}"))
+    events.append(first, ("a",))
+    events.append(second, ("b",))
+    events.extend([(first, ("c",)), (second, ("d",))])
+    assert calls == []
+    assert len(events) == 4
+
+    asyncio.run(events.flush())
+    assert calls == ["first a", "second b", "first c", "second d"]
+    assert len(events) == 0
+
+
+def test_events_deferred_during_a_flush_go_out_in_it() -> None:
+    events = DeferredEvents()
+    outer, inner = Signal[int](), Signal[int]()
+    calls: list[str] = []
+
+    def on_outer(value: int) -> None:
+        calls.append(f"outer {value}")
+        events.append(inner, (value,))
+
+    outer.connect(on_outer)
+    inner.connect(lambda value: calls.append(f"inner {value}"))
+    events.append(outer, (1,))
+    events.append(outer, (2,))
+    asyncio.run(events.flush())
+    assert calls == ["outer 1", "outer 2", "inner 1", "inner 2"]
+
+
+def test_a_failing_handler_does_not_stop_the_flush(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    events = DeferredEvents()
+    failing, working = Signal[int](), Signal[int]()
+    calls: list[int] = []
+
+    def fail(value: int) -> None:
+        raise ValueError(value)
+
+    failing.connect(fail)
+    working.connect(calls.append)
+    events.append(failing, (1,))
+    events.append(working, (2,))
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(events.flush())
+    assert calls == [2]
+    assert "Deferred signal emission failed." in caplog.text
+
+
+def test_the_clock_flushes_at_the_end_of_every_tick() -> None:
+    asyncio.run(deferred_events.flush())
+    clock = Clock(Profiler(False, 1))
+    signal = Signal[int]()
+    calls: list[str] = []
+    signal.connect(lambda value: calls.append(f"event {value}"))
+
+    async def on_tick(tick_context: TickContext) -> None:
+        ticks = calls.count("tick")
+        calls.append("tick")
+        signal.defer(ticks)
+        defer_batch([(signal, (ticks + 10,))])
+        if ticks == 1:
+            await clock.on_stop.emit()
+
+    clock.on_tick.connect(on_tick)
+    asyncio.run(clock.on_start.emit())
+    assert calls == [
+        "tick",
+        "event 0",
+        "event 10",
+        "tick",
+        "event 1",
+        "event 11",
+    ]
@@ -0,0 +1,65 @@
+import pytest
+
+from justkeepswimming.components.physics import TransformComponent
+from justkeepswimming.ecs import (
+    PendingEntityException,
+    SceneContext,
+    StaleEntityException,
+)
+from justkeepswimming.ecs.allocator import EntityAllocator
+
+
+def test_released_indices_come_back_with_a_new_generation() -> None:
+    allocator = EntityAllocator()
+    first = allocator.allocate()
+    second = allocator.allocate()
+    assert first == (0, 0) and second == (1, 0)
+
+    allocator.release(0)
+    assert not allocator.is_alive(*first)
+    assert allocator.allocate() == (0, 1)
+    assert allocator.is_alive(0, 1)
+    assert len(allocator) == 2
+
+
+def test_stale_handles_are_rejected() -> None:
+    context = SceneContext()
+    old = context.spawn("old", [TransformComponent()])
+    context.delete_entity(old)
+    new = context.spawn("new", [TransformComponent()])
+
+    # The new entity took over the index of the deleted one.
+    assert new.id == old.id and new.generation == old.generation + 1
+    assert new.alive and not old.alive
+    with pytest.raises(StaleEntityException):
+        old.get_component(TransformComponent)
+    with pytest.raises(StaleEntityException):
+        old.add_component(TransformComponent())
+    with pytest.raises(StaleEntityException):
+        context.has_component(old, TransformComponent)
+
+
+def test_stale_handles_do_not_touch_the_new_entity() -> None:
+    context = SceneContext()
+    old = context.create_entity("old")
+    context.delete_entity(old)
+    new = context.spawn("new", [TransformComponent()])
+
+    context.delete_entity(old)
+    assert new.alive
+    assert context.entities == {new.id: new}
+
+    context.commands.despawn(old)
+    context.commands.flush()
+    assert new.alive
+
+
+def test_reserved_entities_are_pending_until_spawned() -> None:
+    context = SceneContext()
+    entity = context.commands.spawn("pending", [TransformComponent()])
+    assert entity.alive
+    with pytest.raises(PendingEntityException):
+        entity.get_component(TransformComponent)
+
+    context.commands.flush()
+    assert entity.has_component(TransformComponent)
@@ -0,0 +1,134 @@
+import asyncio
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from justkeepswimming.ecs import Component, Processor, SceneContext
+from justkeepswimming.ecs.scheduler import (
+    MAX_SIMULATION_STEPS,
+    FixedStepOrderException,
+    ProcessorScheduler,
+)
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.utilities.context import EngineContext
+
+RATE = 60
+
+
+@dataclass(slots=True)
+class Position(Component):
+    x: float = 0.0
+
+
+class Recorder(Processor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.runs: list[TickContext] = []
+
+    async def update(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        self.runs.append(tick_context)
+
+
+class Simulation(Recorder):
+    fixed_step = True
+    writes = frozenset({Position})
+
+
+class Rendering(Recorder):
+    reads = frozenset({Position})
+
+
+def simulate(
+    engine_context: EngineContext, deltas: list[float]
+) -> tuple[Simulation, Rendering, list[int]]:
+    """Run a tick for each of ``deltas``, and count the steps of each."""
+    engine_context.options.simulation_rate = RATE
+    context = SceneContext()
+    scheduler = ProcessorScheduler(context, engine_context)
+    simulation, rendering = Simulation(), Rendering()
+    scheduler.add_processors([rendering, simulation])
+    steps: list[int] = []
+
+    async def run() -> None:
+        for delta in deltas:
+            before = len(simulation.runs)
+            await scheduler.process_tick(
+                TickContext(delta), context, engine_context
+            )
+            steps.append(len(simulation.runs) - before)
+
+    asyncio.run(run())
+    return simulation, rendering, steps
+
+
+def test_short_ticks_share_a_step(engine_context: EngineContext) -> None:
+    simulation, rendering, steps = simulate(
+        engine_context, [1 / (2 * RATE)] * 6
+    )
+    assert steps == [0, 1, 0, 1, 0, 1]
+    assert all(run.delta_time == 1 / RATE for run in simulation.runs)
+    assert [run.alpha for run in rendering.runs] == pytest.approx(
+        [0.5, 0, 0.5, 0, 0.5, 0]
+    )
+
+
+def test_long_ticks_take_several_steps(
+    engine_context: EngineContext,
+) -> None:
+    simulation, rendering, steps = simulate(
+        engine_context, [2.5 / RATE] * 4
+    )
+    assert steps == [2, 3, 2, 3]
+    assert len(rendering.runs) == 4
+    assert [run.alpha for run in rendering.runs] == pytest.approx(
+        [0.5, 0, 0.5, 0]
+    )
+
+
+def test_the_simulation_falls_behind_rather_than_spiralling(
+    engine_context: EngineContext,
+) -> None:
+    _, rendering, steps = simulate(engine_context, [1.0, 1 / RATE])
+    assert steps == [MAX_SIMULATION_STEPS, 1]
+    assert [run.alpha for run in rendering.runs] == pytest.approx([0, 0])
+
+
+def test_steps_keep_up_with_the_time_that_passed(
+    engine_context: EngineContext,
+) -> None:
+    generator = random.Random(5)
+    deltas = [generator.uniform(0.001, 0.05) for _ in range(300)]
+    simulation, rendering, steps = simulate(engine_context, deltas)
+    assert all(0 <= run.alpha <= 1 for run in rendering.runs)
+    assert len(rendering.runs) == len(deltas)
+    # Steps plus the fraction of a step still to go add up to the time.
+    simulated = (len(simulation.runs) + rendering.runs[-1].alpha) / RATE
+    assert simulated == pytest.approx(sum(deltas))
+
+
+def test_the_simulation_cannot_wait_on_other_processors(
+    engine_context: EngineContext,
+) -> None:
+    class Input(Processor):
+        writes = frozenset({Position})
+
+    class LateSimulation(Simulation):
+        after = frozenset({Input})
+        alongside = frozenset({Input})
+
+    engine_context.options.simulation_rate = RATE
+    context = SceneContext()
+    scheduler = ProcessorScheduler(context, engine_context)
+    scheduler.add_processors([Input(), LateSimulation()])
+    with pytest.raises(FixedStepOrderException):
+        asyncio.run(
+            scheduler.process_tick(
+                TickContext(1 / RATE), context, engine_context
+            )
+        )
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from pygame import Vector2
+
+from justkeepswimming.components.physics import (
+    AngularPhysicsComponent,
+    InterpolatedTransformComponent,
+    LinearPhysicsComponent,
+    TransformComponent,
+)
+from justkeepswimming.ecs import Entity, SceneContext
+from justkeepswimming.ecs.scheduler import ProcessorScheduler
+from justkeepswimming.processors.interpolation import (
+    TransformHistoryProcessor,
+    TransformInterpolationProcessor,
+)
+from justkeepswimming.processors.physics import (
+    AngularPhysicsProcessor,
+    LinearPhysicsProcessor,
+)
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.utilities.context import EngineContext
+
+RATE = 60
+DELTA = 0.007
+
+
+def spawn_body(
+    context: SceneContext, velocity: Vector2, angular_velocity: float
+) -> Entity:
+    return context.spawn(
+        "body",
+        [
+            TransformComponent(position=Vector2(300, 200), rotation=45.0),
+            LinearPhysicsComponent(
+                velocity=velocity,
+                drag=Vector2(0, 0),
+                max_velocity=Vector2(1000, 1000),
+            ),
+            AngularPhysicsComponent(
+                angular_velocity=angular_velocity, angular_drag=0
+            ),
+            InterpolatedTransformComponent(),
+        ],
+    )
+
+
+def run_ticks(
+    engine_context: EngineContext,
+    context: SceneContext,
+    entity: Entity,
+    ticks: int,
+) -> list[tuple[tuple[float, float], float]]:
+    """The transform of ``entity`` after each tick."""
+    scheduler = ProcessorScheduler(context, engine_context)
+    scheduler.add_processors(
+        [
+            LinearPhysicsProcessor(),
+            AngularPhysicsProcessor(),
+            TransformHistoryProcessor(),
+            TransformInterpolationProcessor(),
+        ]
+    )
+    transforms = []
+
+    async def run() -> None:
+        for _ in range(ticks):
+            await scheduler.process_tick(
+                TickContext(DELTA), context, engine_context
+            )
+            transform = entity.get_component(TransformComponent)
+            transforms.append(
+                (tuple(transform.position), transform.rotation)
+            )
+
+    asyncio.run(run())
+    return transforms
+
+
+def test_bodies_at_rest_stay_where_they_were_placed(
+    engine_context: EngineContext,
+) -> None:
+    engine_context.options.simulation_rate = RATE
+    context = SceneContext()
+    entity = spawn_body(context, Vector2(0, 0), 0.0)
+    # The first ticks are shorter than a step, so they run no simulation.
+    assert run_ticks(engine_context, context, entity, 5) == [
+        ((300, 200), 45.0)
+    ] * 5
+
+
+def test_moving_bodies_are_shown_between_their_steps(
+    engine_context: EngineContext,
+) -> None:
+    engine_context.options.simulation_rate = RATE
+    context = SceneContext()
+    entity = spawn_body(context, Vector2(60, 0), 90.0)
+    transforms = run_ticks(engine_context, context, entity, 30)
+    positions = [position for position, _ in transforms]
+    rotations = [rotation for _, rotation in transforms]
+    assert positions[0] == (300, 200)
+    assert rotations[0] == 45.0
+    # Never further than the simulation, and never going back.
+    for tick, ((x, y), rotation) in enumerate(transforms, start=1):
+        assert y == pytest.approx(200)
+        assert 300 <= x <= 300 + 60 * tick * DELTA + 1e-9
+        assert 45 <= rotation <= 45 + 90 * tick * DELTA + 1e-9
+    assert positions == sorted(positions)
+    assert rotations == sorted(rotations)
+    assert positions[-1][0] > 300
+
+
+def test_without_a_simulation_rate_nothing_is_interpolated(
+    engine_context: EngineContext,
+) -> None:
+    context = SceneContext()
+    entity = spawn_body(context, Vector2(60, 0), 90.0)
+    transforms = run_ticks(engine_context, context, entity, 3)
+    assert [position[0] for position, _ in transforms] == pytest.approx(
+        [300 + 60 * tick * DELTA for tick in range(1, 4)]
+    )
+    assert not entity.get_component(InterpolatedTransformComponent).seeded
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from justkeepswimming.ecs import Processor, SceneContext
+from justkeepswimming.ecs.scheduler import (
+    InvalidRateException,
+    ProcessorScheduler,
+)
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.utilities.context import EngineContext
+
+DELTA = 1 / 60
+
+
+class Recorder(Processor):
+    """Keeps the tick context of every run."""
+
+    def __init__(
+        self,
+        rate: int = 1,
+        phase: int | None = None,
+        frequency: float | None = None,
+    ) -> None:
+        super().__init__()
+        self.rate = rate
+        self.phase = phase
+        self.frequency = frequency
+        self.runs: list[TickContext] = []
+
+    async def update(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        self.runs.append(tick_context)
+
+
+def run_ticks(
+    engine_context: EngineContext, recorders: list[Recorder], ticks: int
+) -> list[list[int]]:
+    """The ticks each of ``recorders`` ran on."""
+    context = SceneContext()
+    scheduler = ProcessorScheduler(context, engine_context)
+    scheduler.add_processors(recorders)
+    ran: list[list[int]] = [[] for _ in recorders]
+
+    async def run() -> None:
+        for tick in range(ticks):
+            counts = [len(recorder.runs) for recorder in recorders]
+            await scheduler.process_tick(
+                TickContext(DELTA), context, engine_context
+            )
+            for index, recorder in enumerate(recorders):
+                if len(recorder.runs) > counts[index]:
+                    ran[index].append(tick)
+
+    asyncio.run(run())
+    return ran
+
+
+def test_rates_skip_ticks_and_add_up_their_time(
+    engine_context: EngineContext,
+) -> None:
+    every, third, late = Recorder(), Recorder(3, 0), Recorder(3, 1)
+    assert run_ticks(engine_context, [every, third, late], 9) == [
+        list(range(9)),
+        [0, 3, 6],
+        [1, 4, 7],
+    ]
+    assert [run.frames for run in third.runs] == [1, 3, 3]
+    assert [run.delta_time for run in third.runs] == pytest.approx(
+        [DELTA, 3 * DELTA, 3 * DELTA]
+    )
+    assert [run.frames for run in late.runs] == [2, 3, 3]
+
+
+def test_processors_without_a_phase_are_spread_out(
+    engine_context: EngineContext,
+) -> None:
+    first, second = Recorder(2), Recorder(2)
+    ran = run_ticks(engine_context, [first, second], 8)
+    assert sorted(ran) == [[0, 2, 4, 6], [1, 3, 5, 7]]
+
+
+def test_frequencies_follow_the_time_that_passed(
+    engine_context: EngineContext,
+) -> None:
+    recorder = Recorder(frequency=20)
+    [ran] = run_ticks(engine_context, [recorder], 60)
+    assert ran == list(range(0, 60, 3))
+    assert [run.delta_time for run in recorder.runs[1:]] == pytest.approx(
+        [3 * DELTA] * 19
+    )
+
+
+@pytest.mark.parametrize(
+    "recorder", [Recorder(rate=0), Recorder(frequency=0)]
+)
+def test_rates_have_to_be_positive(
+    engine_context: EngineContext, recorder: Recorder
+) -> None:
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    with pytest.raises(InvalidRateException):
+        scheduler.add_processor(recorder)
@@ -0,0 +1,152 @@
+import asyncio
+import random
+
+from pygame import Vector2
+
+from justkeepswimming.components.input import (
+    PlayerAngularMovementInputComponent,
+    PlayerLinearMovementInputComponent,
+)
+from justkeepswimming.components.physics import (
+    AngularPhysicsComponent,
+    LinearPhysicsComponent,
+    TransformComponent,
+)
+from justkeepswimming.ecs import SceneContext
+from justkeepswimming.ecs.offload import run_offloaded, shutdown_offload
+from justkeepswimming.processors.physics import (
+    AngularPhysicsProcessor,
+    LinearPhysicsProcessor,
+)
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.systems.engine import EngineContext
+
+type BodyState = tuple[
+    tuple[float, float], float, tuple[float, float], float
+]
+
+
+def build_scene(
+    columnar: bool, count: int, shared_columns: bool = False
+) -> SceneContext:
+    """A scene of bodies in every state the integration handles."""
+    generator = random.Random(3)
+    context = SceneContext(columnar=columnar, shared_columns=shared_columns)
+    for index in range(count):
+        components = [
+            TransformComponent(
+                position=Vector2(
+                    generator.uniform(-50, 50), generator.uniform(-50, 50)
+                ),
+                rotation=generator.choice(
+                    [0.0, 90.0, generator.uniform(-400, 400)]
+                ),
+            ),
+            LinearPhysicsComponent(
+                velocity=Vector2(generator.uniform(-50, 50), 3),
+                drag=Vector2(generator.uniform(0, 80), 0.6),
+                max_velocity=Vector2(40, 30),
+            ),
+            AngularPhysicsComponent(
+                angular_velocity=generator.uniform(-300, 300),
+                angular_drag=generator.uniform(0, 70),
+            ),
+        ]
+        if index % 7 == 0:
+            components.append(
+                PlayerLinearMovementInputComponent(
+                    Vector2(
+                        generator.choice([0, 1, -1, 0.3]),
+                        generator.choice([0, 1, 0.5]),
+                    )
+                )
+            )
+            components.append(
+                PlayerAngularMovementInputComponent(
+                    generator.choice([0.0, 1.0, -1.0])
+                )
+            )
+        context.spawn(str(index), components)
+    return context
+
+
+def simulate(
+    context: SceneContext,
+    engine_context: EngineContext,
+    ticks: int,
+    offload: bool = False,
+) -> list[BodyState]:
+    processors = [AngularPhysicsProcessor(), LinearPhysicsProcessor()]
+
+    async def run() -> None:
+        for tick in range(ticks):
+            tick_context = TickContext(1 / 60 + (tick % 5) * 0.003)
+            for processor in processors:
+                if not offload:
+                    await processor.update(
+                        tick_context, context, engine_context
+                    )
+                    continue
+                job = processor.offload(
+                    tick_context, context, engine_context
+                )
+                if job is not None:
+                    await run_offloaded(job, workers=1)
+
+    asyncio.run(run())
+    states = []
+    for entity in sorted(context.entities.values(), key=lambda e: e.id):
+        transform = entity.get_component(TransformComponent)
+        linear_physics = entity.get_component(LinearPhysicsComponent)
+        angular_physics = entity.get_component(AngularPhysicsComponent)
+        states.append(
+            (
+                (transform.position.x, transform.position.y),
+                transform.rotation,
+                (linear_physics.velocity.x, linear_physics.velocity.y),
+                angular_physics.angular_velocity,
+            )
+        )
+    return states
+
+
+def test_columns_integrate_like_the_loop(
+    engine_context: EngineContext,
+) -> None:
+    objects = simulate(build_scene(False, 500), engine_context, 60)
+    columns = simulate(build_scene(True, 500), engine_context, 60)
+    assert columns == objects
+
+
+def test_offloaded_jobs_integrate_like_the_main_process(
+    engine_context: EngineContext,
+) -> None:
+    shared = build_scene(True, 200, shared_columns=True)
+    try:
+        offloaded = simulate(shared, engine_context, 10, offload=True)
+    finally:
+        shutdown_offload()
+        shared.release_column_stores()
+    columns = simulate(build_scene(True, 200), engine_context, 10)
+    assert offloaded == columns
+
+
+def test_bodies_come_to_rest_under_drag(
+    engine_context: EngineContext,
+) -> None:
+    context = SceneContext()
+    context.spawn(
+        "body",
+        [
+            TransformComponent(),
+            LinearPhysicsComponent(
+                velocity=Vector2(100, 0), drag=Vector2(5, 5)
+            ),
+            AngularPhysicsComponent(angular_velocity=90, angular_drag=5),
+        ],
+    )
+    [(position, rotation, velocity, angular_velocity)] = simulate(
+        context, engine_context, 600
+    )
+    assert position[0] > 0 and rotation > 0
+    assert abs(velocity[0]) < 1e-6 and abs(angular_velocity) < 1e-6
@@ -0,0 +1,98 @@
+import asyncio
+from dataclasses import dataclass
+
+from justkeepswimming.ecs import Component, Processor, SceneContext
+from justkeepswimming.ecs.scheduler import ProcessorScheduler
+from justkeepswimming.systems.clock import TickContext
+from justkeepswimming.utilities.context import EngineContext
+
+
+@dataclass(slots=True)
+class Position(Component):
+    x: float = 0.0
+
+
+class Counter(Processor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.runs = 0
+
+    async def update(
+        self,
+        tick_context: TickContext,
+        scene_context: SceneContext,
+        engine_context: EngineContext,
+    ) -> None:
+        self.runs += 1
+
+
+class DebugCounter(Counter):
+    debug_only = True
+
+
+class PositionCounter(Counter):
+    primary_query = (Position,)
+
+
+def tick(
+    scheduler: ProcessorScheduler, engine_context: EngineContext
+) -> None:
+    asyncio.run(
+        scheduler.process_tick(
+            TickContext(1 / 60), scheduler.scene_context, engine_context
+        )
+    )
+
+
+def test_the_plan_follows_the_options(
+    engine_context: EngineContext,
+) -> None:
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    counter, debug_counter = Counter(), DebugCounter()
+    scheduler.add_processors([counter, debug_counter])
+    tick(scheduler, engine_context)
+    assert (counter.runs, debug_counter.runs) == (1, 0)
+
+    engine_context.options.debug = True
+    tick(scheduler, engine_context)
+    assert (counter.runs, debug_counter.runs) == (2, 1)
+
+    engine_context.options.debug = False
+    tick(scheduler, engine_context)
+    assert (counter.runs, debug_counter.runs) == (3, 1)
+
+
+def test_the_plan_follows_the_processors(
+    engine_context: EngineContext,
+) -> None:
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    first, second = Counter(), Counter()
+    scheduler.add_processor(first)
+    tick(scheduler, engine_context)
+    scheduler.add_processor(second)
+    tick(scheduler, engine_context)
+    assert (first.runs, second.runs) == (2, 1)
+
+    scheduler.remove_processor(first)
+    tick(scheduler, engine_context)
+    assert (first.runs, second.runs) == (2, 2)
+
+
+def test_processors_with_nothing_to_do_are_skipped(
+    engine_context: EngineContext,
+) -> None:
+    context = SceneContext()
+    scheduler = ProcessorScheduler(context, engine_context)
+    counter = PositionCounter()
+    scheduler.add_processor(counter)
+    tick(scheduler, engine_context)
+    assert counter.runs == 0
+
+    entity = context.spawn("entity", [Position()])
+    tick(scheduler, engine_context)
+    assert counter.runs == 1
+
+    # Commands recorded between ticks are applied before the tick starts.
+    context.commands.despawn(entity)
+    tick(scheduler, engine_context)
+    assert counter.runs == 1
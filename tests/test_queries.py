@@ -0,0 +1,109 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from justkeepswimming.ecs import Component, Maybe, SceneContext
+from justkeepswimming.ecs.query import QueryRow
+
+
+@dataclass(slots=True)
+class Position(Component):
+    x: float = 0.0
+
+
+@dataclass(slots=True)
+class Velocity(Component):
+    x: float = 0.0
+
+
+@dataclass(slots=True)
+class Frozen(Component):
+    pass
+
+
+def names(rows: Iterable[QueryRow]) -> list[str]:
+    return sorted(entity.name for entity, _ in rows)
+
+
+def test_query_sees_entities_added_after_it_was_built() -> None:
+    context = SceneContext()
+    assert list(context.query(Position, Velocity)) == []
+    entity = context.spawn("a", [Position(1.0), Velocity(2.0)])
+    context.spawn("b", [Position()])
+    rows = list(context.query(Position, Velocity))
+    assert rows == [
+        (
+            entity,
+            (
+                entity.get_component(Position),
+                entity.get_component(Velocity),
+            ),
+        )
+    ]
+
+
+def test_membership_follows_components_added_and_removed() -> None:
+    context = SceneContext()
+    entity = context.spawn("a", [Position()])
+    assert names(context.query(Position, Velocity)) == []
+
+    entity.add_component(Velocity())
+    assert names(context.query(Position, Velocity)) == ["a"]
+    assert names(context.query(Position)) == ["a"]
+
+    entity.remove_component(entity.get_component(Velocity))
+    assert names(context.query(Position, Velocity)) == []
+    assert names(context.query(Position)) == ["a"]
+
+
+def test_despawned_entities_leave_every_query() -> None:
+    context = SceneContext()
+    kept = context.spawn("kept", [Position(), Velocity()])
+    gone = context.spawn("gone", [Position(), Velocity()])
+    empty = context.create_entity("empty")
+    assert names(context.query(Position, Velocity)) == ["gone", "kept"]
+    assert names(context.query()) == ["empty", "gone", "kept"]
+
+    context.delete_entity(gone)
+    context.delete_entity(empty)
+    assert names(context.query(Position, Velocity)) == ["kept"]
+    assert names(context.query(Position)) == ["kept"]
+    assert names(context.query()) == ["kept"]
+    assert kept.alive
+
+
+def test_optional_and_excluded_terms_follow_changes() -> None:
+    context = SceneContext()
+    moving = context.spawn("moving", [Position(), Velocity(3.0)])
+    still = context.spawn("still", [Position()])
+
+    rows = dict(context.query(Position, Maybe(Velocity)))
+    assert rows[moving][1] is moving.get_component(Velocity)
+    assert rows[still][1] is None
+    assert names(context.query(Position, without=[Frozen])) == [
+        "moving",
+        "still",
+    ]
+
+    moving.add_component(Frozen())
+    still.add_component(Velocity())
+    rows = dict(context.query(Position, Maybe(Velocity)))
+    assert rows[still][1] is still.get_component(Velocity)
+    assert names(context.query(Position, without=[Frozen])) == ["still"]
+
+
+def test_components_keep_their_values_across_archetypes() -> None:
+    context = SceneContext()
+    entity = context.spawn("a", [Position(1.0)])
+    position = entity.get_component(Position)
+    entity.add_component(Velocity(2.0))
+    entity.add_component(Frozen())
+    entity.remove_component(entity.get_component(Velocity))
+
+    assert entity.get_component(Position) is position
+    assert position.x == 1.0
+    assert set(context.get_components(entity)) == {Position, Frozen}
+    assert context.query_count(Position) == 1
+    assert context.query_one(Position, Frozen) == (
+        entity,
+        (position, entity.get_component(Frozen)),
+    )
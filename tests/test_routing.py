@@ -0,0 +1,86 @@
+import asyncio
+from dataclasses import dataclass
+
+from justkeepswimming.ecs import Component, Entity, SceneContext
+from justkeepswimming.ecs.routing import ComponentSignalRouter
+from justkeepswimming.utilities.maid import Maid
+from justkeepswimming.utilities.signal import Signal, deferred_events
+
+
+@dataclass(slots=True)
+class Shape(Component):
+    pass
+
+
+@dataclass(slots=True)
+class Circle(Shape):
+    pass
+
+
+@dataclass(slots=True)
+class Colour(Component):
+    pass
+
+
+def test_routes_cover_subscribed_base_types() -> None:
+    router = ComponentSignalRouter(Signal[tuple[Entity, Component]]())
+    assert router.route(Circle) == ()
+    shapes = router.signal(Shape)
+    assert router.route(Circle) == (shapes,)
+    circles = router.signal(Circle)
+    assert router.signal(Circle) is circles
+    assert router.route(Circle) == (circles, shapes)
+    assert router.route(Shape) == (shapes,)
+    assert router.route(Colour) == ()
+
+
+def test_subscribers_only_hear_about_their_own_types() -> None:
+    context = SceneContext()
+    asyncio.run(deferred_events.flush())
+    maid = Maid()
+    heard: dict[str, list[str]] = {"shape": [], "circle": [], "all": []}
+
+    def listen(key: str, signal: Signal[tuple[Entity, Component]]) -> None:
+        def callback(event: tuple[Entity, Component]) -> None:
+            heard[key].append(type(event[1]).__name__)
+
+        maid.add(signal.connect(callback))
+
+    listen("shape", context.get_signal_for_component_addition(Shape, maid))
+    listen(
+        "circle", context.get_signal_for_component_addition(Circle, maid)
+    )
+    listen("all", context.on_component_added)
+    context.spawn("a", [Circle(), Colour()])
+    context.spawn("b", [Shape()])
+    asyncio.run(deferred_events.flush())
+    assert heard == {
+        "shape": ["Circle", "Shape"],
+        "circle": ["Circle"],
+        "all": ["Circle", "Colour", "Shape"],
+    }
+
+    maid.cleanup()
+    context.spawn("c", [Circle()])
+    asyncio.run(deferred_events.flush())
+    assert heard["shape"] == ["Circle", "Shape"]
+    assert heard["all"] == ["Circle", "Colour", "Shape"]
+
+
+def test_removals_are_routed_by_type() -> None:
+    context = SceneContext()
+    asyncio.run(deferred_events.flush())
+    maid = Maid()
+    removed: list[str] = []
+
+    def callback(event: tuple[Entity, Component]) -> None:
+        removed.append(event[0].name)
+
+    context.get_signal_for_component_removal(Shape, maid).connect(callback)
+    circle = context.spawn("circle", [Circle()])
+    coloured = context.spawn("coloured", [Colour()])
+    circle.remove_component(circle.get_component(Circle))
+    coloured.remove_component(coloured.get_component(Colour))
+    asyncio.run(deferred_events.flush())
+    assert removed == ["circle"]
+    maid.cleanup()
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+
+import pytest
+
+from justkeepswimming.datatypes.dag import CyclicalDependencyError
+from justkeepswimming.debug.benchmark import synthetic_processors
+from justkeepswimming.ecs import Component, Processor, SceneContext
+from justkeepswimming.ecs.scheduler import (
+    ProcessorScheduler,
+    SystemConflictException,
+    SystemDuplicateEntryException,
+)
+from justkeepswimming.utilities.context import EngineContext
+
+
+@dataclass(slots=True)
+class Position(Component):
+    x: float = 0.0
+
+
+@dataclass(slots=True)
+class Velocity(Component):
+    x: float = 0.0
+
+
+class Movement(Processor):
+    reads = frozenset({Velocity})
+    writes = frozenset({Position})
+
+
+class Steering(Processor):
+    writes = frozenset({Velocity})
+
+
+class Rendering(Processor):
+    reads = frozenset({Position})
+
+
+class Teleport(Processor):
+    writes = frozenset({Position})
+
+
+def dependencies(scheduler: ProcessorScheduler) -> set[tuple[str, str]]:
+    return {
+        (type(processor).__name__, type(dependency).__name__)
+        for processor, dependency in scheduler.dependencies()
+    }
+
+
+def layers(scheduler: ProcessorScheduler) -> list[set[str]]:
+    return [
+        {type(processor).__name__ for processor in layer}
+        for layer in scheduler.execution_order()
+    ]
+
+
+def test_reads_and_writes_order_processors(
+    engine_context: EngineContext,
+) -> None:
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    scheduler.add_processors([Rendering(), Movement(), Steering()])
+    assert dependencies(scheduler) == {
+        ("Movement", "Steering"),
+        ("Rendering", "Movement"),
+    }
+    assert layers(scheduler) == [{"Steering"}, {"Movement"}, {"Rendering"}]
+
+
+def test_processors_added_one_at_a_time_match_a_rebuild(
+    engine_context: EngineContext,
+) -> None:
+    processor_types = synthetic_processors(40, seed=7)
+    incremental = ProcessorScheduler(SceneContext(), engine_context)
+    for processor_type in processor_types[:10]:
+        incremental.add_processor(processor_type())
+    incremental.execution_order()
+    incremental.add_processors(
+        processor_type() for processor_type in processor_types[10:]
+    )
+
+    rebuilt = ProcessorScheduler(SceneContext(), engine_context)
+    processors = [processor_type() for processor_type in processor_types]
+    rebuilt.add_processors(processors)
+    # Removing a processor marks the graph for a full rebuild.
+    rebuilt.remove_processor(processors[0])
+    rebuilt.add_processor(processors[0])
+
+    assert dependencies(incremental) == dependencies(rebuilt)
+    assert layers(incremental) == layers(rebuilt)
+
+
+def test_conflicting_writes_need_to_be_allowed(
+    engine_context: EngineContext,
+) -> None:
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    scheduler.add_processor(Movement())
+    with pytest.raises(SystemConflictException):
+        scheduler.add_processor(Teleport())
+
+    class AlongsideTeleport(Teleport):
+        alongside = frozenset({Movement})
+
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    scheduler.add_processors([Movement(), AlongsideTeleport()])
+    assert layers(scheduler) == [{"Movement", "AlongsideTeleport"}]
+
+
+def test_contradicting_orders_are_cycles(
+    engine_context: EngineContext,
+) -> None:
+    class First(Processor):
+        pass
+
+    class Second(Processor):
+        before = frozenset({First})
+
+    First.before = frozenset({Second})
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    scheduler.add_processor(First())
+    with pytest.raises(CyclicalDependencyError):
+        scheduler.add_processor(Second())
+
+
+def test_processors_are_added_once(engine_context: EngineContext) -> None:
+    scheduler = ProcessorScheduler(SceneContext(), engine_context)
+    processor = Movement()
+    scheduler.add_processor(processor)
+    with pytest.raises(SystemDuplicateEntryException):
+        scheduler.add_processor(processor)
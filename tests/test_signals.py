@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from justkeepswimming.utilities.signal import Signal
+
+
+def test_callbacks_run_in_the_order_they_connected() -> None:
+    signal = Signal[int]()
+    calls: list[str] = []
+
+    def plain(value: int) -> None:
+        calls.append(f"plain {value}")
+
+    async def coroutine(value: int) -> None:
+        calls.append(f"coroutine {value}")
+
+    signal.connect(plain)
+    signal.connect(coroutine)
+    signal.connect(plain)
+    asyncio.run(signal.emit(1))
+    # Plain callbacks run as they are called, before any coroutine.
+    assert calls == ["plain 1", "plain 1", "coroutine 1"]
+
+
+def test_a_single_plain_callback_runs_without_the_event_loop() -> None:
+    signal = Signal[int]()
+    calls: list[int] = []
+    signal.connect(calls.append)
+    coroutine = signal.emit(1)
+    with pytest.raises(StopIteration):
+        coroutine.send(None)
+    assert calls == [1]
+
+
+def test_a_failing_callback_stops_the_emission() -> None:
+    signal = Signal[int]()
+    started: list[str] = []
+
+    async def coroutine(value: int) -> None:
+        started.append("coroutine")
+
+    def failing(value: int) -> None:
+        raise ValueError(value)
+
+    signal.connect(coroutine)
+    signal.connect(failing)
+    with pytest.raises(ValueError):
+        asyncio.run(signal.emit(1))
+    # The coroutine of the callback before it is closed, not left pending.
+    assert started == []
+
+
+def test_once_disconnects_after_the_first_emission() -> None:
+    signal = Signal[int]()
+    calls: list[int] = []
+    signal.once(calls.append)
+    asyncio.run(signal.emit(1))
+    asyncio.run(signal.emit(2))
+    assert calls == [1]
+    assert signal.connections == []
+
+
+def test_callbacks_may_disconnect_during_an_emission() -> None:
+    signal = Signal[int]()
+    calls: list[str] = []
+
+    def first(value: int) -> None:
+        calls.append("first")
+        connection.disconnect()
+
+    def second(value: int) -> None:
+        calls.append("second")
+
+    connection = signal.connect(first)
+    signal.connect(second)
+    asyncio.run(signal.emit(1))
+    asyncio.run(signal.emit(2))
+    assert calls == ["first", "second", "second"]
+
+
+def test_wait_returns_on_the_next_emission() -> None:
+    signal = Signal[int]()
+
+    async def run() -> None:
+        waiter = asyncio.create_task(signal.wait())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await signal.emit(1)
+        await waiter
+
+    asyncio.run(run())
+    assert signal.connections == []
@@ -0,0 +1,114 @@
+from dataclasses import astuple
+
+import pytest
+from pygame import Vector2
+
+from justkeepswimming.components.physics import (
+    LinearPhysicsComponent,
+    TransformComponent,
+)
+from justkeepswimming.ecs import SceneContext, StaleEntityException
+
+type SceneState = list[tuple[int, str, list[tuple[str, str]]]]
+
+
+def describe(context: SceneContext) -> SceneState:
+    return [
+        (
+            entity.id,
+            entity.name,
+            sorted(
+                (type(component).__name__, repr(astuple(component)))
+                for component in context.get_components(entity).values()
+            ),
+        )
+        for entity in sorted(context.entities.values(), key=lambda e: e.id)
+    ]
+
+
+def build_scene(columnar: bool) -> SceneContext:
+    context = SceneContext(columnar=columnar)
+    context.spawn_batch(
+        20,
+        lambda position: [
+            TransformComponent(
+                position=Vector2(position, -position), rotation=position
+            ),
+            LinearPhysicsComponent(velocity=Vector2(1, position)),
+        ],
+    )
+    context.spawn("still", [TransformComponent(rotation=5.0)])
+    return context
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_restore_brings_the_scene_back(columnar: bool) -> None:
+    context = build_scene(columnar)
+    before = describe(context)
+    snapshot = context.snapshot()
+    entities = dict(context.entities)
+
+    for _, (transform, physics) in context.query(
+        TransformComponent, LinearPhysicsComponent
+    ):
+        transform.position += physics.velocity
+        transform.rotation = 0.0
+        physics.velocity.x = 7.0
+    context.delete_entity(entities[3])
+    entities[5].remove_component(
+        entities[5].get_component(LinearPhysicsComponent)
+    )
+    context.spawn("new", [TransformComponent()])
+    assert describe(context) != before
+
+    context.restore(snapshot)
+    assert describe(context) == before
+    assert context.entities == entities
+    assert context.query_count(TransformComponent) == 21
+    assert (
+        context.query_count(TransformComponent, LinearPhysicsComponent)
+        == 20
+    )
+    assert sorted(
+        entity.name for entity, _ in context.query(TransformComponent)
+    ) == sorted(entity.name for entity in entities.values())
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_snapshots_can_be_restored_again(columnar: bool) -> None:
+    context = build_scene(columnar)
+    snapshot = context.snapshot()
+    before = describe(context)
+    for _ in range(3):
+        for _, (transform,) in context.query(TransformComponent):
+            transform.rotation += 1.0
+        context.restore(snapshot)
+        assert describe(context) == before
+
+
+def test_handles_created_after_the_snapshot_go_stale() -> None:
+    context = build_scene(False)
+    snapshot = context.snapshot()
+    new = context.spawn("new", [TransformComponent()])
+
+    context.restore(snapshot)
+    assert not new.alive
+    with pytest.raises(StaleEntityException):
+        new.get_component(TransformComponent)
+    # The index of the new entity is free to be handed out again.
+    recycled = context.create_entity("recycled")
+    assert recycled.id == new.id
+    assert recycled.alive and not new.alive
+
+
+def test_deleted_handles_come_back_to_life() -> None:
+    context = build_scene(False)
+    entity = next(iter(context.entities.values()))
+    transform = entity.get_component(TransformComponent)
+    snapshot = context.snapshot()
+
+    context.delete_entity(entity)
+    context.create_entity("recycled")
+    context.restore(snapshot)
+    assert entity.alive
+    assert entity.get_component(TransformComponent) is transform
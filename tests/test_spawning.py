@@ -0,0 +1,101 @@
+import asyncio
+from dataclasses import dataclass
+
+from justkeepswimming.ecs import Component, Entity, SceneContext
+from justkeepswimming.utilities.signal import deferred_events
+
+
+@dataclass(slots=True)
+class Position(Component):
+    x: float = 0.0
+
+
+@dataclass(slots=True)
+class Velocity(Component):
+    x: float = 0.0
+
+
+def test_spawn_batch_builds_every_entity_in_order() -> None:
+    context = SceneContext()
+    # Every query that exists before the batch is kept up to date.
+    assert context.query_count(Position) == 0
+    entities = context.spawn_batch(
+        5,
+        lambda position: (
+            [Position(position), Velocity()]
+            if position % 2
+            else [Position(position)]
+        ),
+        name="fish",
+    )
+    assert [entity.name for entity in entities] == [
+        f"fish_{position}" for position in range(5)
+    ]
+    assert [
+        entity.get_component(Position).x for entity in entities
+    ] == [0, 1, 2, 3, 4]
+    assert context.query_count(Position) == 5
+    assert sorted(
+        entity.name for entity, _ in context.query(Position, Velocity)
+    ) == ["fish_1", "fish_3"]
+    assert set(context.entities.values()) == set(entities)
+
+
+def test_spawn_many_matches_spawning_one_by_one() -> None:
+    specs = [
+        ("a", [Position(1.0)]),
+        ("b", [Position(2.0), Velocity(3.0)]),
+        ("c", []),
+    ]
+    batched = SceneContext()
+    batched.spawn_many(specs)
+    single = SceneContext()
+    for name, components in specs:
+        single.spawn(name, components)
+
+    def describe(context: SceneContext) -> list[tuple[int, str, list[str]]]:
+        return [
+            (
+                entity.id,
+                entity.name,
+                sorted(
+                    repr(component)
+                    for component in context.get_components(
+                        entity
+                    ).values()
+                ),
+            )
+            for entity in context.entities.values()
+        ]
+
+    assert describe(batched) == describe(single)
+    assert batched.query_count() == single.query_count() == 3
+
+
+def test_spawn_many_sends_every_event_in_order() -> None:
+    context = SceneContext()
+    asyncio.run(deferred_events.flush())
+    events: list[str] = []
+
+    def created(entity: Entity) -> None:
+        events.append(f"created {entity.name}")
+
+    def added(event: tuple[Entity, Component]) -> None:
+        entity, component = event
+        events.append(f"added {type(component).__name__} to {entity.name}")
+
+    context.on_entity_created.connect(created)
+    context.on_component_added.connect(added)
+    context.spawn_many(
+        [("a", [Position(), Velocity()]), ("b", [Position()])]
+    )
+    assert events == []
+
+    asyncio.run(deferred_events.flush())
+    assert events == [
+        "created a",
+        "added Position to a",
+        "added Velocity to a",
+        "created b",
+        "added Position to b",
+    ]